@@ -1,3 +1,13 @@
 from .wiki_api import WikiAPI, get_ongoing_events_async
+from .serialization import event_to_dict
+from .page_cache import PAGE_CACHE, PageCache
+from .snapshot import SnapshotStore
+from .refresh import RefreshScheduler
+from .snapshot_ipc import SnapshotPublisher, SnapshotSubscriber
+from .event_index import EventIndex
+from .ical import CalendarFeed
+from .timeline import ending_soonest, merge_timeline
+from .diagnosis import diagnose_wiki
+from .fixtures import FixtureWikiAPI, RecordingWikiAPI, load_fixture, save_fixture
 
-__all__ = ["WikiAPI", "get_ongoing_events_async"]
\ No newline at end of file
+__all__ = ["WikiAPI", "get_ongoing_events_async", "event_to_dict", "PageCache", "PAGE_CACHE", "SnapshotStore", "RefreshScheduler", "SnapshotPublisher", "SnapshotSubscriber", "EventIndex", "CalendarFeed", "merge_timeline", "ending_soonest", "FixtureWikiAPI", "RecordingWikiAPI", "load_fixture", "save_fixture", "diagnose_wiki"]
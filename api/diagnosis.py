@@ -0,0 +1,140 @@
+# api/diagnosis.py - Wiki category and parser diagnosis
+"""
+Quick health check of a game's wiki as the pipeline sees it.
+
+:func:`diagnose_wiki` counts the members of several candidate categories
+concurrently, fetches an evenly spaced sample of pages from the chosen
+category — those not already in the page cache, in a single batched
+``prop=revisions`` request — and runs them
+through :meth:`WikiAPI.parse_event`. Pages that do not parse are grouped
+by the *shape* of their date fields (digits → ``9``, words → ``A``), so
+a new date format on the wiki shows up as one line with a count.
+"""
+from __future__ import annotations
+
+import asyncio
+import re
+import time
+from collections import Counter
+from typing import Dict, List, Optional
+
+import aiohttp
+
+from tracing import span
+
+from .wiki_api import WikiAPI
+
+# Category names event pages are commonly filed under on Fandom wikis.
+CANDIDATE_CATEGORIES = ("Events", "In-Game_Events", "Event", "Current_Events", "Limited_Events")
+
+# MediaWiki accepts at most 50 titles per prop=revisions request.
+MAX_SAMPLE = 50
+
+# Same field patterns as WikiAPI.parse_event_dates: the first match wins.
+_TIME_START = re.compile(r"\|\s*time_start\s*=\s*([^\n|]+)")
+_TIME_END = re.compile(r"\|\s*time_end\s*=\s*([^\n|]+)")
+
+
+def date_shape(value: str) -> str:
+    """Reduce a raw date string to its format, e.g. ``"May 21, 2025"`` → ``"A 99, 9999"``."""
+    value = value.strip()
+    if not value:
+        return "(empty)"
+    return re.sub(r"[^\W\d_]+", "A", re.sub(r"\d", "9", value))
+
+
+def _unparsed_reason(wiki: WikiAPI, page: Dict) -> str:
+    content = page.get("content") or ""
+    if not content:
+        return "(no content)"
+    start = _TIME_START.search(content)
+    if not start:
+        return "(no time_start)"
+    if wiki.parse_datetime_from_wiki_format(start.group(1).strip()) is None:
+        return f"time_start: {date_shape(start.group(1))}"
+    end = _TIME_END.search(content)
+    return f"time_end: {date_shape(end.group(1) if end else '')}"
+
+
+def _even_sample(members: List[Dict], size: int) -> List[Dict]:
+    if len(members) <= size:
+        return list(members)
+    step = len(members) / size
+    return [members[int(index * step)] for index in range(size)]
+
+
+async def diagnose_wiki(
+    api_url: str,
+    category: str,
+    game: str = "unknown",
+    candidates: Optional[List[str]] = None,
+    sample_size: int = MAX_SAMPLE,
+) -> Dict:
+    """Diagnose category layout and parse coverage for one wiki.
+
+    Args:
+        api_url (str): The wiki's ``api.php`` URL.
+        category (str): The configured event category; sampled when it
+            has members, otherwise the largest candidate is used.
+        game (str): ``GAME_CONFIG`` key for stage metrics.
+        candidates (Optional[List[str]]): Extra categories to size
+            (default :data:`CANDIDATE_CATEGORIES`).
+        sample_size (int): Pages to fetch and parse, at most :data:`MAX_SAMPLE`.
+
+    Returns:
+        Dict: ``"categories"`` (name → member count, or the exception
+        name), ``"sampled_category"``, ``"sampled"``, ``"parsed"``,
+        ``"unparsed"`` (reason → ``{"count", "example"}``) and
+        ``"timings"`` (``"enumerate"``, ``"fetch"``, ``"parse"`` in seconds).
+    """
+    wiki = WikiAPI(api_url, category, game=game)
+    names = [category] + [name for name in (candidates or CANDIDATE_CATEGORIES) if name != category]
+    timings: Dict[str, float] = {}
+    timeout = aiohttp.ClientTimeout(total=30)
+
+    with span("wiki.diagnose", game=game):
+        async with aiohttp.ClientSession(timeout=timeout) as session:
+            start = time.perf_counter()
+            results = await asyncio.gather(
+                *(wiki._fetch_all_category_members(session, name) for name in names),
+                return_exceptions=True,
+            )
+            timings["enumerate"] = time.perf_counter() - start
+            members_by_category = {name: result for name, result in zip(names, results) if isinstance(result, list)}
+            categories = {
+                name: len(result) if isinstance(result, list) else type(result).__name__
+                for name, result in zip(names, results)
+            }
+
+            sampled_category = category if members_by_category.get(category) else max(
+                members_by_category, key=lambda name: len(members_by_category[name]), default=None
+            )
+            sample = _even_sample(members_by_category.get(sampled_category, []), min(sample_size, MAX_SAMPLE))
+
+            start = time.perf_counter()
+            pages = await wiki._fetch_contents(session, sample, batch_size=MAX_SAMPLE)
+            timings["fetch"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    parsed = 0
+    unparsed: Dict[str, Dict] = {}
+    reasons: Counter = Counter()
+    for page in pages:
+        if wiki.parse_event(page) is not None:
+            parsed += 1
+            continue
+        reason = _unparsed_reason(wiki, page)
+        reasons[reason] += 1
+        unparsed.setdefault(reason, {"example": page["title"]})
+    timings["parse"] = time.perf_counter() - start
+    for reason, count in reasons.items():
+        unparsed[reason]["count"] = count
+
+    return {
+        "categories": categories,
+        "sampled_category": sampled_category,
+        "sampled": len(pages),
+        "parsed": parsed,
+        "unparsed": dict(sorted(unparsed.items(), key=lambda item: -item[1]["count"])),
+        "timings": timings,
+    }
@@ -0,0 +1,141 @@
+"""
+In-memory prefix index over event titles for autocomplete.
+
+Every word of an event title is a *term*. Terms are kept in one sorted list of ``(term, game, key)``
+tuples, so a prefix lookup is a :func:`bisect.bisect_left` followed by
+a short forward scan — autocomplete never touches the wiki.
+
+The index is kept current by registering :meth:`EventIndex.on_snapshot`
+as a :class:`api.snapshot.SnapshotStore` listener. Only the events of a
+game that were added, removed or changed between two snapshots are
+re-indexed, so a refresh with a single new event costs a handful of
+insertions rather than a full rebuild.
+"""
+import re
+from bisect import bisect_left, insort
+from typing import Dict, List, Optional, Set, Tuple
+
+from .snapshot import event_key
+
+_WORD_RE = re.compile(r"\w+")
+
+# (game, event_key) identifying one indexed event.
+EntryId = Tuple[str, str]
+
+
+def normalize(text: str) -> str:
+    """Lower-case ``text`` and collapse punctuation and whitespace to single spaces."""
+    return " ".join(_WORD_RE.findall(text.lower()))
+
+
+def _terms(title: str) -> Set[str]:
+    return set(normalize(title).split())
+
+
+class EventIndex:
+    """Sorted-term index mapping title prefixes to events across games."""
+
+    def __init__(self):
+        self._terms: List[Tuple[str, str, str]] = []
+        self._events: Dict[EntryId, Dict] = {}
+        self._event_terms: Dict[EntryId, Set[str]] = {}
+        self._by_game: Dict[str, Set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def get(self, game: str, key: str) -> Optional[Dict]:
+        """Return the indexed event ``key`` of ``game``, or ``None``."""
+        return self._events.get((game, key))
+
+    def _add(self, game: str, key: str, event: Dict) -> None:
+        terms = _terms(event["title"])
+        self._events[(game, key)] = event
+        self._event_terms[(game, key)] = terms
+        self._by_game.setdefault(game, set()).add(key)
+        for term in terms:
+            insort(self._terms, (term, game, key))
+
+    def _remove(self, game: str, key: str) -> None:
+        for term in self._event_terms.pop((game, key), ()):
+            i = bisect_left(self._terms, (term, game, key))
+            if i < len(self._terms) and self._terms[i] == (term, game, key):
+                del self._terms[i]
+        self._events.pop((game, key), None)
+        self._by_game.get(game, set()).discard(key)
+
+    def update_game(self, game: str, events: List[Dict]) -> None:
+        """Make the index reflect ``events`` for ``game``, touching only what changed.
+
+        Args:
+            game (str): ``GAME_CONFIG`` key.
+            events (List[Dict]): The game's complete current event list.
+        """
+        incoming = {event_key(e): e for e in events}
+        current = self._by_game.get(game, set())
+
+        for key in current - incoming.keys():
+            self._remove(game, key)
+        for key, event in incoming.items():
+            existing = self._events.get((game, key))
+            if existing is None:
+                self._add(game, key, event)
+            elif existing["title"] != event["title"]:
+                self._remove(game, key)
+                self._add(game, key, event)
+            else:
+                # Same terms; just point at the newer event dict (dates may have changed).
+                self._events[(game, key)] = event
+
+    def on_snapshot(self, game: str, previous: Optional[Dict], snapshot: Dict) -> None:
+        """:class:`SnapshotStore` listener keeping the index in sync."""
+        self.update_game(game, snapshot["events"])
+
+    def search(self, query: str, limit: int = 25, game: Optional[str] = None) -> List[Tuple[str, str, Dict]]:
+        """Return events whose title words start with every word of ``query``.
+
+        Titles that begin with the whole query rank first, then the rest
+        alphabetically. An empty query returns the first ``limit`` events
+        alphabetically.
+
+        Args:
+            query (str): Text typed so far.
+            limit (int): Maximum number of results (default ``25``,
+                Discord's autocomplete limit).
+            game (Optional[str]): Restrict results to one game.
+
+        Returns:
+            List[Tuple[str, str, Dict]]: ``(game, key, event)`` tuples.
+        """
+        words = normalize(query).split()
+        if not words:
+            ids = sorted(self._events, key=lambda i: normalize(self._events[i]["title"]))
+            if game is not None:
+                ids = [i for i in ids if i[0] == game]
+            return [(g, k, self._events[(g, k)]) for g, k in ids[:limit]]
+
+        # Scan the longest word's prefix range; it is usually the most selective.
+        anchor = max(words, key=len)
+        rest = list(words)
+        rest.remove(anchor)
+        candidates: Set[EntryId] = set()
+        for i in range(bisect_left(self._terms, (anchor,)), len(self._terms)):
+            term, term_game, key = self._terms[i]
+            if not term.startswith(anchor):
+                break
+            if game is None or term_game == game:
+                candidates.add((term_game, key))
+
+        matches = [
+            entry for entry in candidates
+            if all(any(t.startswith(w) for t in self._event_terms[entry]) for w in rest)
+        ]
+
+        phrase = " ".join(words)
+
+        def rank(entry: EntryId) -> Tuple[bool, str]:
+            title = normalize(self._events[entry]["title"])
+            return (not title.startswith(phrase), title)
+
+        matches.sort(key=rank)
+        return [(g, k, self._events[(g, k)]) for g, k in matches[:limit]]
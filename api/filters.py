@@ -0,0 +1,153 @@
+"""
+Status checks and filters for parsed event dicts.
+
+All helpers accept naive datetimes (assumed UTC) or timezone-aware ones,
+matching the conventions of :mod:`api.wiki_api`. They never touch the
+network, so they can be re-run against a cached snapshot whenever the
+current time moves on.
+
+Filters return *copies* of the event dicts with ``"time_remaining"``
+recomputed for ``now``, since the value stored at fetch time goes stale.
+"""
+from datetime import datetime, time, timedelta, timezone
+from typing import Dict, List, Optional
+
+# Sentinel end year used by WikiAPI.parse_event_dates for events with no end.
+PERMANENT_YEAR = 2030
+
+
+def _aware(value: datetime) -> datetime:
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
+
+
+def to_utc(value: datetime) -> datetime:
+    """Return ``value`` as an aware UTC datetime, treating naive values as UTC."""
+    return _aware(value).astimezone(timezone.utc)
+
+
+def to_timestamp(value: datetime) -> float:
+    """Return ``value`` as a UNIX timestamp, treating naive values as UTC."""
+    return _aware(value).timestamp()
+
+
+def is_permanent(event: Dict) -> bool:
+    """Return ``True`` if the event uses the permanent end-date sentinel."""
+    return event["end_date"].year == PERMANENT_YEAR
+
+
+def is_ongoing(start_date: datetime, end_date: datetime, today: datetime) -> bool:
+    """Return ``True`` if ``today`` falls within the event's date range.
+
+    The comparison is done on calendar dates (UTC), so an event counts as
+    ongoing for the whole of its first and last day.
+    """
+    return _aware(start_date).date() <= _aware(today).date() <= _aware(end_date).date()
+
+
+def is_upcoming(start_date: datetime, today: datetime) -> bool:
+    """Return ``True`` if the event starts on a later calendar date than ``today``."""
+    return _aware(start_date).date() > _aware(today).date()
+
+
+def has_ended(end_date: datetime, today: datetime) -> bool:
+    """Return ``True`` if the event's last day is before ``today``."""
+    return _aware(end_date).date() < _aware(today).date()
+
+
+def status_boundaries(event: Dict) -> List[datetime]:
+    """Return the instants (aware, UTC) at which the event's status changes.
+
+    Mirrors the calendar-date semantics of :func:`is_ongoing`,
+    :func:`is_upcoming` and :func:`has_ended`: the event turns ongoing at
+    midnight UTC of its start date and ends at midnight after its end
+    date. Permanent events never end.
+    """
+    start = _aware(event["start_date"])
+    boundaries = [datetime.combine(start.date(), time.min, timezone.utc)]
+    if not is_permanent(event):
+        end = _aware(event["end_date"])
+        boundaries.append(datetime.combine(end.date() + timedelta(days=1), time.min, timezone.utc))
+    return boundaries
+
+
+def next_status_change(events: List[Dict], now: datetime) -> Optional[datetime]:
+    """Return the earliest :func:`status_boundaries` instant after ``now``, or ``None``."""
+    now = _aware(now)
+    upcoming = [b for event in events for b in status_boundaries(event) if b > now]
+    return min(upcoming, default=None)
+
+
+def format_time_remaining(end_date: datetime, now: Optional[datetime] = None) -> str:
+    """Calculate human-readable time remaining until an event ends.
+
+    Args:
+        end_date (datetime): The event's end datetime.
+        now (Optional[datetime]): Reference time. Defaults to the current
+            UTC time.
+
+    Returns:
+        str: ``"Permanent"``, ``"Ended"``, ``"Xd Yh"``, ``"Xh Ym"`` or
+        ``"Xm"``; see :meth:`WikiAPI.get_time_remaining`.
+    """
+    if end_date.year == PERMANENT_YEAR:
+        return "Permanent"
+
+    if now is None:
+        now = datetime.now(timezone.utc)
+
+    time_difference = _aware(end_date) - _aware(now)
+
+    if time_difference.total_seconds() <= 0:
+        return "Ended"
+
+    days = time_difference.days
+    hours = time_difference.seconds // 3600
+
+    if days > 0:
+        return f"{days}d {hours}h"
+    elif hours > 0:
+        minutes = (time_difference.seconds % 3600) // 60
+        return f"{hours}h {minutes}m"
+    else:
+        minutes = time_difference.seconds // 60
+        return f"{minutes}m"
+
+
+def event_sort_key(event: Dict) -> datetime:
+    """Sort key ordering events by end date with permanent events last."""
+    return event["end_date"] if not is_permanent(event) else datetime.max
+
+
+def _refreshed(events: List[Dict], now: datetime) -> List[Dict]:
+    return [{**e, "time_remaining": format_time_remaining(e["end_date"], now)} for e in events]
+
+
+def filter_ongoing(events: List[Dict], now: Optional[datetime] = None) -> List[Dict]:
+    """Return the events that are ongoing at ``now`` (defaults to current UTC time)."""
+    now = now or datetime.now(timezone.utc)
+    return _refreshed([e for e in events if is_ongoing(e["start_date"], e["end_date"], now)], now)
+
+
+def filter_upcoming(events: List[Dict], now: Optional[datetime] = None) -> List[Dict]:
+    """Return the events that have not started yet, ordered by start date."""
+    now = now or datetime.now(timezone.utc)
+    upcoming = [e for e in events if is_upcoming(e["start_date"], now)]
+    upcoming.sort(key=lambda e: e["start_date"])
+    return _refreshed(upcoming, now)
+
+
+def filter_ending_soon(
+    events: List[Dict],
+    within: timedelta = timedelta(hours=24),
+    now: Optional[datetime] = None,
+) -> List[Dict]:
+    """Return ongoing, non-permanent events that end within ``within`` of ``now``."""
+    now = now or datetime.now(timezone.utc)
+    now_aware = _aware(now)
+    ending = [
+        e for e in events
+        if not is_permanent(e)
+        and is_ongoing(e["start_date"], e["end_date"], now)
+        and now_aware < _aware(e["end_date"]) <= now_aware + within
+    ]
+    return _refreshed(ending, now)
@@ -0,0 +1,211 @@
+# api/ical.py - iCalendar (.ics) event feeds
+"""
+iCalendar (RFC 5545) feeds of parsed events, per game and combined.
+
+Each event becomes one ``VEVENT`` whose ``UID`` is derived from the
+MediaWiki page ID, so calendar clients update an event in place when its
+dates change instead of adding a duplicate. Permanent events have no end
+and are left out.
+
+:class:`CalendarFeed` caches every serialized ``VEVENT`` block together
+with the event fields it was built from. When a snapshot changes, only
+events whose fields differ are serialized again; the rest of the feed is
+reassembled from cached blocks. Each feed body is cached with a strong
+ETag, so a calendar client polling an unchanged feed costs a dict lookup.
+"""
+import hashlib
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import quote, urlparse
+
+from metrics import REGISTRY
+
+from .filters import is_permanent, to_utc
+from .snapshot import event_key
+
+PRODID = "-//Gacha Reminder//Event Calendar//EN"
+
+# RFC 5545 3.1: content lines longer than this many octets are folded.
+LINE_LIMIT = 75
+
+VEVENTS_SERIALIZED = REGISTRY.counter(
+    "gacha_calendar_vevents_serialized_total",
+    "VEVENT blocks serialized for the iCalendar feeds, by game.",
+    ("game",),
+)
+
+
+def _escape(text: str) -> str:
+    """Escape a TEXT value (RFC 5545 3.3.11)."""
+    return (
+        text.replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,")
+        .replace("\r\n", "\\n").replace("\n", "\\n")
+    )
+
+
+def _fold(line: str) -> str:
+    """Fold ``line`` into CRLF-terminated chunks of at most :data:`LINE_LIMIT` octets."""
+    encoded = line.encode("utf-8")
+    if len(encoded) <= LINE_LIMIT:
+        return line + "\r\n"
+    chunks, start, limit = [], 0, LINE_LIMIT
+    while start < len(encoded):
+        end = min(start + limit, len(encoded))
+        # Never split a multi-byte character: back off past continuation bytes.
+        while end < len(encoded) and encoded[end] & 0xC0 == 0x80:
+            end -= 1
+        chunks.append(encoded[start:end].decode("utf-8"))
+        start, limit = end, LINE_LIMIT - 1  # continuation lines start with a space
+    return "\r\n ".join(chunks) + "\r\n"
+
+
+def _utc(value: datetime) -> str:
+    return to_utc(value).strftime("%Y%m%dT%H%M%SZ")
+
+
+def _fingerprint(event: Dict) -> Tuple:
+    """The event fields a VEVENT is built from; a cached block is reused while they match."""
+    return (event["title"], event["start_date"], event["end_date"], event.get("page_title"), event.get("date_range_str"))
+
+
+def event_uid(event: Dict, api_url: str) -> str:
+    """Return the stable ``UID`` of ``event``: its page ID at the wiki's host name.
+
+    Events without a page ID fall back to a hash of their page title.
+    """
+    host = urlparse(api_url).hostname or "wiki"
+    if event.get("pageid") is not None:
+        return f"{event['pageid']}@{host}"
+    return f"{hashlib.sha1(event_key(event).encode('utf-8')).hexdigest()}@{host}"
+
+
+def event_to_vevent(event: Dict, game_config: Dict, dtstamp: datetime) -> str:
+    """Serialize one event as a ``VEVENT`` block with CRLF line endings.
+
+    Args:
+        event (Dict): Parsed event dict; must not be permanent.
+        game_config (Dict): The game's ``GAME_CONFIG`` entry.
+        dtstamp (datetime): Value for ``DTSTAMP``, i.e. when this version
+            of the event was taken from the wiki.
+
+    Returns:
+        str: The folded ``BEGIN:VEVENT`` … ``END:VEVENT`` lines.
+    """
+    lines = [
+        "BEGIN:VEVENT",
+        f"UID:{event_uid(event, game_config['api_url'])}",
+        f"DTSTAMP:{_utc(dtstamp)}",
+        f"DTSTART:{_utc(event['start_date'])}",
+        f"DTEND:{_utc(event['end_date'])}",
+        f"SUMMARY:{_escape(event['title'])}",
+        f"CATEGORIES:{_escape(game_config['display_name'])}",
+    ]
+    if event.get("date_range_str"):
+        lines.append(f"DESCRIPTION:{_escape(game_config['display_name'] + ' event, ' + event['date_range_str'])}")
+    if event.get("page_title"):
+        base = game_config["api_url"].rsplit("/", 1)[0]
+        lines.append(f"URL:{base}/wiki/{quote(event['page_title'].replace(' ', '_'))}")
+    lines.append("END:VEVENT")
+    return "".join(_fold(line) for line in lines)
+
+
+def _calendar(name: str, blocks: Iterable[str]) -> bytes:
+    header = "".join(_fold(line) for line in (
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        f"PRODID:{PRODID}",
+        "CALSCALE:GREGORIAN",
+        "METHOD:PUBLISH",
+        f"X-WR-CALNAME:{_escape(name)}",
+    ))
+    return (header + "".join(blocks) + "END:VCALENDAR\r\n").encode("utf-8")
+
+
+def _etag(body: bytes) -> str:
+    return f'"{hashlib.sha1(body).hexdigest()}"'
+
+
+class CalendarFeed:
+    """Incrementally maintained iCalendar feeds for a set of games.
+
+    Attributes:
+        game_configs (Dict[str, Dict]): ``GAME_CONFIG``-shaped mapping.
+        name (str): Calendar name shown by clients; per-game feeds append
+            the game's display name.
+    """
+
+    def __init__(self, game_configs: Dict[str, Dict], name: str = "Gacha Reminder"):
+        self.game_configs = game_configs
+        self.name = name
+        # game -> event key -> (fingerprint, VEVENT block), in feed order.
+        self._vevents: Dict[str, Dict[str, Tuple[Tuple, str]]] = {}
+        self._sources: Dict[str, str] = {}
+        self._feeds: Dict[str, Tuple[bytes, str]] = {}
+        self._combined: Dict[Tuple[str, ...], Tuple[Tuple, bytes, str]] = {}
+
+    def update_game(self, game: str, events: List[Dict], dtstamp: Optional[datetime] = None) -> int:
+        """Make ``game``'s feed reflect ``events``, serializing only changed events.
+
+        Args:
+            game (str): ``GAME_CONFIG`` key.
+            events (List[Dict]): The game's complete current event list.
+            dtstamp (Optional[datetime]): ``DTSTAMP`` for newly serialized
+                events. Defaults to now in UTC.
+
+        Returns:
+            int: Number of ``VEVENT`` blocks that had to be serialized.
+        """
+        dtstamp = dtstamp or datetime.now(timezone.utc)
+        cached = self._vevents.get(game, {})
+        current: Dict[str, Tuple[Tuple, str]] = {}
+        serialized = 0
+        for event in events:
+            if is_permanent(event):
+                continue
+            key, fingerprint = event_key(event), _fingerprint(event)
+            entry = cached.get(key)
+            if entry is None or entry[0] != fingerprint:
+                entry = (fingerprint, event_to_vevent(event, self.game_configs[game], dtstamp))
+                serialized += 1
+            current[key] = entry
+        self._vevents[game] = current
+        body = _calendar(f"{self.name} – {self.game_configs[game]['display_name']}", (block for _, block in current.values()))
+        self._feeds[game] = (body, _etag(body))
+        if serialized:
+            VEVENTS_SERIALIZED.inc(serialized, game=game)
+        return serialized
+
+    def sync(self, snapshot: Dict) -> None:
+        """Bring a game's feed up to date with a :class:`SnapshotStore` snapshot.
+
+        Does nothing when the snapshot's ETag has already been applied, so
+        it is cheap to call on every request.
+        """
+        game = snapshot["game"]
+        if self._sources.get(game) != snapshot["etag"]:
+            self.update_game(game, snapshot["events"], snapshot["fetched_at"])
+            self._sources[game] = snapshot["etag"]
+
+    def on_snapshot(self, game: str, previous: Optional[Dict], snapshot: Dict) -> None:
+        """:class:`SnapshotStore` listener keeping the feeds in sync."""
+        self.sync(snapshot)
+
+    def feed(self, game: str) -> Tuple[bytes, str]:
+        """Return ``game``'s feed body and its quoted ETag (empty until first updated)."""
+        if game not in self._feeds:
+            self.update_game(game, [])
+        return self._feeds[game]
+
+    def combined(self, games: Optional[Iterable[str]] = None) -> Tuple[bytes, str]:
+        """Return one feed holding the events of ``games`` (default: all) and its quoted ETag.
+
+        The body is reassembled from cached blocks only when one of the
+        games' feeds changed since the last call.
+        """
+        games = tuple(games or self.game_configs)
+        state = tuple(self.feed(game)[1] for game in games)
+        cached = self._combined.get(games)
+        if cached is None or cached[0] != state:
+            body = _calendar(self.name, (block for game in games for _, block in self._vevents[game].values()))
+            cached = self._combined[games] = (state, body, _etag(body))
+        return cached[1], cached[2]
@@ -0,0 +1,140 @@
+# api/page_cache.py - Byte-budgeted LRU of page wikitext
+"""
+Process-wide cache of page wikitext keyed by ``(api_url, title, revid)``.
+
+A page's revision ID changes with every edit, so a cached entry is never
+stale: category enumeration returns each member's ``lastrevid`` and only
+pages whose current revision is not cached are fetched. Holding one
+revision per page, an edit replaces the old entry immediately.
+
+Entries are evicted least-recently-used first once their total size
+exceeds :attr:`PageCache.max_bytes`. Sizes are measured with
+:func:`sys.getsizeof`, i.e. the memory the strings actually occupy.
+
+The cache is shared by :class:`~api.wiki_api.WikiAPI` instances running
+on different event loops (``/profile_pipeline`` profiles on a worker
+thread), so every operation holds a lock.
+"""
+import sys
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from metrics import REGISTRY
+
+# Default memory budget in bytes.
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+PAGE_CACHE_LOOKUPS = REGISTRY.counter(
+    "gacha_page_cache_lookups_total",
+    "Page content cache lookups by result (hit or miss).",
+    ("result",),
+)
+
+CacheKey = Tuple[str, str, int]
+
+
+class PageCache:
+    """LRU of page wikitext that evicts by total size rather than entry count.
+
+    Attributes:
+        hits (int): Lookups answered from the cache.
+        misses (int): Lookups that required a fetch.
+        evictions (int): Entries dropped to stay within the budget.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        """Initialize an empty cache.
+
+        Args:
+            max_bytes (int): Memory budget in bytes (default
+                :data:`DEFAULT_MAX_BYTES`). ``0`` disables caching.
+        """
+        self._max_bytes = max_bytes
+        self._entries: "OrderedDict[CacheKey, Tuple[str, int]]" = OrderedDict()
+        self._revisions: Dict[Tuple[str, str], int] = {}
+        self._lock = threading.Lock()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def max_bytes(self) -> int:
+        """Memory budget in bytes; lowering it evicts immediately."""
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, value: int) -> None:
+        with self._lock:
+            self._max_bytes = value
+            self._evict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, api_url: str, title: str, revid: Optional[int]) -> Optional[str]:
+        """Return the cached wikitext of ``title`` at ``revid``, or ``None``."""
+        with self._lock:
+            entry = self._entries.get((api_url, title, revid)) if revid else None
+            if entry is None:
+                self.misses += 1
+                PAGE_CACHE_LOOKUPS.inc(result="miss")
+                return None
+            self._entries.move_to_end((api_url, title, revid))
+            self.hits += 1
+        PAGE_CACHE_LOOKUPS.inc(result="hit")
+        return entry[0]
+
+    def put(self, api_url: str, title: str, revid: Optional[int], content: str) -> None:
+        """Cache ``content`` as ``title`` at ``revid``, replacing older revisions of the page.
+
+        Pages without a revision ID and entries larger than the whole
+        budget are not cached.
+        """
+        if not revid:
+            return
+        size = sys.getsizeof(content) + sys.getsizeof(title)
+        with self._lock:
+            previous = self._revisions.get((api_url, title))
+            if previous is not None:
+                self._drop((api_url, title, previous))
+            if size > self._max_bytes:
+                return
+            self._entries[(api_url, title, revid)] = (content, size)
+            self._revisions[(api_url, title)] = revid
+            self.bytes += size
+            self._evict()
+
+    def clear(self) -> None:
+        """Drop every entry; the hit and miss counts are kept."""
+        with self._lock:
+            self._entries.clear()
+            self._revisions.clear()
+            self.bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Return ``entries``, ``bytes``, ``max_bytes``, ``hits``, ``misses`` and ``evictions``."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self.bytes,
+                "max_bytes": self._max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def _drop(self, key: CacheKey) -> None:
+        _, size = self._entries.pop(key)
+        del self._revisions[key[:2]]
+        self.bytes -= size
+
+    def _evict(self) -> None:
+        while self.bytes > self._max_bytes and self._entries:
+            self._drop(next(iter(self._entries)))
+            self.evictions += 1
+
+
+# Shared by every WikiAPI in the process; main.py applies PAGE_CACHE_MAX_MB.
+PAGE_CACHE = PageCache()
@@ -0,0 +1,174 @@
+# api/probe.py - Repeated latency probes against wiki hosts
+"""
+Latency probes for wiki ``api.php`` endpoints.
+
+Each host is probed ``count`` times in two modes:
+
+* **cold** – a fresh session and connector per request with the DNS
+  cache disabled, so every sample pays DNS, TCP, TLS and the request;
+* **pooled** – one session whose keep-alive connection is warmed up
+  once and then reused, i.e. what the pipeline sees after its first
+  batch.
+
+Phases are measured with :class:`aiohttp.TraceConfig` hooks. aiohttp
+reports TCP and TLS set-up together as one "connection create" phase,
+so cold samples also time a bare TCP connect to the same address and
+the remainder is attributed to TLS.
+
+Phase keys: ``dns``, ``tcp``, ``tls``, ``first_byte`` (request headers
+sent → response headers received) and ``total``; all in seconds, ``None``
+when the phase did not happen (e.g. no DNS lookup on a reused connection).
+"""
+from __future__ import annotations
+
+import asyncio
+import socket
+import time
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit
+
+import aiohttp
+
+PHASES = ("dns", "tcp", "tls", "first_byte", "total")
+
+SITEINFO_PARAMS = {"action": "query", "format": "json", "meta": "siteinfo"}
+
+
+def _mark(name: str):
+    async def hook(session, context, params) -> None:
+        marks = context.trace_request_ctx
+        if isinstance(marks, dict):
+            marks.setdefault(name, time.perf_counter())
+    return hook
+
+
+def _trace_config() -> aiohttp.TraceConfig:
+    trace = aiohttp.TraceConfig()
+    trace.on_dns_resolvehost_start.append(_mark("dns_start"))
+    trace.on_dns_resolvehost_end.append(_mark("dns_end"))
+    trace.on_connection_create_start.append(_mark("connect_start"))
+    trace.on_connection_create_end.append(_mark("connect_end"))
+    trace.on_request_headers_sent.append(_mark("headers_sent"))
+    trace.on_request_end.append(_mark("response_headers"))
+    return trace
+
+
+def _between(marks: Dict[str, float], start: str, end: str) -> Optional[float]:
+    if start in marks and end in marks:
+        return max(0.0, marks[end] - marks[start])
+    return None
+
+
+async def _tcp_connect_time(url: str, timeout: float) -> Optional[float]:
+    parts = urlsplit(url)
+    port = parts.port or (443 if parts.scheme == "https" else 80)
+    loop = asyncio.get_running_loop()
+    infos = await loop.getaddrinfo(parts.hostname, port, type=socket.SOCK_STREAM)
+    start = time.perf_counter()
+    _, writer = await asyncio.wait_for(asyncio.open_connection(infos[0][4][0], port), timeout)
+    elapsed = time.perf_counter() - start
+    writer.close()
+    await writer.wait_closed()
+    return elapsed
+
+
+async def _request(session: aiohttp.ClientSession, url: str, params: Dict) -> Dict[str, float]:
+    marks: Dict[str, float] = {"start": time.perf_counter()}
+    async with session.get(url, params=params, trace_request_ctx=marks) as response:
+        await response.read()
+        response.raise_for_status()
+    marks["end"] = time.perf_counter()
+    return marks
+
+
+def _phases(marks: Dict[str, float], tcp: Optional[float], https: bool) -> Dict[str, Optional[float]]:
+    dns = _between(marks, "dns_start", "dns_end")
+    connect = _between(marks, "connect_start", "connect_end")
+    if connect is not None and dns is not None:
+        connect = max(0.0, connect - dns)  # connection create includes the lookup
+    if connect is None:
+        tcp = tls = None
+    elif not https:
+        tcp, tls = connect, None
+    elif tcp is None:
+        tls = None
+    else:
+        tcp = min(tcp, connect)
+        tls = connect - tcp
+    return {
+        "dns": dns,
+        "tcp": tcp,
+        "tls": tls,
+        "first_byte": _between(marks, "headers_sent", "response_headers"),
+        "total": _between(marks, "start", "end"),
+    }
+
+
+async def probe_host(url: str, count: int = 5, params: Optional[Dict] = None, timeout: float = 10.0) -> Dict:
+    """Probe one ``api.php`` endpoint ``count`` times cold and ``count`` times pooled.
+
+    Args:
+        url (str): ``api.php`` URL.
+        count (int): Samples per mode (default ``5``).
+        params (Optional[Dict]): Query parameters (default: a ``siteinfo`` query).
+        timeout (float): Per-request timeout in seconds (default ``10``).
+
+    Returns:
+        Dict: ``{"cold": [...], "pooled": [...], "errors": [...]}`` where
+        each sample is a dict of :data:`PHASES` and each error is
+        ``"<mode>: <ExceptionName>"``.
+    """
+    params = params or SITEINFO_PARAMS
+    https = urlsplit(url).scheme == "https"
+    client_timeout = aiohttp.ClientTimeout(total=timeout)
+    result: Dict[str, List] = {"cold": [], "pooled": [], "errors": []}
+
+    for _ in range(count):
+        try:
+            connector = aiohttp.TCPConnector(force_close=True, use_dns_cache=False)
+            async with aiohttp.ClientSession(connector=connector, timeout=client_timeout,
+                                             trace_configs=[_trace_config()]) as session:
+                marks = await _request(session, url, params)
+        except Exception as exc:
+            result["errors"].append(f"cold: {type(exc).__name__}")
+            continue
+        tcp = None
+        if https:
+            try:
+                tcp = await _tcp_connect_time(url, timeout)
+            except Exception:
+                # The HTTP sample stands; only the TCP/TLS split is unknown.
+                pass
+        result["cold"].append(_phases(marks, tcp, https))
+
+    connector = aiohttp.TCPConnector(limit_per_host=1)
+    async with aiohttp.ClientSession(connector=connector, timeout=client_timeout,
+                                     trace_configs=[_trace_config()]) as session:
+        try:
+            await _request(session, url, params)  # warm-up: opens the pooled connection
+        except Exception as exc:
+            result["errors"].append(f"pooled: {type(exc).__name__}")
+        for _ in range(count):
+            try:
+                result["pooled"].append(_phases(await _request(session, url, params), None, https))
+            except Exception as exc:
+                result["errors"].append(f"pooled: {type(exc).__name__}")
+    return result
+
+
+async def probe_hosts(urls: Dict[str, str], count: int = 5, timeout: float = 10.0) -> Dict[str, Dict]:
+    """Run :func:`probe_host` for every ``{key: url}`` concurrently."""
+    results = await asyncio.gather(*(probe_host(url, count, timeout=timeout) for url in urls.values()))
+    return dict(zip(urls, results))
+
+
+def summarize(samples: List[Dict], phase: str = "total") -> Dict[str, Optional[float]]:
+    """Return ``p50``, ``p95`` and ``max`` of one phase across samples (``None`` when absent)."""
+    values = sorted(sample[phase] for sample in samples if sample.get(phase) is not None)
+    if not values:
+        return {"p50": None, "p95": None, "max": None}
+    return {
+        "p50": values[min(len(values) - 1, int(0.50 * len(values)))],
+        "p95": values[min(len(values) - 1, int(0.95 * len(values)))],
+        "max": values[-1],
+    }
@@ -0,0 +1,150 @@
+# api/refresh.py - Boundary-aware adaptive snapshot refresh
+"""
+Background refresh of :class:`~api.snapshot.SnapshotStore` snapshots.
+
+Event status only changes at known instants — the status boundaries of
+each event (see :func:`api.filters.status_boundaries`) — or when the
+wiki is edited. :class:`RefreshScheduler` therefore keeps two clocks per
+game:
+
+* **boundary** – wakes exactly at the next status boundary in the
+  game's snapshot and prunes ended events locally with
+  :meth:`SnapshotStore.prune`; no network request is made;
+* **poll** – re-fetches the wiki to pick up edits every
+  ``poll_interval`` seconds, or every ``patch_poll_interval`` seconds
+  while within ``patch_window`` of an event's exact start or end time,
+  since new versions go live (and the wiki gets edited) then. A failed
+  fetch is retried after :data:`~api.snapshot.ERROR_MAX_AGE` seconds.
+"""
+import asyncio
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+from metrics import REGISTRY
+
+from .filters import is_permanent, next_status_change, to_timestamp
+from .snapshot import ERROR_MAX_AGE, SnapshotStore
+
+logger = logging.getLogger(__name__)
+
+# Seconds between wiki polls outside patch windows.
+DEFAULT_POLL_INTERVAL = 1800
+
+# Seconds between wiki polls near an event's start or end time.
+DEFAULT_PATCH_POLL_INTERVAL = 120
+
+# Seconds either side of an event's start or end time that count as a patch window.
+DEFAULT_PATCH_WINDOW = 3600
+
+SNAPSHOT_WAKEUPS = REGISTRY.counter(
+    "gacha_snapshot_wakeups_total",
+    "Background snapshot wake-ups by game and reason (poll = wiki fetch, boundary = local prune).",
+    ("game", "reason"),
+)
+
+
+def _hot_times(events: List[Dict]) -> List[float]:
+    """Return the exact start and end instants of ``events`` as UNIX times."""
+    times = []
+    for event in events:
+        times.append(to_timestamp(event["start_date"]))
+        if not is_permanent(event):
+            times.append(to_timestamp(event["end_date"]))
+    return times
+
+
+class RefreshScheduler:
+    """Keeps every game's snapshot current with as few wiki requests as possible.
+
+    Attributes:
+        store (SnapshotStore): The store to refresh.
+        poll_interval (float): Seconds between polls outside patch windows.
+        patch_poll_interval (float): Seconds between polls inside a patch window.
+        patch_window (float): Seconds either side of an event start or end
+            time during which :attr:`patch_poll_interval` applies.
+    """
+
+    def __init__(
+        self,
+        store: SnapshotStore,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        patch_poll_interval: float = DEFAULT_PATCH_POLL_INTERVAL,
+        patch_window: float = DEFAULT_PATCH_WINDOW,
+    ):
+        self.store = store
+        self.poll_interval = poll_interval
+        self.patch_poll_interval = patch_poll_interval
+        self.patch_window = patch_window
+        self._next_poll: Dict[str, float] = {}
+        self._checked = time.time()
+
+    def poll_delay(self, game: str, now: Optional[float] = None) -> float:
+        """Return seconds until ``game``'s wiki should be polled again.
+
+        Inside a patch window this is :attr:`patch_poll_interval`;
+        otherwise :attr:`poll_interval`, cut short so the next poll lands
+        at the start of the next patch window.
+        """
+        now = time.time() if now is None else now
+        snapshot = self.store.peek(game)
+        if snapshot is None or snapshot["error"]:
+            return min(self.poll_interval, ERROR_MAX_AGE)
+
+        delay = self.poll_interval
+        for hot in _hot_times(snapshot["events"]):
+            if abs(hot - now) <= self.patch_window:
+                return min(delay, self.patch_poll_interval)
+            if hot > now:
+                delay = min(delay, hot - self.patch_window - now)
+        return delay
+
+    def next_boundary(self, game: str, now: Optional[float] = None) -> Optional[float]:
+        """Return the UNIX time of ``game``'s first status boundary after ``now``, or ``None``."""
+        snapshot = self.store.peek(game)
+        if snapshot is None:
+            return None
+        now = time.time() if now is None else now
+        boundary = next_status_change(snapshot["events"], datetime.fromtimestamp(now, timezone.utc))
+        return None if boundary is None else boundary.timestamp()
+
+    def next_wakeup(self, now: Optional[float] = None) -> float:
+        """Return the UNIX time of the earliest poll or boundary across all games."""
+        now = time.time() if now is None else now
+        wakeups = [self._next_poll.get(game, now) for game in self.store.game_configs]
+        wakeups += [b for b in (self.next_boundary(game, self._checked) for game in self.store.game_configs) if b is not None]
+        return min(wakeups, default=now + self.poll_interval)
+
+    async def poll(self, game: str) -> None:
+        """Fetch ``game`` from its wiki now and schedule its next poll."""
+        SNAPSHOT_WAKEUPS.inc(game=game, reason="poll")
+        try:
+            await self.store.refresh(game)
+        except Exception:
+            logger.exception("Background refresh of %s failed", game)
+        now = time.time()
+        self._next_poll[game] = now + max(0.0, self.poll_delay(game, now))
+        logger.debug("Next poll of %s in %.0fs", game, self._next_poll[game] - now)
+
+    def prune(self, game: str) -> None:
+        """Re-filter ``game``'s snapshot at a status boundary, without any I/O."""
+        SNAPSHOT_WAKEUPS.inc(game=game, reason="boundary")
+        self.store.prune(game)
+
+    async def run(self) -> None:
+        """Poll every game now, then sleep until each next poll or boundary, forever."""
+        await asyncio.gather(*(self.poll(game) for game in self.store.game_configs))
+        while True:
+            # Boundaries can be days away; cap the sleep so clock changes are noticed.
+            await asyncio.sleep(min(max(0.0, self.next_wakeup() - time.time()), self.poll_interval))
+            now = time.time()
+            due = [game for game in self.store.game_configs if self._next_poll.get(game, now) <= now]
+            for game in self.store.game_configs:
+                # Boundaries since the last check, so a late wake-up still prunes.
+                boundary = self.next_boundary(game, self._checked)
+                if game not in due and boundary is not None and boundary <= now:
+                    self.prune(game)
+            self._checked = now
+            if due:
+                await asyncio.gather(*(self.poll(game) for game in due))
@@ -0,0 +1,76 @@
+"""
+JSON-friendly serialization of parsed event dicts.
+
+Event dicts produced by :meth:`api.wiki_api.WikiAPI.process_event_async`
+carry :class:`datetime` values, which :mod:`json` cannot encode. The
+helpers here convert them to ISO 8601 strings in UTC so the same shape
+can be shared by the headless CLI and any other non-Discord consumer.
+
+:func:`event_to_wire` and :func:`event_from_wire` are the lossless pair
+used to ship snapshot events between processes: every key is kept and
+the datetimes round-trip exactly, naive or not.
+"""
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+from .filters import PERMANENT_YEAR
+
+
+def _to_utc_iso(value: datetime) -> str:
+    """Return ``value`` as an ISO 8601 string, treating naive datetimes as UTC."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.isoformat()
+
+
+def event_to_dict(event: Dict, game: Optional[str] = None, countdown: bool = True) -> Dict:
+    """Convert a display-ready event dict into a JSON-serializable dict.
+
+    Args:
+        event (Dict): Event dict as returned by
+            :meth:`WikiAPI.process_event_async`.
+        game (Optional[str]): ``GAME_CONFIG`` key to tag the event with.
+            Omitted from the output when ``None`` (default).
+        countdown (bool): When ``False``, leave out ``"time_remaining"``.
+            That field changes every minute, so cacheable outputs such as
+            the HTTP API drop it (default ``True``).
+
+    Returns:
+        Dict: A dict with ``"title"``, ``"start_date"``, ``"end_date"``,
+        ``"permanent"``, ``"time_remaining"`` and ``"date_range_str"``,
+        plus ``"pageid"`` when known. ``"end_date"`` is ``None`` for
+        permanent events.
+    """
+    end_date: datetime = event["end_date"]
+    permanent = end_date.year == PERMANENT_YEAR
+
+    result: Dict = {}
+    if game is not None:
+        result["game"] = game
+    result.update({
+        "title": event["title"],
+        "start_date": _to_utc_iso(event["start_date"]),
+        "end_date": None if permanent else _to_utc_iso(end_date),
+        "permanent": permanent,
+        "time_remaining": event["time_remaining"],
+        "date_range_str": event["date_range_str"],
+    })
+    if not countdown:
+        del result["time_remaining"]
+    if event.get("pageid") is not None:
+        result["pageid"] = event["pageid"]
+    return result
+
+
+# Keys of parsed event dicts that hold datetimes.
+_DATETIME_KEYS = ("start_date", "end_date")
+
+
+def event_to_wire(event: Dict) -> Dict:
+    """Return a JSON-serializable copy of an event dict that :func:`event_from_wire` restores exactly."""
+    return {key: value.isoformat() if key in _DATETIME_KEYS else value for key, value in event.items()}
+
+
+def event_from_wire(data: Dict) -> Dict:
+    """Rebuild an event dict produced by :func:`event_to_wire`."""
+    return {key: datetime.fromisoformat(value) if key in _DATETIME_KEYS else value for key, value in data.items()}
@@ -0,0 +1,276 @@
+"""
+In-memory event snapshots shared by every consumer in the process.
+
+A snapshot is the full list of not-yet-ended events for one game as
+returned by :meth:`WikiAPI.get_events_async`, together with bookkeeping
+used for caching:
+
+* ``"game"`` (str)            – ``GAME_CONFIG`` key.
+* ``"version"`` (int)         – bumped only when the event data changes.
+* ``"etag"`` (str)            – content hash of the serialized events.
+* ``"events"`` (List[Dict])   – parsed event dicts, sorted by end date.
+* ``"fetched_at"`` (datetime) – when the events were last fetched successfully.
+* ``"checked_at"`` (float)    – :func:`time.monotonic` of the last refresh attempt.
+* ``"error"`` (Optional[str]) – message of the last failed refresh, if any.
+
+Consumers filter a snapshot locally with :mod:`api.filters` instead of
+hitting the wiki, and concurrent refreshes of the same game are
+collapsed into a single fetch.
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from tracing import span
+from .filters import has_ended
+from .serialization import event_to_dict
+from .wiki_api import WikiAPI
+
+logger = logging.getLogger(__name__)
+
+# Seconds a snapshot is served before the next read triggers a refresh.
+DEFAULT_MAX_AGE = 300
+
+# Shorter freshness window after a failed refresh, so reads retry sooner.
+ERROR_MAX_AGE = 30
+
+# Called as listener(game, previous_snapshot_or_None, new_snapshot).
+SnapshotListener = Callable[[str, Optional[Dict], Dict], None]
+
+# Called as listener(game, snapshot) after every wiki refresh attempt, changed or not.
+RefreshListener = Callable[[str, Dict], None]
+
+# Called as await source(game); replaces the wiki fetch and returns the current snapshot.
+SnapshotSource = Callable[[str], Awaitable[Dict]]
+
+
+def event_key(event: Dict) -> str:
+    """Return a stable identity for an event across snapshot refreshes.
+
+    Prefers the MediaWiki page ID, falling back to the raw page title and
+    finally the display title.
+    """
+    if event.get("pageid") is not None:
+        return str(event["pageid"])
+    return event.get("page_title") or event["title"]
+
+
+def compute_etag(events: List[Dict]) -> str:
+    """Return a stable content hash for a list of event dicts."""
+    payload = json.dumps([event_to_dict(e, countdown=False) for e in events], sort_keys=True)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+class SnapshotStore:
+    """Per-game cache of parsed events with single-flight refreshes.
+
+    Attributes:
+        game_configs (Dict[str, Dict]): ``GAME_CONFIG``-shaped mapping used
+            to build a :class:`WikiAPI` for each game.
+        max_age (float): Seconds after which :meth:`get` refreshes a
+            snapshot before returning it.
+        source (Optional[SnapshotSource]): When set, refreshes call it
+            instead of fetching from the wiki, e.g. to take snapshots
+            published by a separate fetcher process.
+    """
+
+    def __init__(self, game_configs: Dict[str, Dict], max_age: float = DEFAULT_MAX_AGE):
+        """Initialize an empty store.
+
+        Args:
+            game_configs (Dict[str, Dict]): Mapping of game key to config
+                dict with at least ``"api_url"`` and ``"category"``.
+            max_age (float): Freshness window in seconds
+                (default :data:`DEFAULT_MAX_AGE`).
+        """
+        self.game_configs = game_configs
+        self.max_age = max_age
+        self._snapshots: Dict[str, Dict] = {}
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._listeners: List[SnapshotListener] = []
+        self._refresh_listeners: List[RefreshListener] = []
+        self.source: Optional[SnapshotSource] = None
+
+    def add_listener(self, listener: SnapshotListener) -> None:
+        """Register a callback fired whenever a game's event data changes."""
+        self._listeners.append(listener)
+
+    def add_refresh_listener(self, listener: RefreshListener) -> None:
+        """Register a callback fired after every wiki refresh, including failed and unchanged ones.
+
+        Unlike :meth:`add_listener` callbacks, these also see ``fetched_at``
+        moving forward and ``error`` being set or cleared.
+        """
+        self._refresh_listeners.append(listener)
+
+    def mark_checked(self, game: str, fetched_at: datetime, error: Optional[str]) -> Optional[Dict]:
+        """Record a refresh that did not change ``game``'s events, without notifying listeners.
+
+        Returns:
+            Optional[Dict]: The updated snapshot, or ``None`` if ``game``
+            has none yet.
+        """
+        snapshot = self._snapshots.get(game)
+        if snapshot is not None:
+            snapshot.update(fetched_at=fetched_at, checked_at=time.monotonic(), error=error)
+        return snapshot
+
+    def peek(self, game: str) -> Optional[Dict]:
+        """Return the current snapshot for ``game`` without any I/O."""
+        return self._snapshots.get(game)
+
+    def is_fresh(self, game: str) -> bool:
+        """Return ``True`` if ``game`` has a snapshot younger than :attr:`max_age`.
+
+        After a failed refresh the window shrinks to :data:`ERROR_MAX_AGE`.
+        """
+        snapshot = self._snapshots.get(game)
+        if snapshot is None:
+            return False
+        max_age = min(self.max_age, ERROR_MAX_AGE) if snapshot["error"] else self.max_age
+        return time.monotonic() - snapshot["checked_at"] < max_age
+
+    def get_fresh(self, game: str) -> Optional[Dict]:
+        """Return the snapshot for ``game`` if it is fresh, else ``None``, without any I/O.
+
+        Lets interaction handlers decide up front whether they can answer
+        immediately or must defer while :meth:`get` fetches.
+        """
+        return self._snapshots[game] if self.is_fresh(game) else None
+
+    def get_all_fresh(self) -> Optional[Dict[str, Dict]]:
+        """Return every game's snapshot if all are fresh, else ``None``, without any I/O."""
+        if not all(self.is_fresh(game) for game in self.game_configs):
+            return None
+        return {game: self._snapshots[game] for game in self.game_configs}
+
+    async def get(self, game: str) -> Dict:
+        """Return the snapshot for ``game``, refreshing it first if stale."""
+        with span("snapshot.get", game=game) as current:
+            fresh = self.is_fresh(game)
+            current.set(cached=fresh)
+            if fresh:
+                return self._snapshots[game]
+            return await self.refresh(game)
+
+    async def get_all(self) -> Dict[str, Dict]:
+        """Return snapshots for every configured game, refreshing stale ones concurrently."""
+        snapshots = await asyncio.gather(*(self.get(game) for game in self.game_configs))
+        return dict(zip(self.game_configs, snapshots))
+
+    async def refresh(self, game: str) -> Dict:
+        """Fetch ``game`` from its wiki now, sharing the fetch with concurrent callers.
+
+        Raises:
+            KeyError: If ``game`` is not in :attr:`game_configs`.
+        """
+        if game not in self.game_configs:
+            raise KeyError(game)
+
+        task = self._inflight.get(game)
+        if task is None:
+            task = asyncio.create_task(self._refresh(game))
+            self._inflight[game] = task
+            task.add_done_callback(lambda _: self._inflight.pop(game, None))
+        # Shield so one cancelled caller does not cancel the shared fetch.
+        return await asyncio.shield(task)
+
+    def prune(self, game: str, now: Optional[datetime] = None) -> Optional[Dict]:
+        """Drop events that have ended from ``game``'s snapshot, without any I/O.
+
+        The refresh timestamps are kept, so pruning never makes a stale
+        snapshot look fresh. Listeners are notified if anything was dropped.
+
+        Returns:
+            Optional[Dict]: The current snapshot, or ``None`` if ``game``
+            has none yet.
+        """
+        previous = self._snapshots.get(game)
+        if previous is None:
+            return None
+        now = now or datetime.now(timezone.utc)
+        events = [event for event in previous["events"] if not has_ended(event["end_date"], now)]
+        if len(events) == len(previous["events"]):
+            return previous
+        snapshot = self.update(game, events, fetched_at=previous["fetched_at"], error=previous["error"])
+        snapshot["checked_at"] = previous["checked_at"]
+        return snapshot
+
+    async def _refresh(self, game: str) -> Dict:
+        if self.source is not None:
+            return await self.source(game)
+        snapshot = await self._fetch(game)
+        for listener in self._refresh_listeners:
+            try:
+                listener(game, snapshot)
+            except Exception:
+                logger.exception("Refresh listener %r failed for %s", listener, game)
+        return snapshot
+
+    async def _fetch(self, game: str) -> Dict:
+        cfg = self.game_configs[game]
+        wiki = WikiAPI(cfg["api_url"], cfg["category"], game=game)
+        with span("snapshot.refresh", game=game):
+            events = await wiki.get_events_async()
+
+        if wiki.last_error is not None:
+            logger.warning("Refresh of %s failed, keeping previous data: %s", game, wiki.last_error)
+            previous = self._snapshots.get(game)
+            if previous is not None:
+                return self.mark_checked(game, previous["fetched_at"], str(wiki.last_error))
+            return self.update(game, [], error=str(wiki.last_error))
+
+        return self.update(game, events)
+
+    def update(
+        self,
+        game: str,
+        events: List[Dict],
+        fetched_at: Optional[datetime] = None,
+        error: Optional[str] = None,
+    ) -> Dict:
+        """Install a new event list for ``game`` and notify listeners on change.
+
+        If the events hash to the same ETag as the current snapshot only
+        the timestamps are updated; the version is not bumped and
+        listeners are not called.
+
+        Args:
+            game (str): ``GAME_CONFIG`` key.
+            events (List[Dict]): Parsed event dicts sorted by end date.
+            fetched_at (Optional[datetime]): When the data was fetched.
+                Defaults to now in UTC.
+            error (Optional[str]): Error message to record with the snapshot.
+
+        Returns:
+            Dict: The current snapshot for ``game``.
+        """
+        fetched_at = fetched_at or datetime.now(timezone.utc)
+        etag = compute_etag(events)
+        previous = self._snapshots.get(game)
+
+        if previous is not None and previous["etag"] == etag:
+            return self.mark_checked(game, fetched_at, error)
+
+        snapshot = {
+            "game": game,
+            "version": (previous["version"] + 1) if previous else 1,
+            "etag": etag,
+            "events": events,
+            "fetched_at": fetched_at,
+            "checked_at": time.monotonic(),
+            "error": error,
+        }
+        self._snapshots[game] = snapshot
+
+        for listener in self._listeners:
+            try:
+                listener(game, previous, snapshot)
+            except Exception:
+                logger.exception("Snapshot listener %r failed for %s", listener, game)
+
+        return snapshot
@@ -0,0 +1,259 @@
+# api/snapshot_ipc.py - Snapshot publishing between processes
+"""
+Ship :class:`~api.snapshot.SnapshotStore` snapshots from a fetcher
+process to bot processes over a Unix domain socket.
+
+The fetcher (``python -m gacha_reminder fetcher``) owns every wiki
+refresh and runs a :class:`SnapshotPublisher`; each bot process runs a
+:class:`SnapshotSubscriber` that installs received snapshots into its
+own store and never scrapes, so parsing CPU spikes stay out of the
+processes answering interactions and several shards share one scraper.
+
+The protocol is newline-delimited JSON, one frame per line:
+
+* ``{"type": "hello", "protocol": 1, "games": [...]}`` – sent on connect;
+* ``{"type": "snapshot", "game", "version", "etag", "fetched_at",
+  "error", "events"}`` – the full snapshot of one game, sent for every
+  game on connect and again whenever a game's events change. Events are
+  encoded with :func:`~api.serialization.event_to_wire`;
+* ``{"type": "status", "game", "version", "fetched_at", "error"}`` – sent
+  after every wiki refresh in the fetcher, so subscribers see failed
+  fetches and ``fetched_at`` advancing even when the events are unchanged.
+
+Snapshot frames carry the fetcher's version; subscribers ignore snapshot
+frames that are not newer than the last one applied for the game, and
+status frames for any other version than the one they hold. While
+disconnected from the fetcher, subscribers mark their snapshots with an
+error so reads stop treating them as current.
+"""
+import asyncio
+import json
+import logging
+import os
+import stat
+from datetime import datetime
+from typing import Dict, Optional, Set
+
+from .serialization import event_from_wire, event_to_wire
+from .snapshot import SnapshotStore
+
+logger = logging.getLogger(__name__)
+
+PROTOCOL_VERSION = 1
+
+# Largest frame a subscriber accepts; a snapshot of a few hundred events is ~100 KB.
+MAX_FRAME_BYTES = 16 * 1024 * 1024
+
+# Subscribers that fall this far behind are disconnected instead of buffering forever.
+MAX_BUFFERED_BYTES = 8 * 1024 * 1024
+
+
+def _frame(message: Dict) -> bytes:
+    return json.dumps(message, ensure_ascii=False, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+def status_frame(snapshot: Dict) -> bytes:
+    """Encode the refresh state of one snapshot as a ``status`` frame."""
+    return _frame({
+        "type": "status",
+        "game": snapshot["game"],
+        "version": snapshot["version"],
+        "fetched_at": snapshot["fetched_at"].isoformat(),
+        "error": snapshot["error"],
+    })
+
+
+def snapshot_frame(snapshot: Dict) -> bytes:
+    """Encode one snapshot as a ``snapshot`` frame."""
+    return _frame({
+        "type": "snapshot",
+        "game": snapshot["game"],
+        "version": snapshot["version"],
+        "etag": snapshot["etag"],
+        "fetched_at": snapshot["fetched_at"].isoformat(),
+        "error": snapshot["error"],
+        "events": [event_to_wire(event) for event in snapshot["events"]],
+    })
+
+
+class SnapshotPublisher:
+    """Serves a store's snapshots to every connected subscriber.
+
+    Attributes:
+        store (SnapshotStore): The store whose changes are published.
+        path (str): Filesystem path of the Unix socket.
+    """
+
+    def __init__(self, store: SnapshotStore, path: str):
+        self.store = store
+        self.path = path
+        self._writers: Set[asyncio.StreamWriter] = set()
+        self._server: Optional[asyncio.AbstractServer] = None
+        store.add_listener(self.on_snapshot)
+        store.add_refresh_listener(self.on_refresh)
+
+    @property
+    def subscribers(self) -> int:
+        """Number of connected subscribers."""
+        return len(self._writers)
+
+    async def start(self) -> None:
+        """Listen on :attr:`path`, replacing a stale socket left by a previous run."""
+        if os.path.exists(self.path) and stat.S_ISSOCK(os.stat(self.path).st_mode):
+            os.unlink(self.path)
+        self._server = await asyncio.start_unix_server(self._serve, path=self.path)
+        os.chmod(self.path, 0o660)
+        logger.info("Publishing snapshots on %s", self.path)
+
+    async def close(self) -> None:
+        """Stop listening and disconnect every subscriber."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        for writer in list(self._writers):
+            writer.close()
+        self._writers.clear()
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+
+    def on_snapshot(self, game: str, previous: Optional[Dict], snapshot: Dict) -> None:
+        """:class:`SnapshotStore` listener broadcasting changed snapshots."""
+        self._broadcast(snapshot_frame(snapshot))
+
+    def on_refresh(self, game: str, snapshot: Dict) -> None:
+        """:class:`SnapshotStore` refresh listener broadcasting ``fetched_at`` and ``error``."""
+        self._broadcast(status_frame(snapshot))
+
+    def _broadcast(self, frame: bytes) -> None:
+        for writer in list(self._writers):
+            if writer.transport.get_write_buffer_size() > MAX_BUFFERED_BYTES:
+                logger.warning("Dropping a subscriber that is %d bytes behind", writer.transport.get_write_buffer_size())
+                self._writers.discard(writer)
+                writer.close()
+                continue
+            writer.write(frame)
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._writers.add(writer)
+        logger.info("Subscriber connected (%d total)", len(self._writers))
+        try:
+            writer.write(_frame({"type": "hello", "protocol": PROTOCOL_VERSION, "games": list(self.store.game_configs)}))
+            for game in self.store.game_configs:
+                snapshot = self.store.peek(game)
+                if snapshot is not None:
+                    writer.write(snapshot_frame(snapshot))
+            await writer.drain()
+            # Subscribers never send anything; EOF means they went away.
+            await reader.read()
+        except (ConnectionError, OSError) as exc:
+            logger.debug("Subscriber connection failed: %s", exc)
+        finally:
+            self._writers.discard(writer)
+            writer.close()
+            logger.info("Subscriber disconnected (%d left)", len(self._writers))
+
+
+class SnapshotSubscriber:
+    """Receives published snapshots and installs them into a local store.
+
+    Set :meth:`snapshot` as the store's :attr:`~SnapshotStore.source` so
+    reads wait for the fetcher instead of scraping the wiki themselves.
+
+    Attributes:
+        store (SnapshotStore): The store updated with received snapshots.
+        path (str): Filesystem path of the publisher's Unix socket.
+        timeout (float): Seconds :meth:`snapshot` waits for a game's
+            first snapshot before reporting the fetcher as unavailable.
+        connected (bool): Whether the subscriber is currently connected.
+    """
+
+    def __init__(self, store: SnapshotStore, path: str, timeout: float = 30.0):
+        self.store = store
+        self.path = path
+        self.timeout = timeout
+        self.connected = False
+        self._versions: Dict[str, int] = {}
+        self._received: Dict[str, asyncio.Event] = {}
+
+    def _event(self, game: str) -> asyncio.Event:
+        return self._received.setdefault(game, asyncio.Event())
+
+    def apply(self, message: Dict) -> Optional[Dict]:
+        """Install a ``snapshot`` or ``status`` frame into :attr:`store`; other frames are ignored.
+
+        Returns:
+            Optional[Dict]: The store's snapshot for the frame's game, or
+            ``None`` if the frame was ignored.
+        """
+        if message.get("game") not in self.store.game_configs:
+            return None
+        game = message["game"]
+        if message.get("type") == "status":
+            if message["version"] != self._versions.get(game):
+                return None
+            return self.store.mark_checked(game, datetime.fromisoformat(message["fetched_at"]), message["error"])
+        if message.get("type") != "snapshot":
+            return None
+        if message["version"] <= self._versions.get(game, 0):
+            return None
+        self._versions[game] = message["version"]
+        snapshot = self.store.update(
+            game,
+            [event_from_wire(event) for event in message["events"]],
+            fetched_at=datetime.fromisoformat(message["fetched_at"]),
+            error=message["error"],
+        )
+        self._event(game).set()
+        return snapshot
+
+    async def snapshot(self, game: str) -> Dict:
+        """:class:`SnapshotStore` source: the latest published snapshot of ``game``.
+
+        Waits up to :attr:`timeout` for the first one. If none arrives the
+        previous snapshot (or an empty one) is returned marked with an
+        error, like a failed wiki fetch.
+        """
+        try:
+            await asyncio.wait_for(self._event(game).wait(), self.timeout)
+        except asyncio.TimeoutError:
+            error = f"No snapshot from the fetcher at {self.path}"
+            previous = self.store.peek(game)
+            if previous is not None:
+                # Record the check too, so ERROR_MAX_AGE spaces out the next wait.
+                return self.store.mark_checked(game, previous["fetched_at"], error)
+            return self.store.update(game, [], error=error)
+        return self.store.peek(game)
+
+    def _mark_disconnected(self) -> None:
+        # Surface the outage; with max_age = inf the snapshots would otherwise look current forever.
+        error = f"Lost connection to the fetcher at {self.path}"
+        for game in self.store.game_configs:
+            snapshot = self.store.peek(game)
+            if snapshot is not None:
+                self.store.mark_checked(game, snapshot["fetched_at"], error)
+
+    async def run(self) -> None:
+        """Stay connected to the publisher forever, reconnecting with backoff."""
+        delay = 1.0
+        while True:
+            writer = None
+            try:
+                reader, writer = await asyncio.open_unix_connection(self.path, limit=MAX_FRAME_BYTES)
+                self.connected = True
+                delay = 1.0
+                logger.info("Connected to snapshot publisher at %s", self.path)
+                while line := await reader.readline():
+                    self.apply(json.loads(line))
+                logger.warning("Snapshot publisher at %s closed the connection", self.path)
+            except (OSError, ValueError) as exc:
+                logger.warning("Snapshot publisher at %s unavailable: %s", self.path, exc)
+            finally:
+                if self.connected:
+                    self._mark_disconnected()
+                self.connected = False
+                if writer is not None:
+                    writer.close()
+            # A restarted fetcher starts counting versions from 1 again.
+            self._versions.clear()
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 30.0)
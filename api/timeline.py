@@ -0,0 +1,91 @@
+# api/timeline.py - Cross-game event timeline
+"""
+Merge several games' event lists into one timeline ordered by end date.
+
+Snapshot event lists are already sorted by :func:`~api.filters.event_sort_key`
+(end date, permanent events last), so a k-way merge with a heap of one
+cursor per game yields the global order in ``O(log k)`` per event.
+:func:`merge_timeline` stops as soon as ``limit`` events have been
+accepted, so showing the top K costs ``O(K log k)`` regardless of how many
+events the games have in total.
+"""
+import heapq
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .filters import event_sort_key, format_time_remaining, is_ongoing
+
+
+def iter_timeline(lists: Dict[str, List[Dict]], games: Optional[Iterable[str]] = None) -> Iterator[Tuple[str, Dict]]:
+    """Lazily yield ``(game, event)`` from every list in end-date order.
+
+    Args:
+        lists (Dict[str, List[Dict]]): Event lists keyed by game, each
+            sorted by :func:`~api.filters.event_sort_key`.
+        games (Optional[Iterable[str]]): Only merge these games (default: all).
+
+    Yields:
+        Tuple[str, Dict]: The game key and the event dict. Ties keep the
+        order of ``lists``.
+    """
+    wanted = None if games is None else set(games)
+    selected = [game for game in lists if wanted is None or game in wanted]
+    heap = [(event_sort_key(lists[game][0]), rank, 0, game) for rank, game in enumerate(selected) if lists[game]]
+    heapq.heapify(heap)
+    while heap:
+        _, rank, position, game = heap[0]
+        events = lists[game]
+        if position + 1 < len(events):
+            heapq.heapreplace(heap, (event_sort_key(events[position + 1]), rank, position + 1, game))
+        else:
+            heapq.heappop(heap)
+        yield game, events[position]
+
+
+def merge_timeline(
+    lists: Dict[str, List[Dict]],
+    games: Optional[Iterable[str]] = None,
+    limit: Optional[int] = None,
+    keep: Optional[Callable[[Dict], bool]] = None,
+) -> List[Tuple[str, Dict]]:
+    """Return the first ``limit`` events across ``games`` in end-date order.
+
+    Args:
+        lists (Dict[str, List[Dict]]): Event lists keyed by game, each
+            sorted by :func:`~api.filters.event_sort_key`.
+        games (Optional[Iterable[str]]): Only merge these games (default: all).
+        limit (Optional[int]): Stop after this many accepted events
+            (default: no limit).
+        keep (Optional[Callable[[Dict], bool]]): Predicate applied to each
+            event as it is merged; rejected events do not count towards
+            ``limit``.
+
+    Returns:
+        List[Tuple[str, Dict]]: ``(game, event)`` pairs. The event dicts
+        are the originals, not copies.
+    """
+    merged: List[Tuple[str, Dict]] = []
+    if limit is not None and limit <= 0:
+        return merged
+    for game, event in iter_timeline(lists, games):
+        if keep is None or keep(event):
+            merged.append((game, event))
+            if limit is not None and len(merged) >= limit:
+                break
+    return merged
+
+
+def ending_soonest(
+    lists: Dict[str, List[Dict]],
+    limit: int,
+    games: Optional[Iterable[str]] = None,
+    now: Optional[datetime] = None,
+) -> List[Tuple[str, Dict]]:
+    """Return the ``limit`` ongoing events that end first, with countdowns for ``now``.
+
+    Only the returned events are copied and get ``"time_remaining"``
+    recomputed, so the cost follows ``limit`` rather than the list sizes.
+    """
+    now = now or datetime.now(timezone.utc)
+    merged = merge_timeline(lists, games, limit, keep=lambda e: is_ongoing(e["start_date"], e["end_date"], now))
+    return [(game, {**event, "time_remaining": format_time_remaining(event["end_date"], now)}) for game, event in merged]
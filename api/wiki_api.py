@@ -14,11 +14,19 @@ supported games:
 """
 import re
 import asyncio
+import logging
 import aiohttp
 from datetime import datetime, timezone, timedelta
 from typing import List, Dict, Optional, Tuple
 import time
 
+from metrics import time_stage
+from tracing import current_span, span
+from .filters import event_sort_key, format_time_remaining, has_ended, is_ongoing
+from .page_cache import PAGE_CACHE, PageCache
+
+logger = logging.getLogger(__name__)
+
 class WikiAPI:
     """Async client for fetching and parsing game events from a MediaWiki wiki.
 
@@ -30,9 +38,17 @@ class WikiAPI:
     Attributes:
         API_URL (str): The ``api.php`` endpoint for the target wiki.
         category_name (str): Default wiki category to query for events.
+        game (str): ``GAME_CONFIG`` key used to label stage metrics.
+        page_cache (Optional[PageCache]): Cache consulted before fetching
+            page content, or ``None`` to always fetch.
+        last_error (Optional[Exception]): The fatal error swallowed by the
+            most recent :meth:`get_category_members_async` call, or
+            ``None`` if it succeeded. Lets callers tell an empty category
+            apart from a failed fetch.
     """
 
-    def __init__(self, API_URL: str, category_name: str = "Events"):
+    def __init__(self, API_URL: str, category_name: str = "Events", game: str = "unknown",
+                 page_cache: Optional[PageCache] = PAGE_CACHE):
         """Initialize the WikiAPI client.
 
         Args:
@@ -40,9 +56,17 @@ class WikiAPI:
                 (e.g. ``"https://wutheringwaves.fandom.com/api.php"``).
             category_name (str): Wiki category to query for event pages.
                 Defaults to ``"Events"``.
+            game (str): ``GAME_CONFIG`` key used to label stage metrics
+                (default ``"unknown"``).
+            page_cache (Optional[PageCache]): Page content cache shared
+                with other clients (default: the process-wide
+                :data:`~api.page_cache.PAGE_CACHE`).
         """
         self.API_URL = API_URL
         self.category_name = category_name
+        self.game = game
+        self.page_cache = page_cache
+        self.last_error: Optional[Exception] = None
     
     async def _fetch_all_category_members(
         self,
@@ -50,11 +74,12 @@ class WikiAPI:
         category: str,
         limit: int = 500,
     ) -> List[Dict]:
-        """Fetch every member of a wiki category, following cmcontinue pagination.
+        """Fetch every member of a wiki category, following continuation.
 
-        Sends repeated categorymembers queries until the API returns no
-        continuation token, collecting all pages across all pages of results.
-        Using the maximum API limit of 500 per request minimizes round trips.
+        Uses ``categorymembers`` as a generator for ``prop=info``, so each
+        member comes with its current revision ID (``lastrevid``) at no
+        extra request; that is what the page cache is keyed by. Using the
+        maximum API limit of 500 per request minimizes round trips.
 
         Args:
             session (aiohttp.ClientSession): An open aiohttp session to reuse.
@@ -64,33 +89,37 @@ class WikiAPI:
 
         Returns:
             List[Dict]: All category member dicts returned by the API across
-            all pages. Each dict contains at least a ``"title"`` key.
+            all pages. Each dict contains ``"title"``, ``"pageid"`` and
+            ``"lastrevid"``.
         """
         all_members: List[Dict] = []
         params: Dict = {
             "action": "query",
             "format": "json",
-            "list": "categorymembers",
-            "cmtitle": f"Category:{category}",
-            "cmlimit": str(limit),
+            "generator": "categorymembers",
+            "gcmtitle": f"Category:{category}",
+            "gcmlimit": str(limit),
+            "prop": "info",
         }
 
         page = 0
         while True:
             page += 1
-            async with session.get(self.API_URL, params=params) as response:
-                response.raise_for_status()
-                data = await response.json()
+            with span("wiki.category_page", game=self.game, page=page) as page_span:
+                async with session.get(self.API_URL, params=params) as response:
+                    response.raise_for_status()
+                    data = await response.json()
 
-            members = data.get("query", {}).get("categorymembers", [])
+                members = list(data.get("query", {}).get("pages", {}).values())
+                page_span.set(members=len(members))
             all_members.extend(members)
-            print(f"[FETCH] Page {page}: got {len(members)} members (total so far: {len(all_members)})")
+            logger.debug("Page %d: got %d members (total so far: %d)", page, len(members), len(all_members))
 
             continue_data = data.get("continue")
             if not continue_data:
                 break
 
-            params["cmcontinue"] = continue_data["cmcontinue"]
+            params.update(continue_data)
 
         return all_members
 
@@ -98,8 +127,9 @@ class WikiAPI:
         """Fetch all members of a wiki category along with their wikitext content.
 
         Uses :meth:`_fetch_all_category_members` to paginate through the full
-        category (following ``cmcontinue`` tokens), then fetches wikitext for
-        all pages via concurrent batch requests (batch size 20).
+        category, then fetches wikitext via concurrent batch requests (batch
+        size 20) for the pages whose current revision is not already in
+        :attr:`page_cache`.
 
         Args:
             category (Optional[str]): Category name to query. Falls back
@@ -111,12 +141,15 @@ class WikiAPI:
             List[Dict]: List of dicts with keys:
 
             * ``"title"`` (str) – page title.
+            * ``"pageid"`` (Optional[int]) – MediaWiki page ID.
             * ``"content"`` (str) – raw wikitext of the page's main slot.
 
-            Returns an empty list on any fatal network or API error.
+            Returns an empty list on any fatal network or API error, in
+            which case :attr:`last_error` is set.
         """
         # Use provided category or fall back to instance default
         category_to_use = category or self.category_name
+        self.last_error = None
 
         # Longer timeout and connection pooling
         timeout = aiohttp.ClientTimeout(total=60, connect=10)
@@ -124,108 +157,178 @@ class WikiAPI:
 
         async with aiohttp.ClientSession(timeout=timeout, connector=connector) as session:
             try:
-                step_start = time.time()
-
-                members = await self._fetch_all_category_members(session, category_to_use, limit)
+                with time_stage("enumerate", self.game) as stage:
+                    members = await self._fetch_all_category_members(session, category_to_use, limit)
+                    stage.items = len(members)
 
-                step_end = time.time()
-                print(f"[FETCH] Got {len(members)} category members from '{category_to_use}' in {round(step_end - step_start, 2)}s")
+                logger.debug("Got %d category members from '%s'", len(members), category_to_use)
                 
                 if not members:
                     return []
                 
-                # More aggressive batching - process multiple batches concurrently
-                batch_size = 20  # Smaller batches for better parallelization
-                all_results = []
-                
-                # Create tasks for all batches
-                batch_tasks = []
-                for i in range(0, len(members), batch_size):
-                    batch = members[i:i + batch_size]
-                    task = self._fetch_batch_content(session, batch)
-                    batch_tasks.append(task)
-                
-                print(f"[FETCH] Created {len(batch_tasks)} batch tasks")
-                
-                # Execute all batches concurrently
-                concurrent_start = time.time()
-                batch_results = await asyncio.gather(*batch_tasks, return_exceptions=True)
-                concurrent_end = time.time()
-                
-                print(f"[FETCH] Concurrent batches completed in {round(concurrent_end - concurrent_start, 2)}s")
-                
-                # Combine all results
-                for result in batch_results:
-                    if isinstance(result, list):
-                        all_results.extend(result)
-                    elif isinstance(result, Exception):
-                        print(f"[ERROR] Batch failed: {result}")
-                
-                print(f"[FETCH] Total results with content: {len(all_results)}")
+                all_results = await self._fetch_contents(session, members)
+                logger.debug("Total results with content: %d", len(all_results))
                 return all_results
                     
             except Exception as e:
-                print(f"[ERROR] Fatal error in get_category_members_async: {e}")
+                logger.error("Fatal error fetching category '%s' from %s: %s", category_to_use, self.API_URL, e)
+                self.last_error = e
                 return []
     
-    async def _fetch_batch_content(self, session: aiohttp.ClientSession, batch: List[Dict]) -> List[Dict]:
+    async def get_pages_async(self, titles: List[str], session: Optional[aiohttp.ClientSession] = None) -> List[Dict]:
+        """Fetch the wikitext of specific pages, reading through :attr:`page_cache`.
+
+        One ``prop=info`` request looks up the pages' current revisions;
+        only revisions that are not cached are then fetched.
+
+        Args:
+            titles (List[str]): Up to 50 page titles.
+            session (Optional[aiohttp.ClientSession]): Session to reuse; a
+                new one is opened when ``None``.
+
+        Returns:
+            List[Dict]: ``"title"``, ``"pageid"`` and ``"content"`` for each
+            page that exists. Network and API errors propagate.
+        """
+        if session is None:
+            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30)) as session:
+                return await self.get_pages_async(titles, session)
+        members = await self._fetch_page_info(session, titles)
+        return await self._fetch_contents(session, members, batch_size=50)
+
+    async def _fetch_page_info(self, session: aiohttp.ClientSession, titles: List[str]) -> List[Dict]:
+        """Look up the current revision of up to 50 pages in one ``prop=info`` request.
+
+        Returns:
+            List[Dict]: ``"title"``, ``"pageid"`` and ``"lastrevid"`` for
+            every page that exists.
+        """
+        params = {
+            "action": "query",
+            "format": "json",
+            "prop": "info",
+            "titles": "|".join(titles),
+        }
+        async with session.get(self.API_URL, params=params) as response:
+            response.raise_for_status()
+            data = await response.json()
+        pages = data.get("query", {}).get("pages", {})
+        return [page for page in pages.values() if "missing" not in page and "invalid" not in page]
+
+    async def _fetch_contents(self, session: aiohttp.ClientSession, members: List[Dict], batch_size: int = 20) -> List[Dict]:
+        """Return the wikitext of ``members``, fetching only pages not in the page cache.
+
+        Members whose ``lastrevid`` is cached are served without a request;
+        the rest are fetched in concurrent batches of ``batch_size`` (at
+        most 50) via :meth:`_fetch_batch_content`.
+
+        Args:
+            session (aiohttp.ClientSession): An open aiohttp session to reuse.
+            members (List[Dict]): Category-member dicts with ``"title"`` and,
+                for cache lookups, ``"lastrevid"``.
+            batch_size (int): Titles per content request (default ``20``,
+                smaller batches parallelize better).
+
+        Returns:
+            List[Dict]: ``"title"``, ``"pageid"`` and ``"content"`` dicts
+            in member order. Pages in failed batches are left out.
+        """
+        results: Dict[str, Dict] = {}
+        missing = []
+        for member in members:
+            content = None
+            if self.page_cache is not None:
+                content = self.page_cache.get(self.API_URL, member["title"], member.get("lastrevid"))
+            if content is None:
+                missing.append(member)
+            else:
+                results[member["title"]] = {"title": member["title"], "pageid": member.get("pageid"), "content": content}
+        logger.debug("%d of %d pages served from the page cache", len(results), len(members))
+
+        batch_tasks = [
+            self._fetch_batch_content(session, missing[i:i + batch_size], i // batch_size + 1)
+            for i in range(0, len(missing), batch_size)
+        ]
+        # Execute all batches concurrently; each batch is timed as a content_fetch stage
+        for result in await asyncio.gather(*batch_tasks, return_exceptions=True):
+            if isinstance(result, list):
+                results.update((page["title"], page) for page in result)
+            elif isinstance(result, Exception):
+                logger.warning("Batch failed: %s", result)
+
+        return [results[member["title"]] for member in members if member["title"] in results]
+
+    async def _fetch_batch_content(self, session: aiohttp.ClientSession, batch: List[Dict], number: int = 1) -> List[Dict]:
         """Fetch wikitext content for a single batch of pages in one API call.
 
         Joins page titles with ``|`` to perform a multi-page ``revisions``
         query, then maps the results back to the original member order.
+        Fetched revisions are stored in :attr:`page_cache`.
 
         Args:
             session (aiohttp.ClientSession): An open aiohttp session to
                 reuse for the request.
             batch (List[Dict]): A subset of category-member dicts, each
                 containing at least a ``"title"`` key.
+            number (int): 1-based batch number, recorded on the trace span
+                (default ``1``).
 
         Returns:
-            List[Dict]: Dicts with ``"title"`` and ``"content"`` for each
-            page in the batch that was found. Pages with no revisions get
+            List[Dict]: Dicts with ``"title"``, ``"pageid"`` and ``"content"``
+            for each page in the batch that was found. Pages with no revisions get
             an empty string for ``"content"``. Returns ``[]`` on error.
         """
-        try:
-            titles = "|".join([member["title"] for member in batch])
+        with time_stage("content_fetch", self.game) as stage:
+            # time_stage opens the content_fetch span; annotate it rather than nesting another.
+            batch_span = current_span()
+            if batch_span is not None:
+                batch_span.set(batch=number, pages=len(batch))
+            try:
+                titles = "|".join([member["title"] for member in batch])
             
-            content_params = {
-                "action": "query",
-                "format": "json",
-                "prop": "revisions",
-                "titles": titles,
-                "rvprop": "content",
-                "rvslots": "main"
-            }
+                content_params = {
+                    "action": "query",
+                    "format": "json",
+                    "prop": "revisions",
+                    "titles": titles,
+                    "rvprop": "ids|content",
+                    "rvslots": "main"
+                }
             
-            async with session.get(self.API_URL, params=content_params) as content_response:
-                content_response.raise_for_status()
-                content_data = await content_response.json()
-                pages = content_data.get("query", {}).get("pages", {})
+                async with session.get(self.API_URL, params=content_params) as content_response:
+                    content_response.raise_for_status()
+                    content_data = await content_response.json()
+                    pages = content_data.get("query", {}).get("pages", {})
                 
-                # Process results for this batch
-                batch_results = []
-                for member in batch:
-                    title = member["title"]
-                    for page_id, page_data in pages.items():
-                        if page_data.get("title") == title:
-                            content = ""
-                            revisions = page_data.get("revisions", [])
-                            if revisions:
-                                slots = revisions[0].get("slots", {})
-                                main_slot = slots.get("main", {})
-                                content = main_slot.get("*", "")
+                    # Process results for this batch
+                    batch_results = []
+                    for member in batch:
+                        title = member["title"]
+                        for page_id, page_data in pages.items():
+                            if page_data.get("title") == title:
+                                content = ""
+                                revisions = page_data.get("revisions", [])
+                                if revisions:
+                                    slots = revisions[0].get("slots", {})
+                                    main_slot = slots.get("main", {})
+                                    content = main_slot.get("*", "")
+                                    if self.page_cache is not None:
+                                        self.page_cache.put(self.API_URL, title, revisions[0].get("revid"), content)
                             
-                            batch_results.append({
-                                "title": title,
-                                "content": content
-                            })
-                            break
+                                batch_results.append({
+                                    "title": title,
+                                    "pageid": page_data.get("pageid"),
+                                    "content": content
+                                })
+                                break
                 
-                return batch_results
+                    stage.items = len(batch_results)
+                    return batch_results
                 
-        except Exception as e:
-            print(f"[ERROR] Batch content fetch failed: {e}")
-            return []
+            except Exception as e:
+                logger.warning("Batch content fetch failed: %s", e)
+                stage.outcome = "error"
+                return []
     
     def parse_datetime_from_wiki_format(self, date_str: str) -> Optional[datetime]:
         """Parse a datetime from one of several wiki date string formats.
@@ -277,7 +380,7 @@ class WikiAPI:
                 continue
         
         # If no format worked, let's log what we tried to parse
-        print(f"[DEBUG] Failed to parse date: '{date_str}' with any known format")
+        logger.debug("Failed to parse date '%s' with any known format", date_str)
         return None
     
     def get_clean_event_name(self, content: str, title: str) -> str:
@@ -326,30 +429,7 @@ class WikiAPI:
             * ``"Xh Ym"``    — hours and minutes remaining (< 1 day).
             * ``"Xm"``       — minutes remaining (< 1 hour).
         """
-        if end_date.year == 2030: 
-            return "Permanent"
-        
-        now = datetime.now(timezone.utc)
-        
-        if end_date.tzinfo is None:
-            end_date = end_date.replace(tzinfo=timezone.utc)
-        
-        time_difference = end_date - now
-        
-        if time_difference.total_seconds() <= 0:
-            return "Ended"
-        
-        days = time_difference.days
-        hours = time_difference.seconds // 3600
-        
-        if days > 0:
-            return f"{days}d {hours}h"
-        elif hours > 0:
-            minutes = (time_difference.seconds % 3600) // 60
-            return f"{hours}h {minutes}m"
-        else:
-            minutes = time_difference.seconds // 60
-            return f"{minutes}m"
+        return format_time_remaining(end_date)
     
     def parse_event_dates(self, text: str, title: str = "") -> Optional[Tuple[datetime, datetime]]:
         """Extract and normalize start/end datetimes from a wiki event page.
@@ -415,20 +495,55 @@ class WikiAPI:
         
         return None
     
+    def parse_event(self, event_data: Dict) -> Optional[Dict]:
+        """Parse a raw page dict into an event dict, whatever its status.
+
+        Unlike :meth:`process_event_async` this does not check whether the
+        event is ongoing, so upcoming and past events are returned too.
+
+        Args:
+            event_data (Dict): A dict with ``"title"``, ``"content"`` and
+                optionally ``"pageid"`` as returned by
+                :meth:`get_category_members_async`.
+
+        Returns:
+            Optional[Dict]: The event dict described in
+            :meth:`process_event_async`, or ``None`` if the page has no
+            content or no parseable ``time_start``.
+        """
+        title = event_data["title"]
+        content = event_data["content"]
+        if not content:
+            return None
+
+        date_info = self.parse_event_dates(content, title)
+        if not date_info:
+            return None
+
+        start_date, end_date = date_info
+        return {
+            "title": self.get_clean_event_name(content, title),
+            "time_remaining": self.get_time_remaining(end_date),
+            "start_date": start_date,
+            "end_date": end_date,
+            "date_range_str": f"{start_date.strftime('%m/%d')} - {end_date.strftime('%m/%d') if end_date.year != 2030 else 'Permanent'}",
+            "page_title": title,
+            "pageid": event_data.get("pageid"),
+        }
+
     async def process_event_async(self, event_data: Dict, today: datetime, debug: bool = False) -> Optional[Dict]:
         """Process a single raw event dict into a display-ready event dict.
 
-        Parses dates via :meth:`parse_event_dates`, checks whether the
-        event is currently ongoing, and assembles the result dict used by
-        embed builders.
+        Parses the page via :meth:`parse_event` and checks whether the
+        event is currently ongoing.
 
         Args:
             event_data (Dict): A dict with ``"title"`` and ``"content"``
                 keys as returned by :meth:`get_category_members_async`.
             today (datetime): Reference datetime for the "is ongoing"
                 check. May be naive (assumed UTC) or timezone-aware.
-            debug (bool): When ``True``, prints processing steps to
-                stdout (default ``False``).
+            debug (bool): When ``True``, logs processing steps at ``INFO``
+                instead of ``DEBUG`` (default ``False``).
 
         Returns:
             Optional[Dict]: A dict with the following keys if the event
@@ -439,51 +554,67 @@ class WikiAPI:
             * ``"start_date"`` (datetime) – parsed start datetime.
             * ``"end_date"`` (datetime)   – parsed end datetime.
             * ``"date_range_str"`` (str)  – e.g. ``"11/16 - 12/01"``.
+            * ``"page_title"`` (str)      – raw wiki page title.
+            * ``"pageid"`` (Optional[int]) – MediaWiki page ID.
         """
+        log = logger.info if debug else logger.debug
         try:
             title = event_data["title"]
-            content = event_data["content"]
             
-            if not content:
-                if debug:
-                    print(f"[PROCESS] No content for {title}")
+            if not event_data["content"]:
+                log("No content for %s", title)
                 return None
             
-            date_info = self.parse_event_dates(content, title)
-            if not date_info:
-                if debug:
-                    print(f"[PROCESS] No valid dates found for {title}")
+            event = self.parse_event(event_data)
+            if not event:
+                log("No valid dates found for %s", title)
                 return None
             
-            start_date, end_date = date_info
-            
-            # Check if event is ongoing
-            today_aware = today.replace(tzinfo=timezone.utc) if today.tzinfo is None else today
-            start_aware = start_date.replace(tzinfo=timezone.utc) if start_date.tzinfo is None else start_date
-            end_aware = end_date.replace(tzinfo=timezone.utc) if end_date.tzinfo is None else end_date
-            
-            is_ongoing = start_aware.date() <= today_aware.date() <= end_aware.date()
-            
-            if is_ongoing:
-                clean_name = self.get_clean_event_name(content, title)
-                time_remaining = self.get_time_remaining(end_date)
-                
-                if debug:
-                    print(f"[PROCESS] Found ongoing event: {clean_name}")
-                
-                return {
-                    "title": clean_name,
-                    "time_remaining": time_remaining,
-                    "start_date": start_date,
-                    "end_date": end_date,
-                    "date_range_str": f"{start_date.strftime('%m/%d')} - {end_date.strftime('%m/%d') if end_date.year != 2030 else 'Permanent'}"
-                }
+            if is_ongoing(event["start_date"], event["end_date"], today):
+                log("Found ongoing event: %s", event["title"])
+                return event
         except Exception as e:
-            if debug:
-                print(f"[ERROR] Error processing event {event_data.get('title', 'unknown')}: {e}")
+            logger.warning("Error processing event %s: %s", event_data.get("title", "unknown"), e)
             
         return None
     
+    async def get_events_async(self, today: Optional[datetime] = None) -> List[Dict]:
+        """Fetch and parse every event that has not ended yet.
+
+        Runs the same fetch as :meth:`get_ongoing_events_async` but keeps
+        upcoming events as well, so callers can cache the result and
+        re-filter it locally (see :mod:`api.filters`) as time moves on.
+
+        Args:
+            today (Optional[datetime]): Reference date; events whose last
+                day is before it are dropped. Defaults to now in UTC.
+
+        Returns:
+            List[Dict]: Event dicts (see :meth:`parse_event`) sorted by
+            ``end_date`` with permanent events last. Returns ``[]`` on
+            fetch failure, in which case :attr:`last_error` is set.
+        """
+        with span("wiki.events", game=self.game, category=self.category_name):
+            if today is None:
+                today = datetime.now(timezone.utc)
+
+            events_with_content = await self.get_category_members_async()
+
+            events = []
+            with time_stage("parse", self.game) as stage:
+                for event_data in events_with_content:
+                    try:
+                        event = self.parse_event(event_data)
+                    except Exception as e:
+                        logger.warning("Error parsing event %s: %s", event_data.get("title", "unknown"), e)
+                        continue
+                    if event and not has_ended(event["end_date"], today):
+                        events.append(event)
+                stage.items = len(events_with_content)
+
+            events.sort(key=event_sort_key)
+            return events
+
     async def get_ongoing_events_async(self, today: Optional[datetime] = None, debug: bool = False) -> List[Dict]:
         """Fetch, parse, and return all currently ongoing events.
 
@@ -499,8 +630,8 @@ class WikiAPI:
         Args:
             today (Optional[datetime]): Reference date for filtering.
                 Defaults to :func:`datetime.now` in UTC.
-            debug (bool): When ``True``, emits timing and count info to
-                stdout throughout the pipeline (default ``False``).
+            debug (bool): When ``True``, logs timing and count info at
+                ``INFO`` instead of ``DEBUG`` (default ``False``).
 
         Returns:
             List[Dict]: Ongoing event dicts sorted by ``end_date``,
@@ -508,55 +639,45 @@ class WikiAPI:
             :meth:`process_event_async`. Returns ``[]`` if the category
             has no members or all events have ended.
         """
-        if today is None:
-            today = datetime.now(timezone.utc)
-        
-        total_start = time.time()
-        if debug:
-            print(f"[START] Looking for events on date: {today}")
+        with span("wiki.events", game=self.game, category=self.category_name):
+            if today is None:
+                today = datetime.now(timezone.utc)
         
-        # Get events with content using async HTTP
-        fetch_start = time.time()
-        events_with_content = await self.get_category_members_async()
-        fetch_end = time.time()
+            log = logger.info if debug else logger.debug
+            total_start = time.perf_counter()
+            log("Looking for events on date: %s", today)
         
-        if debug:
-            print(f"[FETCH] Retrieved {len(events_with_content)} events in {round(fetch_end - fetch_start, 2)}s")
+            # Get events with content using async HTTP (timed per stage inside)
+            events_with_content = await self.get_category_members_async()
         
-        if not events_with_content:
-            if debug:
-                print("[FETCH] No events with content found")
-            return []
+            log("Retrieved %d events in %.2fs", len(events_with_content), time.perf_counter() - total_start)
         
-        # Process all events concurrently
-        process_start = time.time()
-        tasks = [
-            self.process_event_async(event_data, today, debug) 
-            for event_data in events_with_content
-        ]
+            if not events_with_content:
+                log("No events with content found")
+                return []
         
-        # Wait for all processing to complete
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        process_end = time.time()
+            # Process all events concurrently
+            with time_stage("parse", self.game) as stage:
+                tasks = [
+                    self.process_event_async(event_data, today, debug) 
+                    for event_data in events_with_content
+                ]
+            
+                # Wait for all processing to complete
+                results = await asyncio.gather(*tasks, return_exceptions=True)
+                stage.items = len(events_with_content)
         
-        # Filter out None results and exceptions
-        current_events = [
-            result for result in results 
-            if result is not None and not isinstance(result, Exception)
-        ]
+            # Filter out None results and exceptions
+            current_events: List[Dict] = [result for result in results if isinstance(result, dict)]
         
-        # Sort by end date
-        #! Currently there are errors here but the code still works
-        current_events.sort(key=lambda x: x['end_date'] if x['end_date'].year != 2030 else datetime.max) # type: ignore
+            # Sort by end date
+            current_events.sort(key=event_sort_key)
         
-        total_end = time.time()
-        if debug:
-            print(f"[PROCESS] Processed events in {round(process_end - process_start, 2)}s")
-            print(f"[RESULT] Found {len(current_events)} ongoing events")
-            print(f"[TOTAL] Complete operation took {round(total_end - total_start, 2)}s")
+            log("Processed events in %.2fs", stage.elapsed)
+            log("Found %d ongoing events", len(current_events))
+            log("Complete operation took %.2fs", time.perf_counter() - total_start)
         
-        #! Error here but the code still works
-        return current_events # type: ignore
+            return current_events
 
 async def get_ongoing_events_async(API_URL: str, debug: bool = False, category: str = "Events") -> List[Dict]:
     """Convenience wrapper that creates a :class:`WikiAPI` and fetches ongoing events.
@@ -0,0 +1,3 @@
+from .setup import JsonFormatter, RateLimitFilter, setup_logging
+
+__all__ = ["JsonFormatter", "RateLimitFilter", "setup_logging"]
@@ -0,0 +1,169 @@
+# applog/setup.py - Queue-based structured logging
+"""
+Process-wide logging configuration.
+
+Every record is put on an in-memory queue by a
+:class:`logging.handlers.QueueHandler` on the root logger; a
+:class:`logging.handlers.QueueListener` thread formats it and writes it
+to the output stream. Code on the event loop therefore never blocks on
+terminal or pipe I/O, however much a large scrape logs.
+
+Settings (arguments to :func:`setup_logging`, or environment variables):
+
+* ``LOG_LEVEL``  – root level (default ``INFO``).
+* ``LOG_LEVELS`` – per-logger overrides, e.g.
+  ``api.wiki_api=DEBUG,discord.gateway=WARNING``.
+* ``LOG_FORMAT`` – ``text`` (default) or ``json`` (one JSON object per line).
+
+Repeated warnings are rate limited by :class:`RateLimitFilter`: each
+call site (logger and message template) may log a few times per window,
+after which identical warnings are dropped and counted; the next one let
+through reports how many were suppressed.
+"""
+from __future__ import annotations
+
+import atexit
+import json
+import logging
+import os
+import queue
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Optional, TextIO, Tuple
+
+TEXT_FORMAT = "%(asctime)s %(levelname)-7s %(name)s: %(message)s"
+
+# Per-logger defaults applied before LOG_LEVELS overrides.
+DEFAULT_MODULE_LEVELS: Dict[str, str] = {
+    "aiohttp.access": "WARNING",
+}
+
+# LogRecord attributes that are not user-supplied ``extra`` fields.
+_RECORD_ATTRIBUTES = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime", "taskName"}
+
+_listener: Optional[QueueListener] = None
+
+
+class JsonFormatter(logging.Formatter):
+    """Format records as single-line JSON objects, including ``extra`` fields."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES and not key.startswith("_"):
+                payload[key] = value
+        if record.exc_info:
+            payload["exc"] = self.formatException(record.exc_info)
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+class RateLimitFilter(logging.Filter):
+    """Drop repeats of the same warning beyond ``burst`` per ``interval`` seconds.
+
+    Records are grouped by logger and unformatted message template, so
+    ``log.warning("Batch failed: %s", exc)`` is one group whatever ``exc``
+    is. Records below ``level`` always pass.
+    """
+
+    def __init__(self, interval: float = 60.0, burst: int = 5, level: int = logging.WARNING):
+        super().__init__()
+        self.interval = interval
+        self.burst = burst
+        self.level = level
+        self._lock = threading.Lock()
+        # (logger, levelno, template) -> (window start, passed, suppressed)
+        self._windows: Dict[Tuple[str, int, str], Tuple[float, int, int]] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno < self.level:
+            return True
+        key = (record.name, record.levelno, str(record.msg))
+        now = time.monotonic()
+        with self._lock:
+            start, passed, suppressed = self._windows.get(key, (now, 0, 0))
+            if now - start >= self.interval:
+                if suppressed:
+                    record.msg = f"{record.msg} [{suppressed} similar messages suppressed]"
+                    record.suppressed = suppressed
+                start, passed, suppressed = now, 0, 0
+            if passed < self.burst:
+                self._windows[key] = (start, passed + 1, suppressed)
+                return True
+            self._windows[key] = (start, passed, suppressed + 1)
+            return False
+
+
+def _parse_module_levels(spec: str) -> Dict[str, str]:
+    levels = {}
+    for item in spec.split(","):
+        name, sep, level = item.partition("=")
+        if sep and name.strip():
+            levels[name.strip()] = level.strip().upper()
+    return levels
+
+
+def _stop_listener() -> None:
+    # QueueListener.stop() fails if called twice; flush once at exit.
+    if _listener is not None and _listener._thread is not None:
+        _listener.stop()
+
+
+def setup_logging(
+    level: Optional[str] = None,
+    module_levels: Optional[Dict[str, str]] = None,
+    fmt: Optional[str] = None,
+    stream: Optional[TextIO] = None,
+) -> QueueListener:
+    """Route all logging through a queue and start the writer thread.
+
+    Safe to call more than once; later calls only adjust levels.
+
+    Args:
+        level (Optional[str]): Root level; defaults to ``LOG_LEVEL`` or ``INFO``.
+        module_levels (Optional[Dict[str, str]]): Logger name to level
+            overrides, applied on top of ``LOG_LEVELS``.
+        fmt (Optional[str]): ``"text"`` or ``"json"``; defaults to
+            ``LOG_FORMAT`` or ``"text"``.
+        stream (Optional[TextIO]): Output stream (default :data:`sys.stderr`).
+
+    Returns:
+        QueueListener: The running listener; it is stopped (and the queue
+        flushed) at interpreter exit.
+    """
+    global _listener
+
+    root = logging.getLogger()
+    root.setLevel((level or os.getenv("LOG_LEVEL") or "INFO").upper())
+    levels = {**DEFAULT_MODULE_LEVELS, **_parse_module_levels(os.getenv("LOG_LEVELS") or ""), **(module_levels or {})}
+    for name, name_level in levels.items():
+        logging.getLogger(name).setLevel(name_level)
+
+    if _listener is not None:
+        return _listener
+
+    output = logging.StreamHandler(stream or sys.stderr)
+    if (fmt or os.getenv("LOG_FORMAT") or "text").lower() == "json":
+        output.setFormatter(JsonFormatter())
+    else:
+        output.setFormatter(logging.Formatter(TEXT_FORMAT))
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.addFilter(RateLimitFilter())
+
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(queue_handler)
+
+    _listener = QueueListener(log_queue, output, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_stop_listener)
+    return _listener
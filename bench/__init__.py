@@ -0,0 +1,8 @@
+"""
+Offline benchmarking tools, run as modules (``python -m bench.<name>``).
+
+* :mod:`bench.wiki_server` – local MediaWiki stand-in with fault injection.
+* :mod:`bench.pipeline`    – end-to-end pipeline benchmark with a stored baseline.
+* :mod:`bench.parser`      – parser micro-benchmarks and corpus correctness check.
+* :mod:`bench.load`        – concurrent-user load test of the slash command callbacks.
+"""
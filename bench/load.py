@@ -0,0 +1,310 @@
+# bench/load.py - Concurrent-user load test for slash commands
+"""
+Drive the registered slash command callbacks with fake interactions.
+
+No gateway connection is made: the harness builds the command tree the
+way ``main.py`` does, points every game's ``api_url`` at its own local
+wiki stand-in (see :mod:`bench.wiki_server`) and awaits the command
+callbacks directly with :class:`FakeInteraction` objects that record
+when they were answered.
+
+Two load models are supported:
+
+* closed loop (default) – ``--concurrency`` virtual users each issue
+  commands back to back until ``--requests`` have been sent;
+* open loop – ``--rate`` arrivals per second (Poisson) for ``--duration``
+  seconds, regardless of how quickly earlier commands finish.
+
+Reported per command: time to first response (what Discord's 3 second
+interaction deadline applies to), total handler latency, error rate and
+late responses; overall: throughput and wiki request amplification
+(stand-in requests per command).
+
+Usage::
+
+    python -m bench.load --commands events_all,events_zzz --concurrency 50 --requests 2000
+    python -m bench.load --rate 200 --duration 20 --max-age 5 --latency 0.1
+"""
+from __future__ import annotations
+
+import os
+
+# config refuses to import without credentials; no connection is ever made.
+os.environ.setdefault("DISCORD_TOKEN", "load-test")
+os.environ.setdefault("GUILD_ID", "1")
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+import discord
+from discord.ext import commands
+
+from applog import setup_logging
+from config import COMMAND_GUILD
+from commands import register_game_commands
+from games import GAME_CONFIG, SNAPSHOTS
+
+from .wiki_server import Faults, WikiStandIn, start_stand_in, synthetic_pages
+
+# Discord fails an interaction that is neither answered nor deferred in time.
+INTERACTION_DEADLINE = 3.0
+
+_EVENT_QUERIES = ("summer", "echo", "hollow", "festival tr", "tidal", "gleam", "waltz", "star")
+
+
+class _FakeResponse:
+    def __init__(self, interaction: "FakeInteraction"):
+        self._interaction = interaction
+        self._done = False
+
+    def is_done(self) -> bool:
+        return self._done
+
+    async def _answer(self, content=None) -> None:
+        self._interaction._record(content)
+        self._done = True
+        if self._interaction.discord_latency:
+            await asyncio.sleep(self._interaction.discord_latency)
+
+    async def defer(self, **kwargs) -> None:
+        await self._answer()
+
+    async def send_message(self, content=None, **kwargs) -> None:
+        await self._answer(content)
+
+    async def edit_message(self, **kwargs) -> None:
+        await self._answer()
+
+
+class _FakeFollowup:
+    def __init__(self, interaction: "FakeInteraction"):
+        self._interaction = interaction
+
+    async def send(self, content=None, **kwargs) -> None:
+        self._interaction._record(content)
+        if self._interaction.discord_latency:
+            await asyncio.sleep(self._interaction.discord_latency)
+
+
+class FakeInteraction:
+    """Stand-in for :class:`discord.Interaction` that records response timing.
+
+    Attributes:
+        started (float): ``perf_counter`` time the command was invoked.
+        first_response (Optional[float]): Seconds until the first
+            ``defer``/``send_message``, or ``None`` if never answered.
+        errored (bool): Whether an ``Error: ...`` message was sent.
+        discord_latency (float): Simulated Discord API round trip per call.
+    """
+
+    def __init__(self, discord_latency: float = 0.0):
+        self.started = time.perf_counter()
+        self.first_response: Optional[float] = None
+        self.errored = False
+        self.discord_latency = discord_latency
+        self.response = _FakeResponse(self)
+        self.followup = _FakeFollowup(self)
+        self.user = None
+        self.client = None
+
+    def _record(self, content) -> None:
+        if self.first_response is None:
+            self.first_response = time.perf_counter() - self.started
+        if isinstance(content, str) and content.startswith("Error:"):
+            self.errored = True
+
+    async def original_response(self):
+        return None
+
+
+def _percentile(values: List[float], q: float) -> Optional[float]:
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class LoadRecorder:
+    """Collects one sample per command invocation."""
+
+    def __init__(self):
+        self.samples: Dict[str, List[Dict]] = defaultdict(list)
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def invoke(self, name: str, command, discord_latency: float, rng: random.Random) -> None:
+        interaction = FakeInteraction(discord_latency)
+        kwargs = {"name": rng.choice(_EVENT_QUERIES)} if name == "event" else {}
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        crashed = False
+        try:
+            await command.callback(interaction, **kwargs)
+        except Exception:
+            crashed = True
+        finally:
+            self.in_flight -= 1
+        self.samples[name].append({
+            "total": time.perf_counter() - interaction.started,
+            "first_response": interaction.first_response,
+            "error": crashed or interaction.errored or interaction.first_response is None,
+        })
+
+    def report(self) -> Dict[str, Dict]:
+        rows = {}
+        for name, samples in self.samples.items():
+            totals = [s["total"] for s in samples]
+            firsts = [s["first_response"] for s in samples if s["first_response"] is not None]
+            errors = sum(1 for s in samples if s["error"])
+            rows[name] = {
+                "count": len(samples),
+                "errors": errors,
+                "error_rate": errors / len(samples),
+                "late": sum(1 for value in firsts if value > INTERACTION_DEADLINE),
+                **{f"first_p{int(q * 100)}": _percentile(firsts, q) for q in (0.5, 0.95, 0.99)},
+                **{f"total_p{int(q * 100)}": _percentile(totals, q) for q in (0.5, 0.95, 0.99)},
+                "total_max": max(totals),
+            }
+        return rows
+
+
+async def closed_loop(recorder: LoadRecorder, commands_by_name: Dict, concurrency: int, requests: int,
+                      discord_latency: float, seed: int) -> None:
+    names = list(commands_by_name)
+    remaining = iter(range(requests))
+
+    async def user(number: int) -> None:
+        rng = random.Random(seed + number)
+        for index in remaining:
+            name = names[index % len(names)]
+            await recorder.invoke(name, commands_by_name[name], discord_latency, rng)
+
+    await asyncio.gather(*(user(number) for number in range(concurrency)))
+
+
+async def open_loop(recorder: LoadRecorder, commands_by_name: Dict, rate: float, duration: float,
+                    discord_latency: float, seed: int) -> None:
+    names = list(commands_by_name)
+    rng = random.Random(seed)
+    tasks = []
+    start = time.perf_counter()
+    next_at = 0.0
+    index = 0
+    while next_at < duration:
+        delay = start + next_at - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        name = names[index % len(names)]
+        tasks.append(asyncio.create_task(recorder.invoke(name, commands_by_name[name], discord_latency, rng)))
+        index += 1
+        next_at += rng.expovariate(rate)
+    await asyncio.gather(*tasks)
+
+
+def _ms(value: Optional[float]) -> str:
+    return "-" if value is None else f"{value * 1000:.1f}"
+
+
+def format_report(rows: Dict[str, Dict], elapsed: float, wiki_requests: int, wiki_bytes: int, max_in_flight: int) -> str:
+    header = (f"{'command':<22} {'n':>6} {'err%':>6} {'late':>5} {'1st p50':>8} {'1st p95':>8} {'1st p99':>8} "
+              f"{'tot p50':>8} {'tot p95':>8} {'tot p99':>8} {'tot max':>8}")
+    lines = [header, "-" * len(header)]
+    for name, r in rows.items():
+        lines.append(
+            f"{name:<22} {r['count']:>6} {r['error_rate'] * 100:>6.1f} {r['late']:>5} "
+            f"{_ms(r['first_p50']):>8} {_ms(r['first_p95']):>8} {_ms(r['first_p99']):>8} "
+            f"{_ms(r['total_p50']):>8} {_ms(r['total_p95']):>8} {_ms(r['total_p99']):>8} {_ms(r['total_max']):>8}"
+        )
+    count = sum(r["count"] for r in rows.values())
+    lines += [
+        "",
+        f"commands: {count} in {elapsed:.2f}s ({count / elapsed:.1f}/s), max in flight {max_in_flight}",
+        f"wiki requests: {wiki_requests} ({wiki_requests / max(count, 1):.3f} per command), "
+        f"{wiki_bytes / 1e6:.1f} MB",
+        "latencies in ms; 1st = time to first response (defer or reply), "
+        f"late = first response after {INTERACTION_DEADLINE:.0f}s",
+    ]
+    return "\n".join(lines)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m bench.load", description="Concurrent-user slash command load test.")
+    parser.add_argument("--commands", default="events_all,events_zzz",
+                        help="Comma-separated commands to mix (no-argument commands and 'event')")
+    parser.add_argument("--concurrency", type=int, default=20, help="Closed loop: virtual users (default 20)")
+    parser.add_argument("--requests", type=int, default=1000, help="Closed loop: total commands (default 1000)")
+    parser.add_argument("--rate", type=float, help="Open loop: arrivals per second (enables open loop)")
+    parser.add_argument("--duration", type=float, default=10.0, help="Open loop: seconds of arrivals (default 10)")
+    parser.add_argument("--pages", type=int, default=300, help="Pages per game on the stand-ins (default 300)")
+    parser.add_argument("--latency", type=float, default=0.05, help="Wiki latency per request in seconds (default 0.05)")
+    parser.add_argument("--discord-latency", type=float, default=0.0, help="Simulated Discord API round trip in seconds")
+    parser.add_argument("--max-age", type=float, default=300.0,
+                        help="Snapshot freshness window in seconds; lower values force more refreshes (default 300)")
+    parser.add_argument("--warm", action="store_true", help="Load every snapshot before the run starts")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--log-level", default="ERROR", help="Log level during the run (default ERROR)")
+    return parser
+
+
+async def _run(args: argparse.Namespace) -> int:
+    stand_ins = {}
+    runners = []
+    for offset, (key, cfg) in enumerate(GAME_CONFIG.items()):
+        stand_in = WikiStandIn(synthetic_pages(args.pages, seed=args.seed + offset), category=cfg["category"],
+                               faults=Faults(latency=args.latency, seed=args.seed + offset))
+        runner, api_url = await start_stand_in(stand_in)
+        cfg["api_url"] = api_url
+        stand_ins[key] = stand_in
+        runners.append(runner)
+
+    client = commands.Bot(command_prefix="!", intents=discord.Intents.default())
+    register_game_commands(client)
+    commands_by_name = {}
+    for name in args.commands.split(","):
+        command = client.tree.get_command(name.strip(), guild=COMMAND_GUILD)
+        if command is None:
+            print(f"unknown command: {name}", file=sys.stderr)
+            return 2
+        commands_by_name[command.name] = command
+
+    SNAPSHOTS.max_age = args.max_age
+    try:
+        if args.warm:
+            await SNAPSHOTS.get_all()
+        for stand_in in stand_ins.values():
+            stand_in.reset_stats()
+
+        recorder = LoadRecorder()
+        start = time.perf_counter()
+        if args.rate:
+            await open_loop(recorder, commands_by_name, args.rate, args.duration, args.discord_latency, args.seed)
+        else:
+            await closed_loop(recorder, commands_by_name, args.concurrency, args.requests, args.discord_latency, args.seed)
+        elapsed = time.perf_counter() - start
+    finally:
+        for runner in runners:
+            await runner.cleanup()
+
+    print(format_report(
+        recorder.report(),
+        elapsed,
+        sum(s.stats.total_requests for s in stand_ins.values()),
+        sum(s.stats.bytes_sent for s in stand_ins.values()),
+        recorder.max_in_flight,
+    ))
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    setup_logging(level=args.log_level)
+    return asyncio.run(_run(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
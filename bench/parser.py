@@ -0,0 +1,182 @@
+# bench/parser.py - Parser micro-benchmarks over a checked-in corpus
+"""
+Throughput and correctness harness for the :class:`~api.wiki_api.WikiAPI`
+parsing helpers.
+
+The corpus (``bench/corpus/events.json``) holds representative event
+wikitext for the WuWa, ZZZ and Genshin Impact templates, covering GMT+8
+and UTC+8 offsets, ``none``/missing end dates, ``/YYYY-MM-DD`` subpage
+titles, every supported date format and the inputs the parser rejects.
+Each page and date string carries the reference parser's output.
+
+The correctness check runs first and must pass before any timing is
+reported: a faster parser has to reproduce every expected value,
+including today's quirks (e.g. ``time_end = null`` yields no dates).
+
+Usage::
+
+    python -m bench.parser                     # check, then time every function
+    python -m bench.parser --only parse_event_dates --min-time 2
+    python -m bench.parser --check-only        # correctness only, exit 1 on mismatch
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+from api import WikiAPI
+from api.filters import format_time_remaining
+
+DEFAULT_CORPUS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "corpus", "events.json")
+
+
+def load_corpus(path: str = DEFAULT_CORPUS) -> Dict:
+    with open(path, encoding="utf-8") as fh:
+        return json.load(fh)
+
+
+def _iso_dates(dates) -> Optional[List[str]]:
+    return None if dates is None else [dates[0].isoformat(), dates[1].isoformat()]
+
+
+def check(wiki: WikiAPI, corpus: Dict) -> List[str]:
+    """Compare the parser's output with every expected value in ``corpus``.
+
+    Returns:
+        List[str]: One line per mismatch; empty when everything matches.
+    """
+    reference_time = datetime.fromisoformat(corpus["reference_time"])
+    mismatches = []
+    for page in corpus["pages"]:
+        expected = page["expected"]
+        dates = wiki.parse_event_dates(page["content"], page["title"])
+        actual = {
+            "dates": _iso_dates(dates),
+            "name": wiki.get_clean_event_name(page["content"], page["title"]),
+            "time_remaining": None if dates is None else format_time_remaining(dates[1], now=reference_time),
+        }
+        for field, value in expected.items():
+            if actual[field] != value:
+                mismatches.append(f"{page['title']!r} {field}: expected {value!r}, got {actual[field]!r}")
+
+    for case in corpus["date_strings"]:
+        parsed = wiki.parse_datetime_from_wiki_format(case["input"])
+        actual = None if parsed is None else parsed.isoformat()
+        if actual != case["expected"]:
+            mismatches.append(f"date {case['input']!r}: expected {case['expected']!r}, got {actual!r}")
+    return mismatches
+
+
+def _benchmarks(wiki: WikiAPI, corpus: Dict) -> Dict[str, tuple]:
+    """Map benchmark name to ``(callable over the whole input list, item count, unit)``."""
+    pages = corpus["pages"]
+    date_strings = [case["input"] for case in corpus["date_strings"]]
+    end_dates = [
+        dates[1] for dates in (wiki.parse_event_dates(page["content"], page["title"]) for page in pages) if dates
+    ]
+
+    def parse_event_dates():
+        for page in pages:
+            wiki.parse_event_dates(page["content"], page["title"])
+
+    def get_clean_event_name():
+        for page in pages:
+            wiki.get_clean_event_name(page["content"], page["title"])
+
+    def parse_datetime_from_wiki_format():
+        for value in date_strings:
+            wiki.parse_datetime_from_wiki_format(value)
+
+    def get_time_remaining():
+        for end_date in end_dates:
+            wiki.get_time_remaining(end_date)
+
+    def parse_event():
+        for page in pages:
+            wiki.parse_event(page)
+
+    return {
+        "parse_event_dates": (parse_event_dates, len(pages), "pages"),
+        "get_clean_event_name": (get_clean_event_name, len(pages), "pages"),
+        "parse_datetime_from_wiki_format": (parse_datetime_from_wiki_format, len(date_strings), "strings"),
+        "get_time_remaining": (get_time_remaining, len(end_dates), "dates"),
+        "parse_event": (parse_event, len(pages), "pages"),
+    }
+
+
+def measure(func: Callable[[], None], items: int, min_time: float, repeat: int) -> float:
+    """Return the best throughput in items per second over ``repeat`` rounds.
+
+    Each round calls ``func`` (one pass over the corpus) until at least
+    ``min_time`` seconds have elapsed.
+    """
+    best = 0.0
+    for _ in range(repeat):
+        passes = 0
+        start = time.perf_counter()
+        elapsed = 0.0
+        while elapsed < min_time:
+            func()
+            passes += 1
+            elapsed = time.perf_counter() - start
+        best = max(best, passes * items / elapsed)
+    return best
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m bench.parser", description="Parser micro-benchmarks.")
+    parser.add_argument("--corpus", default=DEFAULT_CORPUS, help="Corpus JSON file")
+    parser.add_argument("--only", action="append", help="Benchmark only this function (repeatable)")
+    parser.add_argument("--min-time", type=float, default=0.5, help="Seconds per round (default 0.5)")
+    parser.add_argument("--repeat", type=int, default=5, help="Rounds per function; the best is reported (default 5)")
+    parser.add_argument("--check-only", action="store_true", help="Run the correctness check and exit")
+    parser.add_argument("--json", help="Also write throughput results to this file")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    corpus = load_corpus(args.corpus)
+    wiki = WikiAPI("fixture://", game="bench")
+
+    mismatches = check(wiki, corpus)
+    total = len(corpus["pages"]) + len(corpus["date_strings"])
+    if mismatches:
+        print(f"correctness: {len(mismatches)} mismatches", file=sys.stderr)
+        for line in mismatches:
+            print(f"  {line}", file=sys.stderr)
+        return 1
+    print(f"correctness: {total} cases ok", file=sys.stderr)
+    if args.check_only:
+        return 0
+
+    benchmarks = _benchmarks(wiki, corpus)
+    selected = args.only or list(benchmarks)
+    unknown = set(selected) - set(benchmarks)
+    if unknown:
+        print(f"unknown benchmark(s): {', '.join(sorted(unknown))}", file=sys.stderr)
+        return 2
+
+    results = {}
+    header = f"{'function':<32} {'items/s':>12} {'µs/item':>9}  unit"
+    print(header)
+    print("-" * len(header))
+    for name in selected:
+        func, items, unit = benchmarks[name]
+        rate = measure(func, items, args.min_time, args.repeat)
+        results[name] = {"per_second": rate, "unit": unit}
+        print(f"{name:<32} {rate:>12,.0f} {1e6 / rate:>9.2f}  {unit}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as fh:
+            json.dump(results, fh, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
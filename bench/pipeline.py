@@ -0,0 +1,220 @@
+# bench/pipeline.py - End-to-end event pipeline benchmark
+"""
+Benchmark :meth:`WikiAPI.get_ongoing_events_async` (enumerate → fetch →
+parse → filter → sort) against the local wiki stand-in.
+
+Every combination of category size and simulated per-request latency is
+one case. Each run of a case executes in a fresh child process, so peak
+RSS and event-loop lag belong to the pipeline alone; the stand-in runs
+in this process and counts requests and bytes.
+
+Reported per case: median wall time, requests, bytes transferred, peak
+RSS of the child, worst event-loop lag and the number of ongoing events
+found. Results are compared with a stored baseline; a case regresses
+when wall time or peak RSS grows by more than ``--tolerance``.
+
+Usage::
+
+    python -m bench.pipeline                          # 100 / 1k / 10k pages at 0 and 50 ms
+    python -m bench.pipeline --sizes 1000 --latency 0.02 --repeat 5
+    python -m bench.pipeline --update-baseline        # store results as the new baseline
+    python -m bench.pipeline --check                  # exit 1 on regression (for CI)
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import resource
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+from .wiki_server import Faults, WikiStandIn, start_stand_in, synthetic_pages
+
+DEFAULT_SIZES = (100, 1_000, 10_000)
+DEFAULT_LATENCIES = (0.0, 0.05)
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines", "pipeline.json")
+
+# Metrics compared against the baseline; lower is better for both.
+COMPARED = ("wall_s", "peak_rss_mb")
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KiB on Linux and bytes on macOS.
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _run_once(api_url: str) -> Dict:
+    """Child-process entry point: run the pipeline once and measure it."""
+    from api import WikiAPI
+    from metrics import LOOP_LAG_SECONDS, LoopLagMonitor
+
+    async def run() -> Dict:
+        monitor = LoopLagMonitor(interval=0.01, threshold=float("inf"))
+        watchdog = asyncio.create_task(monitor.run())
+        await asyncio.sleep(0)
+        start = time.perf_counter()
+        events = await WikiAPI(api_url, game="bench").get_ongoing_events_async()
+        wall = time.perf_counter() - start
+        watchdog.cancel()
+        # Bucket interpolation can overshoot the largest real observation.
+        lag_p99 = min(LOOP_LAG_SECONDS.quantile(0.99) or 0.0, monitor.max_lag)
+        return {
+            "wall_s": wall,
+            "events": len(events),
+            "lag_p99_ms": lag_p99 * 1000,
+            "lag_max_ms": monitor.max_lag * 1000,
+        }
+
+    result = asyncio.run(run())
+    result["peak_rss_mb"] = _peak_rss_mb()
+    return result
+
+
+def case_name(pages: int, latency: float) -> str:
+    return f"{pages}p@{latency * 1000:g}ms"
+
+
+async def run_case(pages: int, latency: float, repeat: int, seed: int = 0) -> Dict:
+    """Serve ``pages`` synthetic pages with ``latency`` and benchmark ``repeat`` runs.
+
+    Returns:
+        Dict: ``wall_s`` (median), ``wall_min_s``, ``requests`` and
+        ``bytes`` (per run), ``peak_rss_mb`` and ``lag_max_ms`` (worst
+        run), ``lag_p99_ms`` (median) and ``events``.
+    """
+    stand_in = WikiStandIn(synthetic_pages(pages, seed=seed), faults=Faults(latency=latency, seed=seed))
+    runner, api_url = await start_stand_in(stand_in)
+    loop = asyncio.get_running_loop()
+    runs: List[Dict] = []
+    try:
+        for _ in range(repeat):
+            stand_in.reset_stats()
+            # A fresh process per run keeps ru_maxrss and the lag histogram per-run.
+            with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as pool:
+                result = await loop.run_in_executor(pool, _run_once, api_url)
+            result["requests"] = stand_in.stats.total_requests
+            result["bytes"] = stand_in.stats.bytes_sent
+            runs.append(result)
+    finally:
+        await runner.cleanup()
+
+    return {
+        "pages": pages,
+        "latency_ms": latency * 1000,
+        "wall_s": statistics.median(r["wall_s"] for r in runs),
+        "wall_min_s": min(r["wall_s"] for r in runs),
+        "requests": runs[-1]["requests"],
+        "bytes": runs[-1]["bytes"],
+        "peak_rss_mb": max(r["peak_rss_mb"] for r in runs),
+        "lag_p99_ms": statistics.median(r["lag_p99_ms"] for r in runs),
+        "lag_max_ms": max(r["lag_max_ms"] for r in runs),
+        "events": runs[-1]["events"],
+    }
+
+
+def compare(results: Dict[str, Dict], baseline: Dict[str, Dict], tolerance: float) -> Dict[str, List[str]]:
+    """Return, per case, the compared metrics that regressed beyond ``tolerance``."""
+    regressions: Dict[str, List[str]] = {}
+    for name, result in results.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+        worse = [metric for metric in COMPARED if base.get(metric) and result[metric] > base[metric] * (1 + tolerance)]
+        if worse:
+            regressions[name] = worse
+    return regressions
+
+
+def _delta(value: float, base: Optional[float]) -> str:
+    if not base:
+        return "     new"
+    return f"{(value / base - 1) * 100:>+7.1f}%"
+
+
+def format_report(results: Dict[str, Dict], baseline: Dict[str, Dict], regressions: Dict[str, List[str]]) -> str:
+    header = (f"{'case':<16} {'wall s':>8} {'Δwall':>8} {'reqs':>6} {'MB sent':>8} {'RSS MB':>7} {'ΔRSS':>8} "
+              f"{'lag p99':>8} {'lag max':>8} {'events':>7}")
+    lines = [header, "-" * len(header)]
+    for name, r in results.items():
+        base = baseline.get(name, {})
+        flag = "  REGRESSION: " + ", ".join(regressions[name]) if name in regressions else ""
+        lines.append(
+            f"{name:<16} {r['wall_s']:>8.3f} {_delta(r['wall_s'], base.get('wall_s')):>8} {r['requests']:>6} "
+            f"{r['bytes'] / 1e6:>8.2f} {r['peak_rss_mb']:>7.1f} {_delta(r['peak_rss_mb'], base.get('peak_rss_mb')):>8} "
+            f"{r['lag_p99_ms']:>8.1f} {r['lag_max_ms']:>8.1f} {r['events']:>7}{flag}"
+        )
+    return "\n".join(lines)
+
+
+def load_baseline(path: str) -> Dict[str, Dict]:
+    try:
+        with open(path, encoding="utf-8") as fh:
+            return json.load(fh).get("cases", {})
+    except FileNotFoundError:
+        return {}
+
+
+def save_baseline(path: str, results: Dict[str, Dict]) -> None:
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    document = {
+        "recorded_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "platform": sys.platform,
+        "cases": results,
+    }
+    with open(path, "w", encoding="utf-8") as fh:
+        json.dump(document, fh, indent=2)
+        fh.write("\n")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m bench.pipeline", description="End-to-end event pipeline benchmark.")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)), help="Comma-separated page counts")
+    parser.add_argument("--latency", default=",".join(map(str, DEFAULT_LATENCIES)),
+                        help="Comma-separated per-request latencies in seconds")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per case; wall time is the median (default 3)")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the synthetic pages")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline JSON file")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed growth before a regression (default 0.2)")
+    parser.add_argument("--update-baseline", action="store_true", help="Write these results as the new baseline")
+    parser.add_argument("--check", action="store_true", help="Exit with status 1 if any case regressed")
+    parser.add_argument("--json", help="Also write the results to this file")
+    return parser
+
+
+async def _run(args: argparse.Namespace) -> Dict[str, Dict]:
+    results = {}
+    for pages in (int(size) for size in args.sizes.split(",")):
+        for latency in (float(value) for value in args.latency.split(",")):
+            name = case_name(pages, latency)
+            print(f"running {name} ...", file=sys.stderr)
+            results[name] = await run_case(pages, latency, args.repeat, args.seed)
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    results = asyncio.run(_run(args))
+    baseline = load_baseline(args.baseline)
+    regressions = compare(results, baseline, args.tolerance)
+    print(format_report(results, baseline, regressions))
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as fh:
+            json.dump(results, fh, indent=2)
+    if args.update_baseline:
+        save_baseline(args.baseline, {**baseline, **results})
+        print(f"baseline written to {args.baseline}", file=sys.stderr)
+    return 1 if args.check and regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,396 @@
+# bench/wiki_server.py - Local MediaWiki stand-in for offline benchmarks
+"""
+A local aiohttp server implementing the parts of ``api.php`` the bot uses.
+
+Supported queries (``GET /api.php``):
+
+* ``list=categorymembers`` with ``cmtitle``, ``cmlimit`` (max 500) and
+  ``cmcontinue`` pagination, and the same as ``generator=categorymembers``
+  (``gcm*`` parameters) with ``prop=info`` revision IDs;
+* ``prop=info`` and ``prop=revisions`` (``rvslots=main`` content) with up
+  to 50 ``|``-separated ``titles``;
+* ``meta=siteinfo`` (used by ``/test_network``).
+
+Pages come from a recorded fixture (see :mod:`api.fixtures`), optionally
+repeated to reach a target size, or from :func:`synthetic_pages`, which
+mixes the WuWa, ZZZ and Genshin event templates with ongoing, ended,
+upcoming and open-ended events.
+
+:class:`Faults` injects latency, hung requests (timeouts), HTTP 429 and
+truncated JSON. Fault decisions come from a seeded RNG, so a sequential
+client sees the same faults on every run. :class:`ServerStats` counts
+requests, bytes and injected faults for benchmark reports.
+
+Run standalone::
+
+    python -m bench.wiki_server --pages 1000 --latency 0.05 --rate-limit 0.02
+    python -m bench.wiki_server --fixture fixtures/zzz.json --pages 5000
+
+then point a :class:`~api.wiki_api.WikiAPI` at the printed URL.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+
+from aiohttp import web
+
+from api.fixtures import load_fixture
+
+MAX_CMLIMIT = 500
+MAX_TITLES = 50
+
+_WUWA_TEMPLATE = """{{{{Event Infobox
+|name = {name}
+|image = {slug}.png
+|type = {kind}
+|time_start = {start:%Y-%m-%d %H:%M}
+|time_end = {end}
+}}}}
+'''{name}''' is a limited-time [[Events|event]] in [[Wuthering Waves]].
+{body}
+"""
+
+_ZZZ_TEMPLATE = """{{{{Infobox Event
+|name = {name}
+|type = {kind}
+|time_start = {start:%Y-%m-%d %H:%M:%S}
+|time_end = {end}
+|time_start_offset = GMT+8
+|version = 1.{minor}
+}}}}
+'''{name}''' is an in-game event in [[Zenless Zone Zero]].
+{body}
+"""
+
+_GENSHIN_TEMPLATE = """{{{{Event
+|type = {kind}
+|time_start = {start:%B %d, %Y}
+|time_end = {end}
+}}}}
+'''{name}''' is a [[Events|limited-time event]].
+{body}
+"""
+
+_BODY_LINE = "* Complete [[{topic}]] challenges during the event to earn [[{reward}]] ×{count}.\n"
+_TOPICS = ("Tower of Adversity", "Shiyu Defense", "Spiral Abyss", "Tactical Hologram", "Hollow Zero", "Illusive Realm")
+_REWARDS = ("Astrite", "Polychrome", "Primogem", "Shell Credit", "Mora", "Lustrous Tide")
+_KINDS = ("In-Game", "Web", "Login", "Combat", "Exploration")
+_WORDS = ("Summer", "Echoes", "Starlit", "Ripple", "Overture", "Verdant", "Hollow", "Lament", "Tidal", "Ember",
+          "Festival", "Trials", "Waltz", "Frontier", "Gleam", "Dreams")
+
+
+def synthetic_pages(count: int, seed: int = 0, now: Optional[datetime] = None) -> List[Dict]:
+    """Generate ``count`` realistic event pages.
+
+    Pages cycle through the WuWa, ZZZ and Genshin templates. About 40 % are
+    ongoing at ``now``, 10 % have ``time_end = none`` and ZZZ pages use
+    ``/YYYY-MM-DD`` subpage titles with a GMT+8 offset.
+
+    Args:
+        count (int): Number of pages.
+        seed (int): RNG seed; the same seed always yields the same pages.
+        now (Optional[datetime]): Reference time (default: current UTC time).
+
+    Returns:
+        List[Dict]: Page dicts with ``"title"``, ``"pageid"`` and ``"content"``.
+    """
+    rng = random.Random(seed)
+    now = (now or datetime.now(timezone.utc)).replace(tzinfo=None, second=0, microsecond=0)
+    pages = []
+    for index in range(count):
+        name = f"{rng.choice(_WORDS)} {rng.choice(_WORDS)} {index}"
+        roll = rng.random()
+        if roll < 0.4:
+            start = now - timedelta(days=rng.uniform(0, 14))
+            end = now + timedelta(days=rng.uniform(0.1, 21))
+        elif roll < 0.8:
+            end = now - timedelta(days=rng.uniform(0.1, 365))
+            start = end - timedelta(days=rng.uniform(3, 42))
+        else:
+            start = now + timedelta(days=rng.uniform(0.5, 30))
+            end = start + timedelta(days=rng.uniform(3, 42))
+        body = "".join(
+            _BODY_LINE.format(topic=rng.choice(_TOPICS), reward=rng.choice(_REWARDS), count=rng.randint(1, 160))
+            for _ in range(rng.randint(5, 40))
+        )
+        fields = {"name": name, "slug": name.replace(" ", "_"), "kind": rng.choice(_KINDS), "body": body,
+                  "start": start, "minor": rng.randint(0, 7)}
+        style = index % 3
+        if style == 0:
+            fields["end"] = "none" if rng.random() < 0.1 else f"{end:%Y-%m-%d %H:%M}"
+            title, content = name, _WUWA_TEMPLATE.format(**fields)
+        elif style == 1:
+            fields["start"] = start + timedelta(hours=8)
+            fields["end"] = "none" if rng.random() < 0.1 else f"{end + timedelta(hours=8):%Y-%m-%d %H:%M:%S}"
+            title, content = f"{name}/{start:%Y-%m-%d}", _ZZZ_TEMPLATE.format(**fields)
+        else:
+            fields["end"] = "none" if rng.random() < 0.1 else f"{end:%B %d, %Y}"
+            title, content = name, _GENSHIN_TEMPLATE.format(**fields)
+        pages.append({"title": title, "pageid": 10_000 + index, "content": content})
+    return pages
+
+
+def scale_pages(pages: List[Dict], count: int) -> List[Dict]:
+    """Repeat recorded ``pages`` (with unique titles and ids) until there are ``count``."""
+    if not pages or count <= len(pages):
+        return list(pages[:count]) if count else list(pages)
+    scaled = []
+    for index in range(count):
+        page = pages[index % len(pages)]
+        copy = index // len(pages)
+        scaled.append({
+            "title": page["title"] if copy == 0 else f"{page['title']} (copy {copy})",
+            "pageid": 1_000_000 * copy + (page.get("pageid") or index),
+            "content": page["content"],
+        })
+    return scaled
+
+
+class Faults:
+    """Fault and latency injection settings.
+
+    Each request first waits ``latency`` plus up to ``jitter`` seconds,
+    then at most one fault is chosen with the given probabilities.
+
+    Attributes:
+        latency (float): Base delay per request in seconds.
+        jitter (float): Extra uniformly distributed delay in seconds.
+        timeout_rate (float): Probability of holding the request for
+            ``hang_seconds`` (longer than the client's timeout).
+        rate_limit_rate (float): Probability of answering ``429`` with
+            ``Retry-After``.
+        truncate_rate (float): Probability of cutting the JSON body in half.
+        hang_seconds (float): How long a "timed out" request is held.
+        seed (int): Seed for the fault RNG.
+    """
+
+    def __init__(self, latency: float = 0.0, jitter: float = 0.0, timeout_rate: float = 0.0,
+                 rate_limit_rate: float = 0.0, truncate_rate: float = 0.0, hang_seconds: float = 120.0,
+                 seed: int = 0):
+        self.latency = latency
+        self.jitter = jitter
+        self.timeout_rate = timeout_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.truncate_rate = truncate_rate
+        self.hang_seconds = hang_seconds
+        self.seed = seed
+
+
+class ServerStats:
+    """Counters collected by :class:`WikiStandIn`.
+
+    Attributes:
+        requests (Counter): Requests per query kind (``"categorymembers"``,
+            ``"info"``, ``"revisions"``, ``"siteinfo"``, ``"invalid"``).
+        faults (Counter): Injected faults per kind (``"timeout"``,
+            ``"rate_limit"``, ``"truncated"``).
+        bytes_sent (int): Response body bytes written.
+    """
+
+    def __init__(self):
+        self.requests: Counter = Counter()
+        self.faults: Counter = Counter()
+        self.bytes_sent = 0
+
+    @property
+    def total_requests(self) -> int:
+        return sum(self.requests.values())
+
+    def as_dict(self) -> Dict:
+        return {"requests": dict(self.requests), "faults": dict(self.faults), "bytes_sent": self.bytes_sent}
+
+
+class WikiStandIn:
+    """Serve a fixed set of pages through a MediaWiki-compatible ``api.php``.
+
+    Attributes:
+        pages (List[Dict]): Pages in category order.
+        category (str): Category name (without ``Category:``) that lists them.
+        faults (Faults): Injection settings; may be changed between runs.
+        stats (ServerStats): Counters since the last :meth:`reset_stats`.
+    """
+
+    def __init__(self, pages: List[Dict], category: str = "Events", faults: Optional[Faults] = None):
+        self.pages = pages
+        self.category = category
+        self.faults = faults or Faults()
+        self.stats = ServerStats()
+        self._by_title = {page["title"]: page for page in pages}
+        self._rng = random.Random(self.faults.seed)
+
+    def reset_stats(self) -> None:
+        """Zero the counters and reseed the fault RNG."""
+        self.stats = ServerStats()
+        self._rng = random.Random(self.faults.seed)
+
+    def app(self) -> web.Application:
+        """Build the aiohttp application serving ``/api.php``."""
+        application = web.Application()
+        application.router.add_get("/api.php", self._handle)
+        return application
+
+    # ----------------------------------------------------------------- #
+    #  Query handlers                                                   #
+    # ----------------------------------------------------------------- #
+
+    @staticmethod
+    def _info(page: Dict) -> Dict:
+        # Pages without a recorded revision ID use their page ID, which is stable.
+        return {"pageid": page["pageid"], "ns": 0, "title": page["title"],
+                "lastrevid": page.get("revid") or page["pageid"], "length": len(page["content"])}
+
+    def _categorymembers(self, query) -> Dict:
+        generator = query.get("generator") == "categorymembers"
+        prefix = "gcm" if generator else "cm"
+        if query.get(f"{prefix}title") != f"Category:{self.category}":
+            return {"batchcomplete": ""} if generator else {"batchcomplete": "", "query": {"categorymembers": []}}
+        limit = min(int(query.get(f"{prefix}limit", "10")), MAX_CMLIMIT)
+        offset = int(query.get(f"{prefix}continue", "page|0").rpartition("|")[2])
+        window = self.pages[offset:offset + limit]
+        if generator:
+            data: Dict = {"batchcomplete": "", "query": {"pages": {str(page["pageid"]): self._info(page) for page in window}}}
+        else:
+            members = [{"pageid": page["pageid"], "ns": 0, "title": page["title"]} for page in window]
+            data = {"batchcomplete": "", "query": {"categorymembers": members}}
+        if offset + limit < len(self.pages):
+            data["continue"] = {f"{prefix}continue": f"page|{offset + limit}",
+                                "continue": "gcmcontinue||" if generator else "-||"}
+        return data
+
+    def _page_info(self, query) -> Dict:
+        titles = query.get("titles", "").split("|")
+        if len(titles) > MAX_TITLES:
+            return {"error": {"code": "toomanyvalues", "info": f"Too many values supplied for parameter \"titles\". The limit is {MAX_TITLES}."}}
+        pages: Dict[str, Dict] = {}
+        for missing, title in enumerate(titles, start=1):
+            page = self._by_title.get(title)
+            if page is None:
+                pages[str(-missing)] = {"ns": 0, "title": title, "missing": ""}
+            else:
+                pages[str(page["pageid"])] = self._info(page)
+        return {"batchcomplete": "", "query": {"pages": pages}}
+
+    def _revisions(self, query) -> Dict:
+        titles = query.get("titles", "").split("|")
+        if len(titles) > MAX_TITLES:
+            return {"error": {"code": "toomanyvalues", "info": f"Too many values supplied for parameter \"titles\". The limit is {MAX_TITLES}."}}
+        pages: Dict[str, Dict] = {}
+        for missing, title in enumerate(titles, start=1):
+            page = self._by_title.get(title)
+            if page is None:
+                pages[str(-missing)] = {"ns": 0, "title": title, "missing": ""}
+                continue
+            pages[str(page["pageid"])] = {
+                "pageid": page["pageid"],
+                "ns": 0,
+                "title": title,
+                "revisions": [{
+                    "revid": page.get("revid") or page["pageid"],
+                    "slots": {"main": {"contentmodel": "wikitext", "contentformat": "text/x-wiki", "*": page["content"]}},
+                }],
+            }
+        return {"batchcomplete": "", "query": {"pages": pages}}
+
+    @staticmethod
+    def _siteinfo() -> Dict:
+        return {"batchcomplete": "", "query": {"general": {"sitename": "Gacha Reminder stand-in", "generator": "MediaWiki 1.39.3"}}}
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        query = request.query
+        if "categorymembers" in (query.get("list"), query.get("generator")):
+            kind, build = "categorymembers", self._categorymembers
+        elif query.get("prop") == "revisions":
+            kind, build = "revisions", self._revisions
+        elif query.get("prop") == "info":
+            kind, build = "info", self._page_info
+        elif query.get("meta") == "siteinfo":
+            kind, build = "siteinfo", lambda _: self._siteinfo()
+        else:
+            kind, build = "invalid", lambda _: {"error": {"code": "badquery", "info": "Unsupported query"}}
+        self.stats.requests[kind] += 1
+
+        faults = self.faults
+        delay = faults.latency + (self._rng.uniform(0, faults.jitter) if faults.jitter else 0.0)
+        roll = self._rng.random()
+        if delay:
+            await asyncio.sleep(delay)
+
+        if roll < faults.timeout_rate:
+            self.stats.faults["timeout"] += 1
+            await asyncio.sleep(faults.hang_seconds)
+        elif roll < faults.timeout_rate + faults.rate_limit_rate:
+            self.stats.faults["rate_limit"] += 1
+            body = b'{"error":{"code":"ratelimited","info":"You\'ve exceeded your rate limit."}}'
+            self.stats.bytes_sent += len(body)
+            return web.Response(status=429, body=body, content_type="application/json", headers={"Retry-After": "1"})
+
+        body = json.dumps(build(query), ensure_ascii=False).encode("utf-8")
+        if faults.timeout_rate + faults.rate_limit_rate <= roll < faults.timeout_rate + faults.rate_limit_rate + faults.truncate_rate:
+            self.stats.faults["truncated"] += 1
+            body = body[:len(body) // 2]
+        self.stats.bytes_sent += len(body)
+        return web.Response(body=body, content_type="application/json")
+
+
+async def start_stand_in(stand_in: WikiStandIn, host: str = "127.0.0.1", port: int = 0) -> tuple:
+    """Start serving ``stand_in`` and return ``(runner, api_url)``.
+
+    ``port=0`` picks a free port. Call ``await runner.cleanup()`` to stop.
+    """
+    runner = web.AppRunner(stand_in.app(), access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, host, port)
+    await site.start()
+    bound_port = site._server.sockets[0].getsockname()[1]  # type: ignore[union-attr]
+    return runner, f"http://{host}:{bound_port}/api.php"
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m bench.wiki_server", description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--pages", type=int, default=100, help="Number of pages to serve (default 100)")
+    parser.add_argument("--fixture", help="Replay an api.fixtures JSON file, repeated up to --pages")
+    parser.add_argument("--category", default="Events", help="Category name the pages are listed in")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for synthetic pages and faults")
+    parser.add_argument("--latency", type=float, default=0.0, help="Base delay per request in seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Extra random delay per request in seconds")
+    parser.add_argument("--timeout", type=float, default=0.0, dest="timeout_rate", help="Fraction of requests that hang")
+    parser.add_argument("--hang", type=float, default=120.0, help="Seconds a hanging request is held (default 120)")
+    parser.add_argument("--rate-limit", type=float, default=0.0, dest="rate_limit_rate", help="Fraction of requests answered with 429")
+    parser.add_argument("--truncate", type=float, default=0.0, dest="truncate_rate", help="Fraction of responses with truncated JSON")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8090)
+    return parser
+
+
+async def _serve(args: argparse.Namespace) -> None:
+    if args.fixture:
+        pages = scale_pages(load_fixture(args.fixture)["pages"], args.pages)
+    else:
+        pages = synthetic_pages(args.pages, seed=args.seed)
+    faults = Faults(args.latency, args.jitter, args.timeout_rate, args.rate_limit_rate, args.truncate_rate,
+                    args.hang, args.seed)
+    stand_in = WikiStandIn(pages, args.category, faults)
+    runner, url = await start_stand_in(stand_in, args.host, args.port)
+    print(f"Serving {len(pages)} pages in Category:{args.category} at {url}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        print(json.dumps(stand_in.stats.as_dict()))
+        await runner.cleanup()
+
+
+def main() -> None:
+    try:
+        asyncio.run(_serve(build_parser().parse_args()))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -2,13 +2,15 @@
 """
 Command registration package for the Gacha Reminder bot.
 
-Exports the two registration functions that attach all slash commands
+Exports the registration functions that attach all slash commands
 to the bot's application command tree:
 
 * :func:`register_game_commands` — user-facing event commands.
 * :func:`register_dev_commands`  — developer/diagnostic commands.
+* :func:`register_subscription_commands` — reminder subscription commands.
 """
 from .game_commands import register_game_commands
 from .dev_commands  import register_dev_commands
+from .subscription_commands import register_subscription_commands
 
-__all__ = ["register_game_commands", "register_dev_commands"]
\ No newline at end of file
+__all__ = ["register_game_commands", "register_dev_commands", "register_subscription_commands"]
\ No newline at end of file
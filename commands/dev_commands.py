@@ -9,23 +9,109 @@ dev command registration.
 Registered commands:
 * ``/events_debug``      — WUWA events with verbose debug output (via games.wuwa)
 * ``/events_debug_zzz``  — ZZZ events with verbose debug output (via games.zzz)
+* ``/diagnose``          — Any game's wiki: category sizes, parse coverage and unparseable date formats.
 * ``/diagnose_zzz``      — ZZZ wiki category diagnosis (via games.zzz)
 * ``/test_zzz_parsing``  — ZZZ date parsing test (via games.zzz)
 * ``/test_2025_event``   — ZZZ 2025 subpage test (via games.zzz)
 * ``/search_recent_zzz`` — ZZZ event browser (via games.zzz)
-* ``/test_network``      — Connectivity check for all wiki APIs.
+* ``/test_network``      — Concurrent repeated latency probes of all wiki APIs.
+* ``/sync_commands``     — Force-upload the application command tree.
+* ``/stats``             — Pipeline stage latency percentiles, error counts and page cache usage.
+* ``/loop_lag``          — Event-loop lag percentiles and the worst blocking stalls.
+* ``/profile_pipeline``  — cProfile one game's fetch, parse and render; attaches the pstats file.
 """
 from __future__ import annotations
 
-import time
-import aiohttp
+import asyncio
+import io
+import logging
+import os
+from collections import Counter
+from typing import Dict, Optional
+
 import discord
+from discord import app_commands
 
-from config import GUILD_OBJECT
-from embeds import build_error_embed
+from api import PAGE_CACHE, FixtureWikiAPI, diagnose_wiki, RecordingWikiAPI, save_fixture
+from api.probe import probe_hosts, summarize
+from config import FIXTURE_DIR, GUILD_OBJECT
+from embeds import EventPages, build_error_embed, send_error
 from games import GAME_CONFIG
+from metrics import (
+    LOOP_LAG_SECONDS, LOOP_MONITOR, LOOP_STALLS,
+    profile_async, pstats_bytes, stage_summary, top_functions,
+)
 from games.wuwa.dev_commands import register_wuwa_dev_commands
 from games.zzz.dev_commands import register_zzz_dev_commands
+from .sync import sync_command_tree
+
+logger = logging.getLogger(__name__)
+
+
+def _format_ms(seconds: Optional[float]) -> str:
+    return "-" if seconds is None else f"{seconds * 1000:.1f}"
+
+
+def _stack_tail(stack: str, limit: int = 1000) -> str:
+    # Keep the innermost frames, which is where the loop was blocked.
+    tail = stack.rstrip()[-limit:]
+    return "```\n" + (tail or "stack not captured") + "\n```"
+
+
+def _format_probe(result: Dict, probes: int) -> str:
+    ok_cold, ok_pooled = len(result["cold"]), len(result["pooled"])
+    if ok_cold == probes and ok_pooled == probes:
+        status = "✅"
+    elif ok_cold or ok_pooled:
+        status = "⚠️"
+    else:
+        status = "❌"
+    lines = [f"{status} {ok_cold}/{probes} cold · {ok_pooled}/{probes} pooled"]
+    if result["errors"]:
+        counts = Counter(result["errors"])
+        lines.append("Errors: " + ", ".join(f"{error} ×{n}" for error, n in counts.most_common(3)))
+
+    table = [f"{'':<7}{'p50':>7}{'p95':>7}{'max':>7}"]
+    for mode in ("cold", "pooled"):
+        stats = summarize(result[mode])
+        table.append(f"{mode:<7}" + "".join(f"{_format_ms(stats[key]):>7}" for key in ("p50", "p95", "max")))
+    lines.append("```\n" + "\n".join(table) + "\n```")
+
+    if result["cold"]:
+        phases = " · ".join(
+            f"{label} {_format_ms(summarize(result['cold'], phase)['p50'])}"
+            for label, phase in (("DNS", "dns"), ("TCP", "tcp"), ("TLS", "tls"), ("first byte", "first_byte"))
+        )
+        lines.append(f"Cold p50: {phases}")
+    if result["pooled"]:
+        lines.append(f"Pooled p50: first byte {_format_ms(summarize(result['pooled'], 'first_byte')['p50'])}")
+    return "\n".join(lines)
+
+
+def _format_diagnosis(report: Dict, configured: str) -> Dict[str, str]:
+    categories = "\n".join(
+        f"{'✅' if isinstance(size, int) and size else '❌'} `{name}`: "
+        + (f"{size} pages" if isinstance(size, int) else size)
+        + (" (configured)" if name == configured else "")
+        for name, size in report["categories"].items()
+    )
+    sampled = report["sampled"]
+    share = report["parsed"] / sampled if sampled else 0.0
+    coverage = f"{report['parsed']}/{sampled} sampled pages parse ({share:.0%})"
+    if report["sampled_category"] and report["sampled_category"] != configured:
+        coverage += f"\nSampled `{report['sampled_category']}` because `{configured}` is empty or failed"
+    unparsed = "\n".join(
+        f"`{reason}` ×{entry['count']} — e.g. {entry['example']}"
+        for reason, entry in list(report["unparsed"].items())[:8]
+    )
+    timings = report["timings"]
+    return {
+        "Categories": categories,
+        "Parse coverage": coverage,
+        "Unparseable pages by date format": (unparsed or "None")[:1024],
+        "Timing": (f"enumerate {timings['enumerate'] * 1000:.0f} ms · fetch {timings['fetch'] * 1000:.0f} ms "
+                   f"· parse {timings['parse'] * 1000:.1f} ms"),
+    }
 
 
 def register_dev_commands(client) -> None:
@@ -34,40 +120,214 @@ def register_dev_commands(client) -> None:
 
     @client.tree.command(
         name="test_network",
-        description="[DEV] Test network connectivity to all wiki APIs",
+        description="[DEV] Probe every wiki API repeatedly and report latency percentiles",
         guild=GUILD_OBJECT,
     )
-    async def test_network(interaction: discord.Interaction) -> None:
+    @app_commands.describe(probes="Requests per host and mode (default 5)")
+    async def test_network(interaction: discord.Interaction, probes: app_commands.Range[int, 1, 20] = 5) -> None:
         await interaction.response.defer()
-        embed = discord.Embed(title="Network Test Results", color=discord.Color.blue())
-
         try:
-            test_params = {"action": "query", "format": "json", "meta": "siteinfo"}
-            async with aiohttp.ClientSession() as session:
-                for game_key, cfg in GAME_CONFIG.items():
-                    start = time.time()
-                    try:
-                        async with session.get(cfg["api_url"], params=test_params) as resp:
-                            data = await resp.json()
-                        elapsed = round(time.time() - start, 3)
-                        status = "✅ Connected" if "query" in data else "⚠️ Partial"
-                        embed.add_field(
-                            name=f"{cfg['emoji']} {cfg['display_name']}",
-                            value=f"Status: {status}\nResponse: {elapsed}s",
-                            inline=True,
-                        )
-                    except Exception as exc:
-                        print(f"[test_network] {cfg['display_name']}: {exc}")
-                        embed.add_field(
-                            name=f"{cfg['emoji']} {cfg['display_name']}",
-                            value=f"Status: ❌ Failed\nError: {type(exc).__name__}",
-                            inline=True,
-                        )
-        except Exception as exc:
-            print(f"[test_network] {exc}")
+            results = await probe_hosts({key: cfg["api_url"] for key, cfg in GAME_CONFIG.items()}, count=probes)
+            embed = discord.Embed(
+                title="Network Test Results",
+                description=f"{probes} cold (new connection) and {probes} pooled (keep-alive) `siteinfo` requests per wiki, all wikis in parallel.",
+                color=discord.Color.blue(),
+            )
+            for game_key, result in results.items():
+                embed.add_field(
+                    name=GAME_CONFIG[game_key]["display_name"],
+                    value=_format_probe(result, probes),
+                    inline=False,
+                )
+            embed.set_footer(text="Latencies in ms • TLS = connection set-up minus a bare TCP connect")
+        except Exception:
+            logger.exception("/test_network failed")
             embed = build_error_embed(
                 title="Network Test Failed",
                 description="Network test encountered an error. Check console for details.",
             )
 
-        await interaction.followup.send(embed=embed)
\ No newline at end of file
+        await interaction.followup.send(embed=embed)
+
+    @client.tree.command(
+        name="diagnose",
+        description="[DEV] Diagnose a game's wiki categories and how many pages parse",
+        guild=GUILD_OBJECT,
+    )
+    @app_commands.describe(game="Game to diagnose", sample="Pages to fetch and parse (default 50)")
+    @app_commands.choices(game=[app_commands.Choice(name=cfg["display_name"], value=key) for key, cfg in GAME_CONFIG.items()])
+    async def diagnose(interaction: discord.Interaction, game: str, sample: app_commands.Range[int, 1, 50] = 50) -> None:
+        cfg = GAME_CONFIG[game]
+        try:
+            await interaction.response.defer()
+            report = await diagnose_wiki(cfg["api_url"], cfg["category"], game=game, sample_size=sample)
+            embed = discord.Embed(
+                title=f"Wiki Diagnosis — {cfg['display_name']}",
+                description="Candidate categories sized in parallel; an even sample fetched in one batched request.",
+                color=cfg["color"],
+            )
+            for name, value in _format_diagnosis(report, cfg["category"]).items():
+                embed.add_field(name=name, value=value, inline=False)
+            embed.set_footer(text="Date formats: digits → 9, words → A")
+            await interaction.followup.send(embed=embed)
+        except Exception:
+            logger.exception("/diagnose failed")
+            await send_error(interaction, "Diagnosis failed. Check console for details.")
+
+    @client.tree.command(
+        name="sync_commands",
+        description="[DEV] Force-sync the slash command tree to Discord",
+        guild=GUILD_OBJECT,
+    )
+    async def sync_commands(interaction: discord.Interaction) -> None:
+        try:
+            await interaction.response.defer(ephemeral=True)
+            results = await sync_command_tree(interaction.client, force=True)
+            lines = [f"**{scope}**: synced {count} commands" for scope, count in results.items()]
+            await interaction.followup.send("\n".join(lines), ephemeral=True)
+        except Exception:
+            logger.exception("/sync_commands failed")
+            await interaction.followup.send(
+                embed=build_error_embed("Sync Failed", "Command sync encountered an error. Check console for details."),
+                ephemeral=True,
+            )
+
+    @client.tree.command(
+        name="stats",
+        description="[DEV] Show pipeline stage latency percentiles",
+        guild=GUILD_OBJECT,
+    )
+    @app_commands.describe(game="Only show one game (default: all)")
+    @app_commands.choices(game=[app_commands.Choice(name=cfg["display_name"], value=key) for key, cfg in GAME_CONFIG.items()])
+    async def stats(interaction: discord.Interaction, game: Optional[str] = None) -> None:
+        try:
+            rows = stage_summary(game)
+            embed = discord.Embed(title="Pipeline Stage Latency", color=discord.Color.blue())
+            if not rows:
+                embed.description = "No measurements recorded yet."
+            else:
+                header = f"{'stage':<13} {'game':<13} {'n':>6} {'err':>4} {'p50':>8} {'p95':>8} {'p99':>8}"
+                lines = [header, "-" * len(header)] + [
+                    f"{r['stage']:<13} {r['game'][:13]:<13} {r['count']:>6} {r['errors']:>4} "
+                    f"{_format_ms(r['p50']):>8} {_format_ms(r['p95']):>8} {_format_ms(r['p99']):>8}"
+                    for r in rows
+                ]
+                embed.description = "```\n" + "\n".join(lines)[:4000] + "\n```"
+            cache = PAGE_CACHE.stats()
+            lookups = cache["hits"] + cache["misses"]
+            embed.add_field(
+                name="Page cache",
+                value=(f"{cache['entries']} pages · {cache['bytes'] / 1e6:.1f} / {cache['max_bytes'] / 1e6:.0f} MB · "
+                       f"{cache['hits'] / lookups if lookups else 0:.0%} hits · {cache['evictions']} evictions"),
+                inline=False,
+            )
+            embed.set_footer(text="Latencies in ms, estimated from histogram buckets • Full data at /metrics on the web server")
+            await interaction.response.send_message(embed=embed)
+        except Exception:
+            logger.exception("/stats failed")
+            await send_error(interaction, "Failed to collect stats.")
+
+    @client.tree.command(
+        name="loop_lag",
+        description="[DEV] Show event-loop lag and the worst blocking stalls",
+        guild=GUILD_OBJECT,
+    )
+    async def loop_lag(interaction: discord.Interaction) -> None:
+        try:
+            embed = discord.Embed(title="Event Loop Lag", color=discord.Color.blue())
+            if not LOOP_MONITOR.running:
+                embed.description = "The loop lag monitor is not running."
+            else:
+                stalls = sum(LOOP_STALLS.value(location=loc) for (loc,) in LOOP_STALLS.series())
+                lines = [f"{'probes':<10} {LOOP_LAG_SECONDS.count():>8}"]
+                for label, q in (("p50", 0.50), ("p95", 0.95), ("p99", 0.99)):
+                    # Bucket interpolation can overshoot the largest real observation.
+                    estimate = LOOP_LAG_SECONDS.quantile(q)
+                    if estimate is not None:
+                        estimate = min(estimate, LOOP_MONITOR.max_lag)
+                    lines.append(f"{label:<10} {_format_ms(estimate):>8}")
+                lines += [
+                    f"{'max':<10} {_format_ms(LOOP_MONITOR.max_lag):>8}",
+                    f"{'stalls':<10} {int(stalls):>8}",
+                ]
+                embed.description = "```\n" + "\n".join(lines) + "\n```"
+                for rank, stall in enumerate(LOOP_MONITOR.worst()[:5], start=1):
+                    embed.add_field(
+                        name=f"{rank}. {stall.lag * 1000:.0f} ms at {stall.location}"[:256],
+                        value=_stack_tail(stall.stack),
+                        inline=False,
+                    )
+            embed.set_footer(
+                text=f"Latencies in ms • stall threshold {LOOP_MONITOR.threshold * 1000:.0f} ms • "
+                     "Full data at /metrics on the web server"
+            )
+            await interaction.response.send_message(embed=embed)
+        except Exception:
+            logger.exception("/loop_lag failed")
+            await send_error(interaction, "Failed to collect loop lag.")
+
+    @client.tree.command(
+        name="profile_pipeline",
+        description="[DEV] Profile one game's event pipeline and attach the pstats file",
+        guild=GUILD_OBJECT,
+    )
+    @app_commands.describe(
+        game="Game to profile",
+        fixture="Replay the game's recorded fixture instead of the live wiki",
+        record="Save the fetched pages as the game's fixture (live runs only)",
+    )
+    @app_commands.choices(game=[app_commands.Choice(name=cfg["display_name"], value=key) for key, cfg in GAME_CONFIG.items()])
+    async def profile_pipeline(interaction: discord.Interaction, game: str, fixture: bool = False, record: bool = False) -> None:
+        cfg = GAME_CONFIG[game]
+        fixture_path = os.path.join(FIXTURE_DIR, f"{game}.json")
+        try:
+            await interaction.response.defer()
+            if fixture:
+                wiki = FixtureWikiAPI.from_file(fixture_path)
+            else:
+                wiki = RecordingWikiAPI(cfg["api_url"], cfg["category"], game=game)
+
+            async def pipeline():
+                events = await wiki.get_ongoing_events_async()
+                pages = EventPages(
+                    title=f"Current {cfg['display_name']} Events",
+                    events=events,
+                    footer=f"Found {len(events)} active events",
+                    color=cfg["color"],
+                    game=game,
+                )
+                for number in range(pages.page_count):
+                    pages.render(number)
+                return events
+
+            events, profile, wall = await profile_async(pipeline)
+            if record and not fixture:
+                await asyncio.to_thread(save_fixture, fixture_path, wiki.recorded, game, cfg["api_url"], cfg["category"])
+
+            rows = top_functions(profile, limit=15)
+            header = f"{'cum ms':>8} {'own ms':>8} {'calls':>7}  function"
+            lines = [header] + [
+                f"{r['cumtime'] * 1000:>8.1f} {r['tottime'] * 1000:>8.1f} {r['calls']:>7}  {r['function']}"
+                for r in rows
+            ]
+            source = f"fixture {fixture_path}" if fixture else "live wiki"
+            embed = discord.Embed(
+                title=f"Pipeline Profile — {cfg['display_name']}",
+                description="```\n" + "\n".join(lines)[:4000] + "\n```",
+                color=discord.Color.blue(),
+            )
+            embed.add_field(name="Source", value=source, inline=True)
+            embed.add_field(name="Wall time", value=f"{wall:.2f}s", inline=True)
+            embed.add_field(name="Ongoing events", value=str(len(events)), inline=True)
+            if record and not fixture:
+                embed.add_field(name="Recorded", value=f"{len(wiki.recorded)} pages → {fixture_path}", inline=False)
+            embed.set_footer(text="Top functions by cumulative time • Open the attachment with python -m pstats, snakeviz or flameprof")
+            await interaction.followup.send(
+                embed=embed,
+                file=discord.File(io.BytesIO(pstats_bytes(profile)), filename=f"{game}-pipeline.pstats"),
+            )
+        except FileNotFoundError:
+            await send_error(interaction, f"No fixture recorded for {cfg['display_name']} yet. Run with record:True first.")
+        except Exception:
+            logger.exception("/profile_pipeline failed")
+            await send_error(interaction, "Profiling failed. Check console for details.")
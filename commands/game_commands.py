@@ -9,22 +9,109 @@ commands and delegates per-game registration.
 Registered commands:
 * ``/events_wuwa``  — current Wuthering Waves events (via games.wuwa)
 * ``/events_zzz``   — current Zenless Zone Zero events (via games.zzz)
-* ``/events_all``   — events from all supported games in one embed.
+* ``/events_all``   — events from all supported games, paginated.
 * ``/events_timed`` — Wuthering Waves events with timing stats (via games.wuwa)
+* ``/timeline``     — the next events to end across all (or some) games.
+* ``/event``        — details of one event, with name autocomplete.
 """
 from __future__ import annotations
 
-import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import quote
+
 import discord
+from discord import app_commands
+
+from config import COMMAND_GUILD
+from embeds import EventPages, build_event_detail_embed, build_events_embed, send_error, send_paginated, send_response, shared_event_pages
+from api.timeline import ending_soonest
+from api.filters import filter_ongoing, format_time_remaining, is_ongoing, is_permanent, is_upcoming
+from games import  EVENT_INDEX, GAME_CONFIG, SNAPSHOTS
+from metrics import time_stage
+from tracing import span
+from games.wuwa.commands import register_wuwa_commands
+from games.zzz.commands import register_zzz_commands
+from games.genshinimpact.commands import register_genshinimpact_commands
+
+logger = logging.getLogger(__name__)
+
+# Discord caps autocomplete choice names and values at 100 characters.
+CHOICE_LIMIT = 100
+
+# Most events /timeline shows; 25 entries with dates stay within one embed.
+TIMELINE_MAX = 25
+
+
+def _wiki_url(game: str, page_title: str) -> str:
+    base = GAME_CONFIG[game]["api_url"].rsplit("/", 1)[0]
+    return f"{base}/wiki/{quote(page_title.replace(' ', '_'))}"
+
 
-from config import GUILD_OBJECT
-from embeds import send_error
-from games import  GAME_CONFIG
-from games.wuwa.commands import register_wuwa_commands, get_wuwa_events_async
-from games.zzz.commands import get_zzz_events_async, register_zzz_commands
-from games.genshinimpact.commands import register_genshinimpact_commands, get_genshinimpact_events_async
+def _event_status(event: Dict, now: datetime) -> str:
+    if is_upcoming(event["start_date"], now):
+        return "Upcoming"
+    if is_permanent(event):
+        return "Permanent"
+    if is_ongoing(event["start_date"], event["end_date"], now):
+        return "Ongoing"
+    return "Ended"
 
 
+def _resolve_event(value: str) -> Optional[Tuple[str, Dict]]:
+    """Map an autocomplete value (``"game:key"``) or free text to ``(game, event)``."""
+    game, _, key = value.partition(":")
+    if game in GAME_CONFIG:
+        event = EVENT_INDEX.get(game, key)
+        if event is not None:
+            return game, event
+    matches = EVENT_INDEX.search(value, limit=1)
+    if not matches:
+        return None
+    game, _, event = matches[0]
+    return game, event
+
+
+def _parse_games(value: Optional[str]) -> Tuple[List[str], List[str]]:
+    """Split a comma-separated list of game keys or display names.
+
+    Returns:
+        Tuple[List[str], List[str]]: The recognised game keys in
+        :data:`GAME_CONFIG` order, and the entries that matched no game.
+    """
+    names = {key: key for key in GAME_CONFIG}
+    names.update({cfg["display_name"].lower(): key for key, cfg in GAME_CONFIG.items()})
+    wanted, unknown = set(), []
+    for part in (value or "").split(","):
+        part = part.strip()
+        if not part:
+            continue
+        if part.lower() in names:
+            wanted.add(names[part.lower()])
+        else:
+            unknown.append(part)
+    return [key for key in GAME_CONFIG if key in wanted], unknown
+
+
+def _make_all_pages(snapshots: Dict[str, Dict]) -> EventPages:
+    """Build pages listing every game's ongoing events, grouped by game."""
+    with time_stage("filter", "all") as stage:
+        ongoing = {key: filter_ongoing(snapshots[key]["events"]) for key in GAME_CONFIG}
+        stage.items = sum(len(events) for events in ongoing.values())
+    counts = ", ".join(f"{GAME_CONFIG[key]['display_name']} {len(events)}" for key, events in ongoing.items())
+    return EventPages(
+        title="Current Events – All Games",
+        events=[
+            {**e, "title": f"{e['title']} ({GAME_CONFIG[key]['display_name']})"}
+            for key, events in ongoing.items()
+            for e in events
+        ],
+        footer=f"Total: {stage.items} active events across all games ({counts})",
+        color=discord.Color.purple(),
+        show_dates=False,
+    )
+
 
 def register_game_commands(client) -> None:
     register_wuwa_commands(client)
@@ -35,42 +122,130 @@ def register_game_commands(client) -> None:
     @client.tree.command(
         name="events_all",
         description="Get current events from all supported games",
-        guild=GUILD_OBJECT,
+        guild=COMMAND_GUILD,
     )
     async def events_all(interaction: discord.Interaction) -> None:
-        try:
-            await interaction.response.defer()
-
-            wuwa_events, zzz_events, genshinimpact_events = await asyncio.gather(
-                get_wuwa_events_async(debug=False),
-                get_zzz_events_async(debug=False),
-                get_genshinimpact_events_async(debug=False)
-                
-            )
+        with span("command", command="events_all"):
+            try:
+                snapshots = SNAPSHOTS.get_all_fresh()
+                if snapshots is None:
+                    # Only defer when a live fetch is needed; cached data is answered in one round trip
+                    await interaction.response.defer()
+                    snapshots = await SNAPSHOTS.get_all()
+                # Pages are shared by everyone viewing these snapshots and rendered on demand
+                pages = shared_event_pages(
+                    ("all", "ongoing", tuple(snapshots[key]["etag"] for key in GAME_CONFIG)),
+                    lambda: _make_all_pages(snapshots),
+                )
+                await send_paginated(interaction, pages)
 
-            embed = discord.Embed(
-                title="Current Events – All Games",
-                color=discord.Color.purple(),
-            )
+            except Exception:
+                logger.exception("/events_all failed")
+                await send_error(interaction, "Failed to fetch events. Please try again later.")
+
+    @client.tree.command(
+        name="timeline",
+        description="Show the next events to end across games",
+        guild=COMMAND_GUILD,
+    )
+    @app_commands.describe(
+        games="Comma-separated games to include (default: all)",
+        limit="Number of events to show (default 10)",
+    )
+    async def timeline(
+        interaction: discord.Interaction,
+        games: Optional[str] = None,
+        limit: app_commands.Range[int, 1, TIMELINE_MAX] = 10,
+    ) -> None:
+        with span("command", command="timeline"):
+            try:
+                selected, unknown = _parse_games(games)
+                if unknown or (games and not selected):
+                    choices = ", ".join(cfg["display_name"] for cfg in GAME_CONFIG.values())
+                    await send_response(interaction, content=f"Unknown game(s): {', '.join(unknown) or games}. Choose from: {choices}.")
+                    return
+                selected = selected or list(GAME_CONFIG)
+
+                snapshots = SNAPSHOTS.get_all_fresh()
+                if snapshots is None:
+                    await interaction.response.defer()
+                    snapshots = await SNAPSHOTS.get_all()
+                with time_stage("filter", "all") as stage:
+                    merged = ending_soonest({key: snapshots[key]["events"] for key in selected}, limit)
+                    stage.items = len(merged)
 
-            sections = []
-            for game_key, events in (("wuwa", wuwa_events), ("zzz", zzz_events), ("genshinimpact", genshinimpact_events)):
-                cfg = GAME_CONFIG[game_key]
-                if events:
-                    lines = [f"**{e['title']}** - {e['time_remaining']}" for e in events]
-                    sections.append(
-                        f"**{cfg['emoji']} {cfg['display_name']} ({len(events)} events)**\n"
-                        + "\n".join(lines)
+                with time_stage("render", "all"):
+                    names = [GAME_CONFIG[key]["display_name"] for key in selected]
+                    embed = build_events_embed(
+                        title="Ending Soonest – " + ("All Games" if len(selected) == len(GAME_CONFIG) else ", ".join(names)),
+                        events=[{**e, "title": f"{e['title']} ({GAME_CONFIG[key]['display_name']})"} for key, e in merged],
+                        footer=f"Next {len(merged)} events to end",
+                        color=discord.Color.purple(),
                     )
-                else:
-                    sections.append(f"**{cfg['emoji']} {cfg['display_name']}**\nNo ongoing events")
 
-            embed.description = "\n\n".join(sections)
-            total = len(wuwa_events) + len(zzz_events)
-            embed.set_footer(text=f"Total: {total} active events across all games")
+                with time_stage("send", "all"):
+                    await send_response(interaction, embed=embed)
 
-            await interaction.followup.send(embed=embed)
+            except Exception:
+                logger.exception("/timeline failed")
+                await send_error(interaction, "Failed to build the timeline. Please try again later.")
 
-        except Exception as exc:
-            print(f"[events_all] {exc}")
-            await send_error(interaction, "Failed to fetch events. Please try again later.")
\ No newline at end of file
+    @timeline.autocomplete("games")
+    async def timeline_autocomplete(interaction: discord.Interaction, current: str) -> List[app_commands.Choice[str]]:
+        # Complete the last comma-separated entry, keeping the ones already typed.
+        typed, _, partial = current.rpartition(",")
+        chosen, _ = _parse_games(typed)
+        prefix = "".join(f"{key}," for key in chosen)
+        return [
+            app_commands.Choice(
+                name=", ".join(GAME_CONFIG[k]["display_name"] for k in chosen + [key])[:CHOICE_LIMIT],
+                value=f"{prefix}{key}"[:CHOICE_LIMIT],
+            )
+            for key, cfg in GAME_CONFIG.items()
+            if key not in chosen and (key.startswith(partial.strip().lower()) or partial.strip().lower() in cfg["display_name"].lower())
+        ]
+
+    @client.tree.command(
+        name="event",
+        description="Show details for one event",
+        guild=COMMAND_GUILD,
+    )
+    @app_commands.describe(name="Event name (start typing to search)")
+    async def event(interaction: discord.Interaction, name: str) -> None:
+        with span("command", command="event"):
+            try:
+                if SNAPSHOTS.get_all_fresh() is None:
+                    # Loading snapshots also fills EVENT_INDEX through its listener
+                    await interaction.response.defer()
+                    await SNAPSHOTS.get_all()
+                resolved = _resolve_event(name)
+                if resolved is None:
+                    await send_response(interaction, content=f"No event matching “{name}” found.")
+                    return
+                game, found = resolved
+                cfg = GAME_CONFIG[game]
+                now = datetime.now(timezone.utc)
+                with time_stage("render", game):
+                    embed = build_event_detail_embed(
+                        dict(found, time_remaining=format_time_remaining(found["end_date"], now)),
+                        game_name=cfg["display_name"],
+                        color=cfg["color"],
+                        status=_event_status(found, now),
+                        url=_wiki_url(game, found["page_title"]),
+                    )
+                with time_stage("send", game):
+                    await send_response(interaction, embed=embed)
+            except Exception:
+                logger.exception("/event failed")
+                await send_error(interaction, "Failed to look up event. Please try again later.")
+
+    @event.autocomplete("name")
+    async def event_autocomplete(interaction: discord.Interaction, current: str) -> List[app_commands.Choice[str]]:
+        # Served from the in-memory index only; autocomplete must answer within 3 seconds.
+        return [
+            app_commands.Choice(
+                name=f"{found['title']} ({GAME_CONFIG[game]['display_name']})"[:CHOICE_LIMIT],
+                value=f"{game}:{key}"[:CHOICE_LIMIT],
+            )
+            for game, key, found in EVENT_INDEX.search(current)
+        ]
@@ -0,0 +1,122 @@
+# commands/subscription_commands.py
+"""
+Slash commands for managing reminder subscriptions.
+
+Registered commands:
+* ``/subscribe``           — get mentioned in this channel for a game's reminders.
+* ``/unsubscribe``         — remove one of your subscriptions in this channel.
+* ``/subscriptions``       — list your subscriptions.
+* ``/subscribe_channel``   — post a game's reminders to this channel (Manage Channels).
+* ``/unsubscribe_channel`` — stop posting a game's reminders to this channel.
+
+An optional ``event`` argument narrows a subscription to events whose
+title contains that text.
+"""
+from __future__ import annotations
+
+import logging
+from typing import Optional
+
+import discord
+from discord import app_commands
+
+from config import COMMAND_GUILD
+from embeds import send_error
+from games import GAME_CONFIG
+from reminders.subscriptions import SubscriptionStore
+
+logger = logging.getLogger(__name__)
+
+GAME_CHOICES = [app_commands.Choice(name=cfg["display_name"], value=key) for key, cfg in GAME_CONFIG.items()]
+
+
+def _describe(game: str, event: Optional[str]) -> str:
+    name = GAME_CONFIG[game]["display_name"]
+    return f"**{name}** events matching “{event}”" if event else f"all **{name}** events"
+
+
+def register_subscription_commands(client, store: SubscriptionStore) -> None:
+    @client.tree.command(
+        name="subscribe",
+        description="Get mentioned in this channel when a game's events start or end soon",
+        guild=COMMAND_GUILD,
+    )
+    @app_commands.describe(game="Game to follow", event="Only events whose name contains this text")
+    @app_commands.choices(game=GAME_CHOICES)
+    async def subscribe(interaction: discord.Interaction, game: str, event: Optional[str] = None) -> None:
+        try:
+            added = await store.add("user", interaction.user.id, interaction.channel_id, game, event or "")  # type: ignore[arg-type]
+            text = f"Subscribed to {_describe(game, event)}." if added else f"You are already subscribed to {_describe(game, event)} here."
+            await interaction.response.send_message(text, ephemeral=True)
+        except Exception:
+            logger.exception("/subscribe failed")
+            await send_error(interaction, "Failed to save subscription. Please try again later.")
+
+    @client.tree.command(
+        name="unsubscribe",
+        description="Stop reminders for a game in this channel",
+        guild=COMMAND_GUILD,
+    )
+    @app_commands.describe(game="Game to stop following", event="The event filter used when subscribing")
+    @app_commands.choices(game=GAME_CHOICES)
+    async def unsubscribe(interaction: discord.Interaction, game: str, event: Optional[str] = None) -> None:
+        try:
+            removed = await store.remove("user", interaction.user.id, interaction.channel_id, game, event or "")  # type: ignore[arg-type]
+            text = f"Unsubscribed from {_describe(game, event)}." if removed else "No matching subscription found in this channel."
+            await interaction.response.send_message(text, ephemeral=True)
+        except Exception:
+            logger.exception("/unsubscribe failed")
+            await send_error(interaction, "Failed to remove subscription. Please try again later.")
+
+    @client.tree.command(
+        name="subscriptions",
+        description="List your reminder subscriptions",
+        guild=COMMAND_GUILD,
+    )
+    async def subscriptions(interaction: discord.Interaction) -> None:
+        try:
+            rows = await store.list_for_target("user", interaction.user.id)
+            if not rows:
+                await interaction.response.send_message("You have no subscriptions.", ephemeral=True)
+                return
+            lines = [f"• {_describe(r['game'], r['event_name'] or None)} in <#{r['channel_id']}>" for r in rows]
+            await interaction.response.send_message("\n".join(lines)[:2000], ephemeral=True)
+        except Exception:
+            logger.exception("/subscriptions failed")
+            await send_error(interaction, "Failed to load subscriptions. Please try again later.")
+
+    @client.tree.command(
+        name="subscribe_channel",
+        description="Post a game's event reminders to this channel",
+        guild=COMMAND_GUILD,
+    )
+    @app_commands.describe(game="Game to follow", event="Only events whose name contains this text")
+    @app_commands.choices(game=GAME_CHOICES)
+    @app_commands.default_permissions(manage_channels=True)
+    async def subscribe_channel(interaction: discord.Interaction, game: str, event: Optional[str] = None) -> None:
+        try:
+            channel_id = interaction.channel_id
+            added = await store.add("channel", channel_id, channel_id, game, event or "")  # type: ignore[arg-type]
+            text = f"This channel will receive reminders for {_describe(game, event)}." if added else "This channel is already subscribed."
+            await interaction.response.send_message(text, ephemeral=True)
+        except Exception:
+            logger.exception("/subscribe_channel failed")
+            await send_error(interaction, "Failed to save subscription. Please try again later.")
+
+    @client.tree.command(
+        name="unsubscribe_channel",
+        description="Stop posting a game's event reminders to this channel",
+        guild=COMMAND_GUILD,
+    )
+    @app_commands.describe(game="Game to stop following", event="The event filter used when subscribing")
+    @app_commands.choices(game=GAME_CHOICES)
+    @app_commands.default_permissions(manage_channels=True)
+    async def unsubscribe_channel(interaction: discord.Interaction, game: str, event: Optional[str] = None) -> None:
+        try:
+            channel_id = interaction.channel_id
+            removed = await store.remove("channel", channel_id, channel_id, game, event or "")  # type: ignore[arg-type]
+            text = f"This channel no longer receives reminders for {_describe(game, event)}." if removed else "No matching channel subscription found."
+            await interaction.response.send_message(text, ephemeral=True)
+        except Exception:
+            logger.exception("/unsubscribe_channel failed")
+            await send_error(interaction, "Failed to remove subscription. Please try again later.")
@@ -0,0 +1,86 @@
+# commands/sync.py
+"""
+Hash-gated application command sync.
+
+Uploading the command tree is a slow, rate-limited API call, yet the
+command set rarely changes between restarts. :func:`sync_command_tree`
+hashes the payload of every command scope (the configured guild and, in
+multi-guild mode, the global scope) and only calls
+:meth:`discord.app_commands.CommandTree.sync` for scopes whose hash
+differs from the one recorded after the last successful sync.
+
+Hashes are stored per application in a small JSON file
+(:data:`config.COMMAND_SYNC_STATE_PATH`).
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from typing import Dict, List, Optional, Tuple
+
+import discord
+
+from config import COMMAND_SYNC_STATE_PATH, GUILD_OBJECT, MULTI_GUILD
+
+
+def _scopes() -> List[Tuple[str, Optional[discord.Object]]]:
+    scopes: List[Tuple[str, Optional[discord.Object]]] = [(f"guild:{GUILD_OBJECT.id}", GUILD_OBJECT)]
+    if MULTI_GUILD:
+        scopes.append(("global", None))
+    return scopes
+
+
+def command_tree_hash(tree: discord.app_commands.CommandTree, guild: Optional[discord.Object]) -> str:
+    """Return a stable hash of the commands registered for ``guild`` (``None`` = global)."""
+    payload = sorted(
+        (command.to_dict(tree) for command in tree.get_commands(guild=guild)),
+        key=lambda c: (c.get("type", 1), c["name"]),
+    )
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def _load_state() -> Dict[str, str]:
+    try:
+        with open(COMMAND_SYNC_STATE_PATH, encoding="utf-8") as fh:
+            return json.load(fh)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_state(state: Dict[str, str]) -> None:
+    tmp_path = f"{COMMAND_SYNC_STATE_PATH}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as fh:
+        json.dump(state, fh, indent=2, sort_keys=True)
+    os.replace(tmp_path, COMMAND_SYNC_STATE_PATH)
+
+
+async def sync_command_tree(client, force: bool = False) -> Dict[str, Optional[int]]:
+    """Sync every command scope whose tree changed since the last sync.
+
+    Args:
+        client: The bot client; must be logged in so that
+            ``client.application_id`` is known.
+        force (bool): Sync every scope regardless of stored hashes
+            (default ``False``).
+
+    Returns:
+        Dict[str, Optional[int]]: For each scope, the number of commands
+        uploaded, or ``None`` if the scope was unchanged and skipped.
+    """
+    state = _load_state()
+    results: Dict[str, Optional[int]] = {}
+
+    for scope, guild in _scopes():
+        key = f"{client.application_id}:{scope}"
+        digest = command_tree_hash(client.tree, guild)
+        if not force and state.get(key) == digest:
+            results[scope] = None
+            continue
+
+        synced = await client.tree.sync(guild=guild)
+        results[scope] = len(synced)
+        state[key] = digest
+        _save_state(state)
+
+    return results
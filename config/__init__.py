@@ -1,3 +1,23 @@
-from .config import TOKEN, GUILD_ID, GUILD_OBJECT
+from .config import (
+    TOKEN, GUILD_ID, GUILD_OBJECT,
+    MULTI_GUILD, SHARD_COUNT, COMMAND_GUILD, COMMAND_SYNC_STATE_PATH,
+    SNAPSHOT_MAX_AGE, SNAPSHOT_POLL_INTERVAL, SNAPSHOT_PATCH_POLL_INTERVAL, SNAPSHOT_PATCH_WINDOW,
+    FETCHER_SOCKET, PAGE_CACHE_MAX_MB,
+    WEB_SERVER_ENABLED, WEB_SERVER_HOST, WEB_SERVER_PORT, WEB_CACHE_MAX_AGE,
+    REMINDER_CHANNEL_IDS, REMINDER_LEAD_HOURS, REMINDER_NOTIFY_STARTS,
+    REMINDERS_ENABLED, SUBSCRIPTIONS_DB_PATH,
+    TRACE_FILE, TRACE_OTLP_ENDPOINT,
+    LOOP_LAG_THRESHOLD, FIXTURE_DIR,
+)
 
-__all__ = ["TOKEN", "GUILD_ID", "GUILD_OBJECT"]
\ No newline at end of file
+__all__ = [
+    "TOKEN", "GUILD_ID", "GUILD_OBJECT",
+    "MULTI_GUILD", "SHARD_COUNT", "COMMAND_GUILD", "COMMAND_SYNC_STATE_PATH",
+    "SNAPSHOT_MAX_AGE", "SNAPSHOT_POLL_INTERVAL", "SNAPSHOT_PATCH_POLL_INTERVAL", "SNAPSHOT_PATCH_WINDOW",
+    "FETCHER_SOCKET", "PAGE_CACHE_MAX_MB",
+    "WEB_SERVER_ENABLED", "WEB_SERVER_HOST", "WEB_SERVER_PORT", "WEB_CACHE_MAX_AGE",
+    "REMINDER_CHANNEL_IDS", "REMINDER_LEAD_HOURS", "REMINDER_NOTIFY_STARTS",
+    "REMINDERS_ENABLED", "SUBSCRIPTIONS_DB_PATH",
+    "TRACE_FILE", "TRACE_OTLP_ENDPOINT",
+    "LOOP_LAG_THRESHOLD", "FIXTURE_DIR",
+]
@@ -12,13 +12,76 @@ Attributes:
     GUILD_ID (str): Target guild/server ID read from the ``GUILD_ID``
         environment variable.
     GUILD_OBJECT (discord.Object): Pre-built Discord guild object
-        constructed from :data:`GUILD_ID`.
+        constructed from :data:`GUILD_ID`. Developer commands are always
+        scoped to this guild.
+    MULTI_GUILD (bool): Register user-facing commands globally and run
+        as an auto-sharded bot (``MULTI_GUILD``, default off).
+    SHARD_COUNT (Optional[int]): Shard count for multi-guild mode
+        (``SHARD_COUNT``); ``None`` uses Discord's recommendation.
+    COMMAND_GUILD (Optional[discord.Object]): Scope for user-facing
+        commands — :data:`GUILD_OBJECT` normally, ``None`` (global) in
+        multi-guild mode.
+    COMMAND_SYNC_STATE_PATH (str): JSON file recording the hash of the
+        last synced command tree per scope (``COMMAND_SYNC_STATE_PATH``,
+        default ``.command_sync.json``).
+    SNAPSHOT_MAX_AGE (int): Seconds an in-memory event snapshot is served
+        before being refreshed from the wiki (``SNAPSHOT_MAX_AGE``,
+        default ``300``). While the bot runs, the background refresh
+        keeps snapshots current, so reads only refresh once a snapshot is
+        older than :data:`SNAPSHOT_POLL_INTERVAL`.
+    SNAPSHOT_POLL_INTERVAL (int): Seconds between background wiki polls
+        for edits (``SNAPSHOT_POLL_INTERVAL``, default ``1800``).
+    SNAPSHOT_PATCH_POLL_INTERVAL (int): Seconds between polls while within
+        :data:`SNAPSHOT_PATCH_WINDOW` of an event's start or end time
+        (``SNAPSHOT_PATCH_POLL_INTERVAL``, default ``120``).
+    SNAPSHOT_PATCH_WINDOW (int): Seconds either side of an event's start
+        or end time polled at the faster rate (``SNAPSHOT_PATCH_WINDOW``,
+        default ``3600``).
+    FETCHER_SOCKET (str): Unix socket of a separate fetcher process
+        (``python -m gacha_reminder fetcher``). When set, the bot takes
+        event snapshots from it instead of scraping the wikis itself
+        (``FETCHER_SOCKET``, default empty = fetch in-process).
+    PAGE_CACHE_MAX_MB (int): Memory budget in MB for cached page wikitext,
+        shared by every game and dev command (``PAGE_CACHE_MAX_MB``,
+        default ``32``; ``0`` disables the cache).
+    WEB_SERVER_ENABLED (bool): Start the local JSON event API alongside
+        the bot (``WEB_SERVER_ENABLED``, default off).
+    WEB_SERVER_HOST (str): Bind address for the event API
+        (``WEB_SERVER_HOST``, default ``127.0.0.1``).
+    WEB_SERVER_PORT (int): Port for the event API (``WEB_SERVER_PORT``,
+        default ``8080``).
+    WEB_CACHE_MAX_AGE (int): ``Cache-Control: max-age`` sent by the event
+        API (``WEB_CACHE_MAX_AGE``, default ``60``).
+    REMINDER_CHANNEL_IDS (List[int]): Channels that receive every
+        scheduled event reminder (``REMINDER_CHANNEL_IDS``, comma-separated).
+    REMINDERS_ENABLED (bool): Run the reminder scheduler and register the
+        subscription commands (``REMINDERS_ENABLED``, default on when
+        :data:`REMINDER_CHANNEL_IDS` is set).
+    REMINDER_LEAD_HOURS (List[float]): Hours before an event ends at which
+        to remind (``REMINDER_LEAD_HOURS``, comma-separated, default ``24``).
+    REMINDER_NOTIFY_STARTS (bool): Also remind when events start
+        (``REMINDER_NOTIFY_STARTS``, default on).
+    SUBSCRIPTIONS_DB_PATH (str): SQLite file holding reminder
+        subscriptions (``SUBSCRIPTIONS_DB_PATH``, default
+        ``subscriptions.db``).
+    TRACE_FILE (str): File that finished request traces are appended to
+        as OTLP/JSON lines (``TRACE_FILE``, default empty = disabled).
+    TRACE_OTLP_ENDPOINT (str): Base URL of an OTLP/HTTP collector to send
+        traces to, e.g. ``http://127.0.0.1:4318`` (``TRACE_OTLP_ENDPOINT``,
+        default empty = disabled).
+    LOOP_LAG_THRESHOLD (float): Event-loop lag in seconds above which the
+        watchdog logs a stall with the blocking stack
+        (``LOOP_LAG_THRESHOLD``, default ``0.25``).
+    FIXTURE_DIR (str): Directory holding recorded wiki page fixtures,
+        one ``<game>.json`` per game, used by ``/profile_pipeline``
+        (``FIXTURE_DIR``, default ``fixtures``).
 
 Raises:
     ValueError: If ``DISCORD_TOKEN`` or ``GUILD_ID`` are not set in the
         environment.
 """
 import os
+from typing import List, Optional
 from dotenv import load_dotenv
 import discord
 
@@ -33,4 +96,49 @@ if not TOKEN:
 if not GUILD_ID:
     raise ValueError("GUILD_ID environment variable is not set.")
 
-GUILD_OBJECT = discord.Object(id=int(GUILD_ID))
\ No newline at end of file
+GUILD_OBJECT = discord.Object(id=int(GUILD_ID))
+
+# --- Multi-guild / sharding ---
+MULTI_GUILD: bool = (os.getenv("MULTI_GUILD") or "").lower() in ("1", "true", "yes")
+SHARD_COUNT: Optional[int] = int(os.getenv("SHARD_COUNT")) if os.getenv("SHARD_COUNT") else None
+COMMAND_GUILD: Optional[discord.Object] = None if MULTI_GUILD else GUILD_OBJECT
+COMMAND_SYNC_STATE_PATH: str = os.getenv("COMMAND_SYNC_STATE_PATH") or ".command_sync.json"
+
+# --- Event snapshots ---
+SNAPSHOT_MAX_AGE: int = int(os.getenv("SNAPSHOT_MAX_AGE") or 300)
+SNAPSHOT_POLL_INTERVAL: int = int(os.getenv("SNAPSHOT_POLL_INTERVAL") or 1800)
+SNAPSHOT_PATCH_POLL_INTERVAL: int = int(os.getenv("SNAPSHOT_PATCH_POLL_INTERVAL") or 120)
+SNAPSHOT_PATCH_WINDOW: int = int(os.getenv("SNAPSHOT_PATCH_WINDOW") or 3600)
+FETCHER_SOCKET: str = os.getenv("FETCHER_SOCKET") or ""
+
+# --- Page content cache ---
+PAGE_CACHE_MAX_MB: int = int(os.getenv("PAGE_CACHE_MAX_MB") or 32)
+
+# --- Local HTTP event API (optional) ---
+WEB_SERVER_ENABLED: bool = (os.getenv("WEB_SERVER_ENABLED") or "").lower() in ("1", "true", "yes")
+WEB_SERVER_HOST: str = os.getenv("WEB_SERVER_HOST") or "127.0.0.1"
+WEB_SERVER_PORT: int = int(os.getenv("WEB_SERVER_PORT") or 8080)
+WEB_CACHE_MAX_AGE: int = int(os.getenv("WEB_CACHE_MAX_AGE") or 60)
+
+# --- Scheduled reminders (optional) ---
+REMINDER_CHANNEL_IDS: List[int] = [
+    int(x) for x in (os.getenv("REMINDER_CHANNEL_IDS") or "").split(",") if x.strip()
+]
+REMINDER_LEAD_HOURS: List[float] = [
+    float(x) for x in (os.getenv("REMINDER_LEAD_HOURS") or "24").split(",") if x.strip()
+]
+REMINDER_NOTIFY_STARTS: bool = (os.getenv("REMINDER_NOTIFY_STARTS") or "true").lower() in ("1", "true", "yes")
+REMINDERS_ENABLED: bool = (
+    os.getenv("REMINDERS_ENABLED") or ("true" if REMINDER_CHANNEL_IDS else "false")
+).lower() in ("1", "true", "yes")
+SUBSCRIPTIONS_DB_PATH: str = os.getenv("SUBSCRIPTIONS_DB_PATH") or "subscriptions.db"
+
+# --- Tracing export (optional) ---
+TRACE_FILE: str = os.getenv("TRACE_FILE") or ""
+TRACE_OTLP_ENDPOINT: str = os.getenv("TRACE_OTLP_ENDPOINT") or ""
+
+# --- Event-loop watchdog ---
+LOOP_LAG_THRESHOLD: float = float(os.getenv("LOOP_LAG_THRESHOLD") or 0.25)
+
+# --- Profiling ---
+FIXTURE_DIR: str = os.getenv("FIXTURE_DIR") or "fixtures"
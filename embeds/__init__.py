@@ -1,3 +1,4 @@
-from .embeds import build_event_list, build_events_embed, build_error_embed, send_error
+from .embeds import build_event_list, build_events_embed, build_event_detail_embed, build_error_embed, build_reminder_embed, send_error, send_response
+from .pagination import EventPages, EventPaginator, send_paginated, shared_event_pages
 
-__all__ = ["build_event_list", "build_events_embed", "build_error_embed", "send_error"]
\ No newline at end of file
+__all__ = ["build_event_list", "build_events_embed", "build_event_detail_embed", "build_error_embed", "build_reminder_embed", "send_error", "send_response", "EventPages", "EventPaginator", "send_paginated", "shared_event_pages"]
\ No newline at end of file
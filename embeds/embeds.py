@@ -9,6 +9,25 @@ from __future__ import annotations
 from typing import List, Dict, Optional
 import discord
 
+# Discord rejects embed descriptions longer than this many characters.
+EMBED_DESCRIPTION_LIMIT = 4096
+
+
+def _fit_description(lines: List[str], separator: str) -> str:
+    """Join ``lines``, replacing any that would overflow the limit with an "... and N more" note."""
+    kept: List[str] = []
+    length = 0
+    for index, line in enumerate(lines):
+        added = len(line) + (len(separator) if kept else 0)
+        # Unless this is the last line, leave room for the overflow note after it.
+        reserve = len(separator) + len(f"... and {len(lines)} more") if index < len(lines) - 1 else 0
+        if length + added + reserve > EMBED_DESCRIPTION_LIMIT:
+            kept.append(f"... and {len(lines) - index} more")
+            break
+        kept.append(line)
+        length += added
+    return separator.join(kept)
+
 
 def build_event_list(events: List[Dict], show_dates: bool = True) -> List[str]:
     """Format a list of event dicts into human-readable display strings.
@@ -43,21 +62,25 @@ def build_events_embed(
     title: str,
     events: List[Dict],
     footer: str,
-    color: discord.Color,
+    color: discord.Color | int,
     show_dates: bool = True,
 ) -> discord.Embed:
     """Build a standard Discord embed for displaying a list of game events.
 
     The embed description is populated with the formatted event list
     produced by :func:`build_event_list`. If no events are provided the
-    description falls back to a "No ongoing events" message.
+    description falls back to a "No ongoing events" message. Events that
+    would push the description past Discord's size limit are replaced by
+    an "... and N more" note; use :class:`embeds.EventPages` to show
+    long lists in full.
 
     Args:
         title (str): The embed title shown at the top of the card.
         events (List[Dict]): List of event dicts to display (see
             :func:`build_event_list` for expected keys).
         footer (str): Text placed in the embed footer.
-        color (discord.Color): Accent color for the embed side-bar.
+        color (discord.Color | int): Accent color for the embed side-bar.
+            Game configs store plain ``0xRRGGBB`` integers.
         show_dates (bool): Passed through to :func:`build_event_list`;
             controls whether date ranges are included (default ``True``).
 
@@ -66,13 +89,74 @@ def build_events_embed(
     """
     embed = discord.Embed(title=title, color=color)
     if events:
-        embed.description = "\n\n".join(build_event_list(events, show_dates=show_dates))
+        embed.description = _fit_description(build_event_list(events, show_dates=show_dates), "\n\n")
     else:
         embed.description = "No ongoing events right now."
     embed.set_footer(text=footer)
     return embed
 
 
+def describe_reminder_kind(kind: str) -> str:
+    """Turn a reminder kind (``"start"`` / ``"ending:<hours>"``) into display text."""
+    if kind == "start":
+        return "has started"
+    hours = kind.split(":", 1)[1]
+    return f"ends in {hours}h"
+
+
+def build_reminder_embed(reminders: List[Dict], game_names: Dict[str, str]) -> discord.Embed:
+    """Build one embed announcing a batch of due reminders.
+
+    Lines that would push the description past Discord's size limit are
+    replaced by an "... and N more" note.
+
+    Args:
+        reminders (List[Dict]): Reminder dicts as produced by
+            :class:`reminders.ReminderScheduler`, each with ``"game"``,
+            ``"kind"`` and ``"event"`` keys.
+        game_names (Dict[str, str]): Display name for each game key.
+
+    Returns:
+        discord.Embed: A gold embed listing every reminder.
+    """
+    embed = discord.Embed(title="Event Reminders", color=discord.Color.gold())
+    lines = [
+        f"**{r['event']['title']}** ({game_names.get(r['game'], r['game'])}) {describe_reminder_kind(r['kind'])}"
+        for r in reminders
+    ]
+    embed.description = _fit_description(lines, "\n")
+    embed.set_footer(text=f"{len(reminders)} reminder(s)")
+    return embed
+
+
+def build_event_detail_embed(
+    event: Dict,
+    game_name: str,
+    color: discord.Color | int,
+    status: str,
+    url: Optional[str] = None,
+) -> discord.Embed:
+    """Build an embed describing a single event.
+
+    Args:
+        event (Dict): Event dict with ``"title"``, ``"time_remaining"`` and
+            ``"date_range_str"`` keys.
+        game_name (str): Display name of the event's game.
+        color (discord.Color | int): Accent color for the embed side-bar.
+        status (str): Human-readable status, e.g. ``"Ongoing"``.
+        url (Optional[str]): Link to the event's wiki page.
+
+    Returns:
+        discord.Embed: The event card.
+    """
+    embed = discord.Embed(title=event["title"], color=color, url=url)
+    embed.add_field(name="Game", value=game_name, inline=True)
+    embed.add_field(name="Status", value=status, inline=True)
+    embed.add_field(name="Time left", value=event["time_remaining"], inline=True)
+    embed.add_field(name="Dates", value=event["date_range_str"], inline=False)
+    return embed
+
+
 def build_error_embed(title: str = "Error", description: str = "") -> discord.Embed:
     """Build a standard red error embed.
 
@@ -87,6 +171,25 @@ def build_error_embed(title: str = "Error", description: str = "") -> discord.Em
     return discord.Embed(title=title, description=description, color=discord.Color.red())
 
 
+async def send_response(interaction: discord.Interaction, **kwargs) -> None:
+    """Send a reply that works regardless of interaction state.
+
+    Answers with :meth:`discord.InteractionResponse.send_message` in a
+    single round trip when the interaction has not been responded to yet
+    (the cached fast path), and with ``followup.send`` after a
+    ``defer()``.
+
+    Args:
+        interaction (discord.Interaction): The active Discord interaction.
+        **kwargs: Passed to ``send_message`` / ``followup.send``
+            (e.g. ``content``, ``embed``, ``file``).
+    """
+    if interaction.response.is_done():
+        await interaction.followup.send(**kwargs)
+    else:
+        await interaction.response.send_message(**kwargs)
+
+
 async def send_error(interaction: discord.Interaction, message: str) -> None:
     """Send an error message that works regardless of interaction state.
 
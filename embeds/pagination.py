@@ -0,0 +1,187 @@
+# pagination.py - Paginated event embeds
+"""
+Paginated event embeds with next/previous buttons.
+
+Long event lists are split into fixed-size pages held by an
+:class:`EventPages`. A page's embed is only built the first time it is
+shown, so answering a command renders a single page however long the
+list is. :func:`shared_event_pages` lets every user viewing the same
+snapshot reuse one :class:`EventPages` and therefore every page already
+rendered for someone else.
+
+:class:`EventPaginator` is the :class:`discord.ui.View` attached to the
+message; it only tracks which page that message is showing.
+"""
+from __future__ import annotations
+
+import time
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+
+import discord
+
+from metrics import time_stage
+from .embeds import build_events_embed, send_response
+
+# Ten entries keep even long titles and date ranges well below the
+# description limit; build_events_embed truncates anything beyond it.
+EVENTS_PER_PAGE = 10
+
+# Seconds a shared page set is reused. Countdowns are rendered into the
+# pages, so they are rebuilt regularly even if the snapshot is unchanged.
+SHARED_PAGES_TTL = 60.0
+
+# Seconds the buttons stay active after the last interaction.
+PAGINATOR_TIMEOUT = 180.0
+
+
+class EventPages:
+    """A lazily rendered, paginated event list.
+
+    Attributes:
+        title (str): Embed title used for every page.
+        events (List[Dict]): Every event across all pages.
+        footer (str): Footer text; ``"Page i/n"`` is appended when there is
+            more than one page.
+        color (discord.Color | int): Accent color for the embed side-bar.
+        show_dates (bool): Whether date ranges are listed.
+        thumbnail_url (Optional[str]): Thumbnail for every page, e.g. an
+            ``attachment://`` URL.
+        per_page (int): Events per page.
+        game (str): Game label for render and send metrics.
+    """
+
+    def __init__(
+        self,
+        title: str,
+        events: List[Dict],
+        footer: str,
+        color: discord.Color | int,
+        show_dates: bool = True,
+        thumbnail_url: Optional[str] = None,
+        per_page: int = EVENTS_PER_PAGE,
+        game: str = "all",
+    ):
+        self.title = title
+        self.events = events
+        self.footer = footer
+        self.color = color
+        self.show_dates = show_dates
+        self.thumbnail_url = thumbnail_url
+        self.per_page = per_page
+        self.game = game
+        self._rendered: Dict[int, discord.Embed] = {}
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    @property
+    def page_count(self) -> int:
+        """Number of pages (at least one, which may be empty)."""
+        return max(1, -(-len(self.events) // self.per_page))
+
+    def render(self, index: int) -> discord.Embed:
+        """Return the embed for page ``index``, building it on first use."""
+        embed = self._rendered.get(index)
+        if embed is None:
+            with time_stage("render", self.game) as stage:
+                start = index * self.per_page
+                footer = self.footer
+                if self.page_count > 1:
+                    footer = f"{footer} • Page {index + 1}/{self.page_count}" if footer else f"Page {index + 1}/{self.page_count}"
+                embed = build_events_embed(
+                    title=self.title,
+                    events=self.events[start:start + self.per_page],
+                    footer=footer,
+                    color=self.color,
+                    show_dates=self.show_dates,
+                )
+                if self.thumbnail_url:
+                    embed.set_thumbnail(url=self.thumbnail_url)
+                self._rendered[index] = embed
+                stage.items = 1
+        return embed
+
+
+_shared_pages: Dict[Hashable, Tuple[float, EventPages]] = {}
+
+
+def shared_event_pages(key: Hashable, factory: Callable[[], EventPages]) -> EventPages:
+    """Return the :class:`EventPages` cached under ``key``, creating it if needed.
+
+    Include the snapshot's ETag in ``key`` so a data change starts a new
+    page set. Entries expire after :data:`SHARED_PAGES_TTL` seconds.
+
+    Args:
+        key (Hashable): Cache key, e.g. ``("zzz", "ongoing", etag)``.
+        factory (Callable[[], EventPages]): Builds the pages on a miss.
+
+    Returns:
+        EventPages: The shared page set.
+    """
+    now = time.monotonic()
+    for stale in [k for k, (created, _) in _shared_pages.items() if now - created >= SHARED_PAGES_TTL]:
+        del _shared_pages[stale]
+
+    entry = _shared_pages.get(key)
+    if entry is None:
+        entry = _shared_pages[key] = (now, factory())
+    return entry[1]
+
+
+class EventPaginator(discord.ui.View):
+    """Previous/next buttons flipping through an :class:`EventPages`."""
+
+    def __init__(self, pages: EventPages, timeout: float = PAGINATOR_TIMEOUT):
+        super().__init__(timeout=timeout)
+        self.pages = pages
+        self.index = 0
+        self.message: Optional[discord.Message] = None
+        self._update_buttons()
+
+    def _update_buttons(self) -> None:
+        self.previous_page.disabled = self.index == 0
+        self.next_page.disabled = self.index >= self.pages.page_count - 1
+
+    async def _show(self, interaction: discord.Interaction, index: int) -> None:
+        self.index = max(0, min(index, self.pages.page_count - 1))
+        self._update_buttons()
+        # Attachments (e.g. the thumbnail) are kept when not passed to edit_message.
+        await interaction.response.edit_message(embed=self.pages.render(self.index), view=self)
+
+    @discord.ui.button(label="◀ Prev", style=discord.ButtonStyle.secondary)
+    async def previous_page(self, interaction: discord.Interaction, button: discord.ui.Button) -> None:
+        await self._show(interaction, self.index - 1)
+
+    @discord.ui.button(label="Next ▶", style=discord.ButtonStyle.secondary)
+    async def next_page(self, interaction: discord.Interaction, button: discord.ui.Button) -> None:
+        await self._show(interaction, self.index + 1)
+
+    async def on_timeout(self) -> None:
+        if self.message is not None:
+            try:
+                await self.message.edit(view=None)
+            except discord.HTTPException:
+                pass
+
+
+async def send_paginated(interaction: discord.Interaction, pages: EventPages, **kwargs) -> None:
+    """Send the first page of ``pages``, with buttons when there is more than one.
+
+    Args:
+        interaction (discord.Interaction): The active Discord interaction.
+        pages (EventPages): The pages to show.
+        **kwargs: Extra arguments for :func:`send_response` (e.g. ``file``).
+    """
+    embed = pages.render(0)
+    if pages.page_count == 1:
+        with time_stage("send", pages.game):
+            await send_response(interaction, embed=embed, **kwargs)
+        return
+
+    view = EventPaginator(pages)
+    with time_stage("send", pages.game):
+        await send_response(interaction, embed=embed, view=view, **kwargs)
+    try:
+        view.message = await interaction.original_response()
+    except discord.HTTPException:
+        pass
@@ -0,0 +1,12 @@
+# gacha_reminder/__init__.py
+"""
+Headless entry point for the Gacha Reminder event pipeline.
+
+Run with ``python -m gacha_reminder`` from the project root. Unlike
+``main.py`` this package never imports :mod:`discord` or :mod:`config`,
+so it needs no ``DISCORD_TOKEN`` and starts quickly — suitable for cron
+jobs and batch scripts that only want the parsed event data.
+"""
+from .cli import main
+
+__all__ = ["main"]
@@ -0,0 +1,194 @@
+# gacha_reminder/cli.py
+"""
+Command-line interface for fetching game events without Discord.
+
+Usage examples::
+
+    python -m gacha_reminder events                    # all games, plain text
+    python -m gacha_reminder events --game zzz --json  # one game, JSON document
+    python -m gacha_reminder events --ndjson           # one JSON event per line
+    python -m gacha_reminder events --ics > events.ics # iCalendar file for calendar apps
+    python -m gacha_reminder fetcher --socket /run/gacha/snapshots.sock
+
+``fetcher`` runs the wiki refreshes for every game and publishes the
+snapshots to bot processes started with ``FETCHER_SOCKET`` (see
+:mod:`api.snapshot_ipc`).
+
+Only :mod:`api` and the per-game config/api modules under :mod:`games`
+are imported, none of which depend on :mod:`discord`.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import signal
+import sys
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+from api import PAGE_CACHE, CalendarFeed, RefreshScheduler, SnapshotPublisher, SnapshotStore, WikiAPI, event_to_dict
+from api.refresh import DEFAULT_PATCH_POLL_INTERVAL, DEFAULT_PATCH_WINDOW, DEFAULT_POLL_INTERVAL
+from applog import setup_logging
+from games import GAME_CONFIG
+
+
+async def fetch_events(game_keys: List[str], debug: bool = False) -> Dict[str, List[Dict]]:
+    """Fetch ongoing events for several games concurrently.
+
+    Args:
+        game_keys (List[str]): ``GAME_CONFIG`` keys to fetch.
+        debug (bool): Forwarded to :meth:`WikiAPI.get_ongoing_events_async`.
+
+    Returns:
+        Dict[str, List[Dict]]: Ongoing event dicts keyed by game, in the
+        same order as ``game_keys``.
+    """
+    tasks = [
+        WikiAPI(GAME_CONFIG[key]["api_url"], GAME_CONFIG[key]["category"], game=key).get_ongoing_events_async(debug=debug)
+        for key in game_keys
+    ]
+    results = await asyncio.gather(*tasks)
+    return dict(zip(game_keys, results))
+
+
+def _write_text(results: Dict[str, List[Dict]]) -> None:
+    for game_key, events in results.items():
+        cfg = GAME_CONFIG[game_key]
+        print(f"{cfg['display_name']} ({len(events)} events)")
+        if not events:
+            print("  No ongoing events right now.")
+        for event in events:
+            print(f"  {event['title']} - {event['time_remaining']} | {event['date_range_str']}")
+        print()
+
+
+def _write_json(results: Dict[str, List[Dict]]) -> None:
+    document = {
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "games": {
+            game_key: {
+                "display_name": GAME_CONFIG[game_key]["display_name"],
+                "events": [event_to_dict(e) for e in events],
+            }
+            for game_key, events in results.items()
+        },
+    }
+    json.dump(document, sys.stdout, ensure_ascii=False, indent=2)
+    sys.stdout.write("\n")
+
+
+def _write_ndjson(results: Dict[str, List[Dict]]) -> None:
+    for game_key, events in results.items():
+        for event in events:
+            sys.stdout.write(json.dumps(event_to_dict(event, game=game_key), ensure_ascii=False))
+            sys.stdout.write("\n")
+
+
+def _write_ics(results: Dict[str, List[Dict]]) -> None:
+    feed = CalendarFeed(GAME_CONFIG)
+    for game_key, events in results.items():
+        feed.update_game(game_key, events)
+    body, _ = feed.combined(results)
+    sys.stdout.buffer.write(body)
+
+
+def _cmd_events(args: argparse.Namespace) -> int:
+    game_keys = list(GAME_CONFIG) if args.game == "all" else [args.game]
+
+    # Pipeline progress goes to the logging stream (stderr), so stdout
+    # only carries the requested output format.
+    results = asyncio.run(fetch_events(game_keys, debug=args.debug))
+
+    if args.json:
+        _write_json(results)
+    elif args.ndjson:
+        _write_ndjson(results)
+    elif args.ics:
+        _write_ics(results)
+    else:
+        _write_text(results)
+    return 0
+
+
+async def run_fetcher(socket_path: str, poll_interval: float, patch_poll_interval: float, patch_window: float) -> None:
+    """Refresh every game on the adaptive schedule and publish snapshots on ``socket_path`` until cancelled."""
+    # Stop cleanly on SIGTERM so the socket file is removed.
+    asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, asyncio.current_task().cancel)
+    store = SnapshotStore(GAME_CONFIG, max_age=float("inf"))
+    publisher = SnapshotPublisher(store, socket_path)
+    await publisher.start()
+    try:
+        await RefreshScheduler(store, poll_interval, patch_poll_interval, patch_window).run()
+    finally:
+        await publisher.close()
+
+
+def _cmd_fetcher(args: argparse.Namespace) -> int:
+    PAGE_CACHE.max_bytes = args.page_cache_mb * 1024 * 1024
+    try:
+        asyncio.run(run_fetcher(args.socket, args.poll_interval, args.patch_poll_interval, args.patch_window))
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        pass
+    return 0
+
+
+def _env_number(name: str, default: float) -> float:
+    return float(os.getenv(name) or default)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the top-level argument parser with all subcommands."""
+    parser = argparse.ArgumentParser(
+        prog="gacha_reminder",
+        description="Fetch gacha game events from their Fandom wikis without Discord.",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    events = subparsers.add_parser("events", help="Print currently ongoing events")
+    events.add_argument(
+        "--game",
+        choices=["all", *GAME_CONFIG],
+        default="all",
+        help="Game to fetch (default: all)",
+    )
+    output = events.add_mutually_exclusive_group()
+    output.add_argument("--json", action="store_true", help="Print a single JSON document")
+    output.add_argument("--ndjson", action="store_true", help="Print one JSON event per line")
+    output.add_argument("--ics", action="store_true", help="Print an iCalendar (.ics) feed")
+    events.add_argument("--debug", action="store_true", help="Emit pipeline debug output on stderr")
+    events.set_defaults(handler=_cmd_events)
+
+    fetcher = subparsers.add_parser("fetcher", help="Refresh all games and publish snapshots to bot processes")
+    fetcher.add_argument("--socket", default=os.getenv("FETCHER_SOCKET") or "gacha-snapshots.sock",
+                         help="Unix socket to publish on (default: $FETCHER_SOCKET or gacha-snapshots.sock)")
+    fetcher.add_argument("--poll-interval", type=float,
+                         default=_env_number("SNAPSHOT_POLL_INTERVAL", DEFAULT_POLL_INTERVAL),
+                         help="Seconds between wiki polls (default: $SNAPSHOT_POLL_INTERVAL or %(default)s)")
+    fetcher.add_argument("--patch-poll-interval", type=float,
+                         default=_env_number("SNAPSHOT_PATCH_POLL_INTERVAL", DEFAULT_PATCH_POLL_INTERVAL),
+                         help="Seconds between polls near event start/end times (default: %(default)s)")
+    fetcher.add_argument("--patch-window", type=float,
+                         default=_env_number("SNAPSHOT_PATCH_WINDOW", DEFAULT_PATCH_WINDOW),
+                         help="Seconds either side of event start/end times polled faster (default: %(default)s)")
+    fetcher.add_argument("--page-cache-mb", type=int, default=int(_env_number("PAGE_CACHE_MAX_MB", 32)),
+                         help="Page content cache budget in MB (default: %(default)s)")
+    fetcher.set_defaults(handler=_cmd_fetcher)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Parse ``argv`` and run the selected subcommand.
+
+    Args:
+        argv (Optional[List[str]]): Arguments excluding the program name.
+            Defaults to :data:`sys.argv`.
+
+    Returns:
+        int: Process exit code.
+    """
+    args = build_parser().parse_args(argv)
+    setup_logging()
+    return args.handler(args)
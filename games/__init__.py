@@ -1,3 +1,4 @@
+from api import EventIndex, SnapshotStore
 from .wuwa import get_wuwa_events_async, WUWA_CONFIG
 from .zzz import get_zzz_events_async, ZZZ_CONFIG
 from .genshinimpact import get_genshinimpact_events_async, GENSHINIMPACT_CONFIG
@@ -9,4 +10,11 @@ GAME_CONFIG = {
     "genshinimpact": GENSHINIMPACT_CONFIG,
 }
 
-__all__ = [ "GAME_CONFIG", "get_wuwa_events_async", "WUWA_CONFIG", "get_zzz_events_async", "ZZZ_CONFIG", "get_genshinimpact_events_async", "GENSHINIMPACT_CONFIG"]
\ No newline at end of file
+# Process-wide event snapshots shared by the web server and other consumers
+SNAPSHOTS = SnapshotStore(GAME_CONFIG)
+
+# Title prefix index for /event autocomplete, kept current from snapshot changes
+EVENT_INDEX = EventIndex()
+SNAPSHOTS.add_listener(EVENT_INDEX.on_snapshot)
+
+__all__ = [ "GAME_CONFIG", "SNAPSHOTS", "EVENT_INDEX", "get_wuwa_events_async", "WUWA_CONFIG", "get_zzz_events_async", "ZZZ_CONFIG", "get_genshinimpact_events_async", "GENSHINIMPACT_CONFIG"]
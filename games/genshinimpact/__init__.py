@@ -1,5 +1,6 @@
+# Discord command modules (commands.py) are imported directly by
+# commands/ so that the headless CLI never pulls in discord.
 from .api import get_genshinimpact_events_async
 from .config import GENSHINIMPACT_CONFIG
-from .commands import register_genshinimpact_commands
 
-__all__ = ["get_genshinimpact_events_async", "GENSHINIMPACT_CONFIG", "register_genshinimpact_commands"]
+__all__ = ["get_genshinimpact_events_async", "GENSHINIMPACT_CONFIG"]
@@ -1,44 +1,63 @@
 from __future__ import annotations
 
+import logging
 import time
+from typing import Dict
+
 import discord
 
-from config import GUILD_OBJECT
-from embeds import build_events_embed, send_error
-from api import WikiAPI
-from .api import get_genshinimpact_events_async
+from config import COMMAND_GUILD
+from embeds import EventPages, send_error, send_paginated, send_response, shared_event_pages
+from api.filters import filter_ongoing
+from games import SNAPSHOTS
+from metrics import time_stage
+from tracing import span
 from .config import GENSHINIMPACT_CONFIG
 
-def _make_genshinimpact_embed(events: list, *, extra_footer: str = "") -> tuple[discord.Embed, discord.File]:
-    footer = f"Found {len(events)} active events • Data from {GENSHINIMPACT_CONFIG['display_name']} Wiki"
-    if extra_footer:
-        footer += f" • {extra_footer}"
-    embed = build_events_embed(
+logger = logging.getLogger(__name__)
+
+def _make_genshinimpact_pages(snapshot: Dict) -> EventPages:
+    with time_stage("filter", "genshinimpact") as stage:
+        events = filter_ongoing(snapshot["events"])
+        stage.items = len(events)
+    return EventPages(
         title=f"Current {GENSHINIMPACT_CONFIG['display_name']} Events",
         events=events,
-        footer=footer,
+        footer=f"Found {len(events)} active events • Data from {GENSHINIMPACT_CONFIG['display_name']} Wiki",
         color=GENSHINIMPACT_CONFIG["color"],
         show_dates=True,
+        thumbnail_url=f"attachment://{GENSHINIMPACT_CONFIG['thumbnail_filename']}",
+        game="genshinimpact",
     )
-    thumbnail = discord.File(GENSHINIMPACT_CONFIG["thumbnail_path"], filename=GENSHINIMPACT_CONFIG["thumbnail_filename"])
-    embed.set_thumbnail(url=f"attachment://{GENSHINIMPACT_CONFIG['thumbnail_filename']}")
-    return embed, thumbnail
+
+
+def _make_genshinimpact_thumbnail() -> discord.File:
+    return discord.File(GENSHINIMPACT_CONFIG["thumbnail_path"], filename=GENSHINIMPACT_CONFIG["thumbnail_filename"])
+
 
 def register_genshinimpact_commands(client) -> None:
     @client.tree.command(
         name="events_genshinimpact",
         description="Get the current events for Genshin Impact",
-        guild=GUILD_OBJECT,
+        guild=COMMAND_GUILD,
     )
     async def events_genshinimpact(interaction: discord.Interaction) -> None:
-        try:
-            await interaction.response.defer()
-            events = await get_genshinimpact_events_async(debug=True)
-            if not events:
-                await interaction.followup.send("No ongoing events right now.")
-                return
-            embed, thumbnail = _make_genshinimpact_embed(events)
-            await interaction.followup.send(embed=embed, file=thumbnail)
-        except Exception as exc:
-            print(f"[events_genshinimpact] {exc}")
-            await send_error(interaction, "Failed to fetch events. Please try again later.")
\ No newline at end of file
+        with span("command", command="events_genshinimpact"):
+            try:
+                snapshot = SNAPSHOTS.get_fresh("genshinimpact")
+                if snapshot is None:
+                    # Only defer when a live fetch is needed; cached data is answered in one round trip
+                    await interaction.response.defer()
+                    snapshot = await SNAPSHOTS.get("genshinimpact")
+                # Pages are shared by everyone viewing this snapshot and rendered on demand
+                pages = shared_event_pages(
+                    ("genshinimpact", "ongoing", snapshot["etag"]),
+                    lambda: _make_genshinimpact_pages(snapshot),
+                )
+                if not len(pages):
+                    await send_response(interaction, content="No ongoing events right now.")
+                    return
+                await send_paginated(interaction, pages, file=_make_genshinimpact_thumbnail())
+            except Exception:
+                logger.exception("/events_genshinimpact failed")
+                await send_error(interaction, "Failed to fetch events. Please try again later.")
\ No newline at end of file
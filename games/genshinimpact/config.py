@@ -1,5 +1,3 @@
-import discord
-
 GENSHINIMPACT_CONFIG ={
     "display_name": "Genshin Impact",
     "api_url": "https://genshin-impact.fandom.com/api.php",
@@ -1,6 +1,6 @@
+# Discord command modules (commands.py, dev_commands.py) are imported
+# directly by commands/ so that the headless CLI never pulls in discord.
 from .api import get_wuwa_events_async
 from .config import WUWA_CONFIG
-from .commands import register_wuwa_commands
-from .dev_commands import register_wuwa_dev_commands
 
-__all__ = ["get_wuwa_events_async", "WUWA_CONFIG", "register_wuwa_commands", "register_wuwa_dev_commands"]
\ No newline at end of file
+__all__ = ["get_wuwa_events_async", "WUWA_CONFIG"]
@@ -1,93 +1,129 @@
 from __future__ import annotations
 
+import logging
 import time
+from typing import Dict, List, Tuple
+
 import discord
 
-from config import GUILD_OBJECT
-from embeds import build_events_embed, send_error
+from config import COMMAND_GUILD
+from embeds import EventPages, build_events_embed, send_error, send_paginated, send_response, shared_event_pages
+from api.filters import filter_ongoing
 from api import WikiAPI
-from .api import get_wuwa_events_async
+from games import SNAPSHOTS
+from metrics import time_stage
+from tracing import Span, critical_path, span
 from .config import WUWA_CONFIG
 
+logger = logging.getLogger(__name__)
+
 
-def _make_wuwa_embed(events: list, *, extra_footer: str = "") -> tuple[discord.Embed, discord.File]:
-    footer = f"Found {len(events)} active events • Data from {WUWA_CONFIG['display_name']} Wiki"
-    if extra_footer:
-        footer += f" • {extra_footer}"
-    embed = build_events_embed(
+def _make_wuwa_pages(snapshot: Dict) -> EventPages:
+    with time_stage("filter", "wuwa") as stage:
+        events = filter_ongoing(snapshot["events"])
+        stage.items = len(events)
+    return EventPages(
         title=f"Current {WUWA_CONFIG['display_name']} Events",
         events=events,
-        footer=footer,
+        footer=f"Found {len(events)} active events • Data from {WUWA_CONFIG['display_name']} Wiki",
         color=WUWA_CONFIG["color"],
         show_dates=True,
+        thumbnail_url=f"attachment://{WUWA_CONFIG['thumbnail_filename']}",
+        game="wuwa",
     )
-    thumbnail = discord.File(WUWA_CONFIG["thumbnail_path"], filename=WUWA_CONFIG["thumbnail_filename"])
-    embed.set_thumbnail(url=f"attachment://{WUWA_CONFIG['thumbnail_filename']}")
-    return embed, thumbnail
+
+
+def _make_wuwa_thumbnail() -> discord.File:
+    return discord.File(WUWA_CONFIG["thumbnail_path"], filename=WUWA_CONFIG["thumbnail_filename"])
+
+
+def format_critical_path(path: List[Tuple[int, Span]], limit: int = 1024) -> str:
+    """Render a :func:`tracing.critical_path` result as an indented embed field value."""
+    text = ""
+    for depth, node in path:
+        if depth == 0:
+            continue  # the still-open command span itself
+        line = f"{'  ' * (depth - 1)}`{round(node.duration * 1000)}ms` {node.label()}"
+        if len(text) + len(line) + 1 > limit:
+            break
+        text = f"{text}\n{line}" if text else line
+    return text or "No spans recorded."
 
 
 def register_wuwa_commands(client) -> None:
     @client.tree.command(
         name="events_wuwa",
         description="Get the current events for Wuthering Waves",
-        guild=GUILD_OBJECT,
+        guild=COMMAND_GUILD,
     )
     async def events_wuwa(interaction: discord.Interaction) -> None:
-        try:
-            await interaction.response.defer()
-            events = await get_wuwa_events_async(debug=False)
-            if not events:
-                await interaction.followup.send("No ongoing events right now.")
-                return
-            embed, thumbnail = _make_wuwa_embed(events)
-            await interaction.followup.send(embed=embed, file=thumbnail)
-        except Exception as exc:
-            print(f"[events_wuwa] {exc}")
-            await send_error(interaction, "Failed to fetch events. Please try again later.")
+        with span("command", command="events_wuwa"):
+            try:
+                snapshot = SNAPSHOTS.get_fresh("wuwa")
+                if snapshot is None:
+                    # Only defer when a live fetch is needed; cached data is answered in one round trip
+                    await interaction.response.defer()
+                    snapshot = await SNAPSHOTS.get("wuwa")
+                # Pages are shared by everyone viewing this snapshot and rendered on demand
+                pages = shared_event_pages(
+                    ("wuwa", "ongoing", snapshot["etag"]),
+                    lambda: _make_wuwa_pages(snapshot),
+                )
+                if not len(pages):
+                    await send_response(interaction, content="No ongoing events right now.")
+                    return
+                await send_paginated(interaction, pages, file=_make_wuwa_thumbnail())
+            except Exception:
+                logger.exception("/events_wuwa failed")
+                await send_error(interaction, "Failed to fetch events. Please try again later.")
 
     @client.tree.command(
         name="events_timed",
         description="Get Wuthering Waves events with detailed timing stats",
-        guild=GUILD_OBJECT,
+        guild=COMMAND_GUILD,
     )
     
     # Extra command for metrics
     async def events_timed(interaction: discord.Interaction) -> None:
-        overall_start = time.time()
-        try:
-            await interaction.response.defer()
-            wiki_api = WikiAPI(WUWA_CONFIG["api_url"], WUWA_CONFIG["category"])
-
-            fetch_start = time.time()
-            events = await wiki_api.get_ongoing_events_async(debug=True)
-            fetch_time = round(time.time() - fetch_start, 2)
-
-            if not events:
-                await interaction.followup.send("No ongoing events right now.")
-                return
-
-            process_start = time.time()
-            embed = build_events_embed(
-                title="Current Wuthering Waves Events (Timed)",
-                events=events,
-                footer="",
-                color=discord.Color.gold(),
-                show_dates=True,
-            )
-            process_time = round(time.time() - process_start, 3)
-            total_time = round(time.time() - overall_start, 2)
-            embed.set_footer(
-                text=(
-                    f"Found {len(events)} events • "
-                    f"Fetch: {fetch_time}s • "
-                    f"Process: {process_time}s • "
-                    f"Total: {total_time}s"
+        with span("command", command="events_timed") as command_span:
+            overall_start = time.perf_counter()
+            try:
+                await interaction.response.defer()
+                wiki_api = WikiAPI(WUWA_CONFIG["api_url"], WUWA_CONFIG["category"], game="wuwa")
+
+                fetch_start = time.perf_counter()
+                events = await wiki_api.get_ongoing_events_async(debug=True)
+                fetch_time = round(time.perf_counter() - fetch_start, 2)
+
+                if not events:
+                    await interaction.followup.send("No ongoing events right now.")
+                    return
+
+                with time_stage("render", "wuwa") as render:
+                    embed = build_events_embed(
+                        title="Current Wuthering Waves Events (Timed)",
+                        events=events,
+                        footer="",
+                        color=discord.Color.gold(),
+                        show_dates=True,
+                    )
+                embed.add_field(
+                    name="Critical path",
+                    value=format_critical_path(critical_path(command_span.trace, command_span)),
+                    inline=False,
+                )
+                total_time = round(time.perf_counter() - overall_start, 2)
+                embed.set_footer(
+                    text=(
+                        f"Found {len(events)} events • "
+                        f"Fetch: {fetch_time}s • "
+                        f"Render: {round(render.elapsed, 3)}s • "
+                        f"Total: {total_time}s"
+                    )
                 )
-            )
-            send_start = time.time()
-            await interaction.followup.send(embed=embed)
-            print(f"[TIMING] Send: {round(time.time() - send_start, 3)}s | Total: {total_time}s")
-        except Exception as exc:
-            elapsed = round(time.time() - overall_start, 2)
-            print(f"[events_timed] Failed after {elapsed}s: {exc}")
-            await send_error(interaction, f"Failed after {elapsed}s. Please try again later.")
\ No newline at end of file
+                with time_stage("send", "wuwa"):
+                    await interaction.followup.send(embed=embed)
+            except Exception:
+                elapsed = round(time.perf_counter() - overall_start, 2)
+                logger.exception("/events_timed failed after %.2fs", elapsed)
+                await send_error(interaction, f"Failed after {elapsed}s. Please try again later.")
@@ -1,10 +1,8 @@
-import discord
-
 WUWA_CONFIG = {
     "display_name": "Wuthering Waves",
     "api_url": "https://wutheringwaves.fandom.com/api.php",
     "category": "Events",
-    "color": discord.Color.blue(),
+    "color": 0x3498DB, # discord.Color.blue()
     "thumbnail_path": "images/WutheringWavesThumbnail.jpeg",
     "thumbnail_filename": "WuWaThumbnail.png",
-}
\ No newline at end of file
+}
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import logging
+
 import discord
 
 from config import GUILD_OBJECT
 from embeds import build_events_embed, build_error_embed
 from .api import get_wuwa_events_async
 
+logger = logging.getLogger(__name__)
+
 
 def register_wuwa_dev_commands(client) -> None:
     @client.tree.command(
@@ -27,8 +31,8 @@ def register_wuwa_dev_commands(client) -> None:
                 color=discord.Color.orange(),
             )
             await interaction.followup.send(embed=embed)
-        except Exception as exc:
-            print(f"[events_debug] {exc}")
+        except Exception:
+            logger.exception("/events_debug failed")
             await interaction.followup.send(
                 embed=build_error_embed(description="Failed to fetch events. Check console for details.")
             )
\ No newline at end of file
@@ -1,6 +1,6 @@
+# Discord command modules (commands.py, dev_commands.py) are imported
+# directly by commands/ so that the headless CLI never pulls in discord.
 from .api import get_zzz_events_async
 from .config import ZZZ_CONFIG
-from .commands import register_zzz_commands
-from .dev_commands import register_zzz_dev_commands
 
-__all__ = ["get_zzz_events_async", "ZZZ_CONFIG", "register_zzz_commands", "register_zzz_dev_commands"]
\ No newline at end of file
+__all__ = ["get_zzz_events_async", "ZZZ_CONFIG"]
@@ -1,44 +1,63 @@
 from __future__ import annotations
 
+import logging
+from typing import Dict
+
 import discord
 
-from config import GUILD_OBJECT
-from embeds import build_events_embed, send_error
-from .api import get_zzz_events_async
+from config import COMMAND_GUILD
+from embeds import EventPages, send_error, send_paginated, send_response, shared_event_pages
+from api.filters import filter_ongoing
+from games import SNAPSHOTS
+from metrics import time_stage
+from tracing import span
 from .config import ZZZ_CONFIG
 
+logger = logging.getLogger(__name__)
+
 
-def _make_zzz_embed(events: list, *, extra_footer: str = "") -> tuple[discord.Embed, discord.File]:
-    footer = f"Found {len(events)} active events • Data from {ZZZ_CONFIG['display_name']} Wiki"
-    if extra_footer:
-        footer += f" • {extra_footer}"
-    embed = build_events_embed(
+def _make_zzz_pages(snapshot: Dict) -> EventPages:
+    with time_stage("filter", "zzz") as stage:
+        events = filter_ongoing(snapshot["events"])
+        stage.items = len(events)
+    return EventPages(
         title=f"Current {ZZZ_CONFIG['display_name']} Events",
         events=events,
-        footer=footer,
+        footer=f"Found {len(events)} active events • Data from {ZZZ_CONFIG['display_name']} Wiki",
         color=ZZZ_CONFIG["color"],
         show_dates=True,
+        thumbnail_url=f"attachment://{ZZZ_CONFIG['thumbnail_filename']}",
+        game="zzz",
     )
-    thumbnail = discord.File(ZZZ_CONFIG["thumbnail_path"], filename=ZZZ_CONFIG["thumbnail_filename"])
-    embed.set_thumbnail(url=f"attachment://{ZZZ_CONFIG['thumbnail_filename']}")
-    return embed, thumbnail
+
+
+def _make_zzz_thumbnail() -> discord.File:
+    return discord.File(ZZZ_CONFIG["thumbnail_path"], filename=ZZZ_CONFIG["thumbnail_filename"])
 
 
 def register_zzz_commands(client) -> None:
     @client.tree.command(
         name="events_zzz",
         description="Get the current events for Zenless Zone Zero",
-        guild=GUILD_OBJECT,
+        guild=COMMAND_GUILD,
     )
     async def events_zzz(interaction: discord.Interaction) -> None:
-        try:
-            await interaction.response.defer()
-            events = await get_zzz_events_async(debug=False)
-            if not events:
-                await interaction.followup.send("No ongoing events right now.")
-                return
-            embed, thumbnail = _make_zzz_embed(events)
-            await interaction.followup.send(embed=embed, file=thumbnail)
-        except Exception as exc:
-            print(f"[events_zzz] {exc}")
-            await send_error(interaction, "Failed to fetch events. Please try again later.")
\ No newline at end of file
+        with span("command", command="events_zzz"):
+            try:
+                snapshot = SNAPSHOTS.get_fresh("zzz")
+                if snapshot is None:
+                    # Only defer when a live fetch is needed; cached data is answered in one round trip
+                    await interaction.response.defer()
+                    snapshot = await SNAPSHOTS.get("zzz")
+                # Pages are shared by everyone viewing this snapshot and rendered on demand
+                pages = shared_event_pages(
+                    ("zzz", "ongoing", snapshot["etag"]),
+                    lambda: _make_zzz_pages(snapshot),
+                )
+                if not len(pages):
+                    await send_response(interaction, content="No ongoing events right now.")
+                    return
+                await send_paginated(interaction, pages, file=_make_zzz_thumbnail())
+            except Exception:
+                logger.exception("/events_zzz failed")
+                await send_error(interaction, "Failed to fetch events. Please try again later.")
\ No newline at end of file
@@ -1,10 +1,8 @@
-import discord
-
 ZZZ_CONFIG = {
     "display_name": "Zenless Zone Zero",
     "api_url": "https://zenless-zone-zero.fandom.com/api.php",
     "category": "In-Game_Events",
-    "color": discord.Color.orange(),
+    "color": 0xE67E22, # discord.Color.orange()
     "thumbnail_path": "images/ZenlessZoneZeroThumbnail.png",
     "thumbnail_filename": "ZZZThumbnail.png",
-}
\ No newline at end of file
+}
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import logging
 import re
 import aiohttp
 import discord
@@ -11,6 +12,8 @@ from api import WikiAPI
 from .api import get_zzz_events_async
 from .config import ZZZ_CONFIG
 
+logger = logging.getLogger(__name__)
+
 
 # ------------------------------------------------------------------ #
 #  Helpers                                                             #
@@ -29,30 +32,8 @@ def _make_aware(dt: datetime) -> datetime:
 
 
 async def _fetch_page_content(session: aiohttp.ClientSession, title: str) -> str | None:
-    params = {
-        "action": "query",
-        "format": "json",
-        "prop": "revisions",
-        "titles": title,
-        "rvprop": "content",
-        "rvslots": "main",
-    }
-    async with session.get(ZZZ_CONFIG["api_url"], params=params) as resp:
-        data = await resp.json()
-
-    pages = data.get("query", {}).get("pages", {})
-    if not pages:
-        return None
-
-    page_data = next(iter(pages.values()))
-    if "missing" in page_data:
-        return None
-
-    revisions = page_data.get("revisions", [])
-    if not revisions:
-        return None
-
-    return revisions[0].get("slots", {}).get("main", {}).get("*", "")
+    pages = await WikiAPI(ZZZ_CONFIG["api_url"], game="zzz").get_pages_async([title], session)
+    return pages[0]["content"] if pages else None
 
 
 async def _fetch_category_members(
@@ -96,8 +77,8 @@ def register_zzz_dev_commands(client) -> None:
                 color=discord.Color.red(),
             )
             await interaction.followup.send(embed=embed)
-        except Exception as exc:
-            print(f"[events_debug_zzz] {exc}")
+        except Exception:
+            logger.exception("/events_debug_zzz failed")
             await interaction.followup.send(
                 embed=build_error_embed(description="Failed to fetch events. Check console for details.")
             )
@@ -128,7 +109,7 @@ def register_zzz_dev_commands(client) -> None:
                         else:
                             lines.append(f"**{cat}**: No pages found")
                     except Exception as exc:
-                        print(f"[diagnose_zzz] {cat}: {exc}")
+                        logger.warning("/diagnose_zzz: category %s failed: %s", cat, exc)
                         lines.append(f"**{cat}**: Error – {type(exc).__name__}")
 
                 embed.add_field(name="Category Analysis", value="\n".join(lines), inline=False)
@@ -164,8 +145,8 @@ def register_zzz_dev_commands(client) -> None:
                                 )
 
             await interaction.followup.send(embed=embed)
-        except Exception as exc:
-            print(f"[diagnose_zzz] {exc}")
+        except Exception:
+            logger.exception("/diagnose_zzz failed")
             await interaction.followup.send(
                 embed=build_error_embed("Diagnosis Failed", "Diagnosis encountered an error. Check console for details.")
             )
@@ -179,7 +160,7 @@ def register_zzz_dev_commands(client) -> None:
         TEST_EVENT = '"En-Nah" Assistant Program'
         try:
             await interaction.response.defer()
-            wiki_api = WikiAPI(ZZZ_CONFIG["api_url"], ZZZ_CONFIG["category"])
+            wiki_api = WikiAPI(ZZZ_CONFIG["api_url"], ZZZ_CONFIG["category"], game="zzz")
 
             async with aiohttp.ClientSession() as session:
                 content = await _fetch_page_content(session, TEST_EVENT)
@@ -239,8 +220,8 @@ def register_zzz_dev_commands(client) -> None:
                     embed.add_field(name="Found Date Patterns", value=f"```{', '.join(found[:5])}```", inline=False)
 
             await interaction.followup.send(embed=embed)
-        except Exception as exc:
-            print(f"[test_zzz_parsing] {exc}")
+        except Exception:
+            logger.exception("/test_zzz_parsing failed")
             await interaction.followup.send(
                 embed=build_error_embed("Parsing Test Failed", "Parsing test encountered an error. Check console for details.")
             )
@@ -254,7 +235,7 @@ def register_zzz_dev_commands(client) -> None:
         TEST_EVENT = '"En-Nah" Into Your Lap/2025-09-24'
         try:
             await interaction.response.defer()
-            wiki_api = WikiAPI(ZZZ_CONFIG["api_url"], ZZZ_CONFIG["category"])
+            wiki_api = WikiAPI(ZZZ_CONFIG["api_url"], ZZZ_CONFIG["category"], game="zzz")
 
             async with aiohttp.ClientSession() as session:
                 content = await _fetch_page_content(session, TEST_EVENT)
@@ -288,8 +269,8 @@ def register_zzz_dev_commands(client) -> None:
                     embed.add_field(name="Found Date Patterns", value=f"```{', '.join(found[:5])}```", inline=False)
 
             await interaction.followup.send(embed=embed)
-        except Exception as exc:
-            print(f"[test_2025_event] {exc}")
+        except Exception:
+            logger.exception("/test_2025_event failed")
             await interaction.followup.send(
                 embed=build_error_embed("Test Failed", "Test encountered an error. Check console for details.")
             )
@@ -331,8 +312,8 @@ def register_zzz_dev_commands(client) -> None:
 
             embed.set_footer(text=f"Total events found: {len(members)}")
             await interaction.followup.send(embed=embed)
-        except Exception as exc:
-            print(f"[search_recent_zzz] {exc}")
+        except Exception:
+            logger.exception("/search_recent_zzz failed")
             await interaction.followup.send(
                 embed=build_error_embed("Search Failed", "Search encountered an error. Check console for details.")
             )
\ No newline at end of file
@@ -6,61 +6,170 @@ Initializes the bot client, configures logging, registers all slash
 commands (game-facing and developer), and connects to Discord.
 """
 
+import asyncio
 import logging
 import discord
 from discord.ext import commands
 
-from config import TOKEN, GUILD_ID, GUILD_OBJECT
-from commands import register_game_commands, register_dev_commands
+from config import (
+    TOKEN, GUILD_ID, GUILD_OBJECT,
+    MULTI_GUILD, SHARD_COUNT,
+    SNAPSHOT_MAX_AGE, SNAPSHOT_POLL_INTERVAL, SNAPSHOT_PATCH_POLL_INTERVAL, SNAPSHOT_PATCH_WINDOW,
+    FETCHER_SOCKET, PAGE_CACHE_MAX_MB,
+    WEB_SERVER_ENABLED, WEB_SERVER_HOST, WEB_SERVER_PORT, WEB_CACHE_MAX_AGE,
+    REMINDER_CHANNEL_IDS, REMINDER_LEAD_HOURS, REMINDER_NOTIFY_STARTS,
+    REMINDERS_ENABLED, SUBSCRIPTIONS_DB_PATH,
+    TRACE_FILE, TRACE_OTLP_ENDPOINT,
+    LOOP_LAG_THRESHOLD,
+)
+from api import PAGE_CACHE, RefreshScheduler, SnapshotSubscriber
+from commands import register_game_commands, register_dev_commands, register_subscription_commands
+from commands.sync import sync_command_tree
+from games import SNAPSHOTS
+from metrics import LOOP_MONITOR
+from reminders.subscriptions import SubscriptionStore
+from applog import setup_logging
+from tracing import FileSpanExporter, OTLPHttpExporter, add_exporter
+
+logger = logging.getLogger(__name__)
 
 
 # ------------------------------------------------------------------ #
 #  Bot client                                                        #
 # ------------------------------------------------------------------ #
 
-class Client(commands.Bot):
+# In multi-guild mode the bot shards automatically; every shard shares the
+# same process-wide SNAPSHOTS, so more guilds never means more wiki traffic.
+_BotBase = commands.AutoShardedBot if MULTI_GUILD else commands.Bot
+
+
+class Client(_BotBase):
     """Custom Discord bot client for the Gacha Reminder bot.
 
-    Inherits from :class:`discord.ext.commands.Bot` and overrides the
-    ``on_ready`` event to sync the application command tree to the
-    configured guild on startup.
+    Inherits from :class:`discord.ext.commands.Bot` (or
+    :class:`discord.ext.commands.AutoShardedBot` when
+    :data:`config.MULTI_GUILD` is set). ``setup_hook`` syncs the
+    application command tree once per start (only if it changed) and
+    starts background services such as the local event API and the
+    reminder scheduler; ``close`` stops them.
     """
 
+    web_runner = None
+    refresher = None
+    reminders = None
+    dispatcher = None
+    subscriptions: SubscriptionStore | None = None
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.background_tasks: list[asyncio.Task] = []
+
+    async def setup_hook(self) -> None:
+        """Sync commands and start background services once logged in.
+
+        Runs :func:`commands.sync.sync_command_tree`, which only uploads
+        command scopes whose hash changed since the last sync. Starts the
+        boundary-aware snapshot refresh (:class:`api.RefreshScheduler`),
+        which keeps the shared snapshot store current so reads rarely hit
+        the wiki — or, when :data:`config.FETCHER_SOCKET` is set, a
+        :class:`api.SnapshotSubscriber` taking snapshots from a separate
+        fetcher process instead — and, when :data:`config.WEB_SERVER_ENABLED` is set, the
+        local JSON event API. When :data:`config.REMINDERS_ENABLED` is set,
+        starts the reminder scheduler and its subscription-aware dispatcher,
+        fed by the same refresh. The event-loop lag watchdog starts first
+        so it also covers the sync.
+        """
+        LOOP_MONITOR.threshold = LOOP_LAG_THRESHOLD
+        self.background_tasks.append(asyncio.create_task(LOOP_MONITOR.run()))
+
+        try:
+            results = await sync_command_tree(self)
+            for scope, count in results.items():
+                logger.info("Command sync %s: %s", scope, "unchanged, skipped" if count is None else f"synced {count} commands")
+        except Exception:
+            logger.exception("Error syncing commands")
+
+        PAGE_CACHE.max_bytes = PAGE_CACHE_MAX_MB * 1024 * 1024
+        if FETCHER_SOCKET:
+            # The fetcher process owns freshness; this process never scrapes.
+            self.refresher = SnapshotSubscriber(SNAPSHOTS, FETCHER_SOCKET)
+            SNAPSHOTS.max_age = float("inf")
+            SNAPSHOTS.source = self.refresher.snapshot
+        else:
+            # The refresh below keeps snapshots current; reads only refresh if it falls behind.
+            SNAPSHOTS.max_age = max(SNAPSHOT_MAX_AGE, SNAPSHOT_POLL_INTERVAL)
+            self.refresher = RefreshScheduler(
+                SNAPSHOTS,
+                poll_interval=SNAPSHOT_POLL_INTERVAL,
+                patch_poll_interval=SNAPSHOT_PATCH_POLL_INTERVAL,
+                patch_window=SNAPSHOT_PATCH_WINDOW,
+            )
+        if WEB_SERVER_ENABLED:
+            from web import start_web_server
+            self.web_runner = await start_web_server(
+                SNAPSHOTS, WEB_SERVER_HOST, WEB_SERVER_PORT, WEB_CACHE_MAX_AGE
+            )
+        if self.subscriptions is not None:
+            from reminders import ReminderScheduler
+            from reminders.dispatcher import ReminderDispatcher
+            self.dispatcher = ReminderDispatcher(self, self.subscriptions, REMINDER_CHANNEL_IDS)
+            self.reminders = ReminderScheduler(
+                self.dispatcher,
+                lead_hours=REMINDER_LEAD_HOURS,
+                notify_starts=REMINDER_NOTIFY_STARTS,
+            )
+            SNAPSHOTS.add_listener(self.reminders.on_snapshot)
+            self.background_tasks.append(asyncio.create_task(self.reminders.run()))
+        self.background_tasks.append(asyncio.create_task(self.refresher.run()))
+
+    async def close(self) -> None:
+        """Stop background services before disconnecting from Discord."""
+        for task in self.background_tasks:
+            task.cancel()
+        if self.dispatcher is not None:
+            self.dispatcher.close()
+        if self.web_runner is not None:
+            await self.web_runner.cleanup()
+        await super().close()
+
     async def on_ready(self) -> None:
         """Handle the ``on_ready`` event fired after a successful login.
 
-        Prints the logged-in user to stdout and syncs all registered
-        slash commands to the guild defined in :data:`config.GUILD_OBJECT`.
-
-        Raises:
-            Exception: Any error raised by ``tree.sync()`` is caught,
-                logged to stdout, and swallowed so the bot stays online.
+        Fires again on every gateway reconnect, so it only logs; command
+        syncing happens once in :meth:`setup_hook`.
         """
-        print(f"Logged in as {self.user}")
-        try:
-            synced = await self.tree.sync(guild=GUILD_OBJECT)
-            print(f"Synced {len(synced)} commands to guild {GUILD_OBJECT.id}")
-        except Exception as exc:
-            print(f"Error syncing commands: {exc}")
+        logger.info("Logged in as %s", self.user)
 
 
 # ------------------------------------------------------------------ #
 #  Setup                                                             #
 # ------------------------------------------------------------------ #
 
-logging.basicConfig(level=logging.INFO)
+setup_logging()
+
+if TRACE_FILE:
+    add_exporter(FileSpanExporter(TRACE_FILE))
+if TRACE_OTLP_ENDPOINT:
+    add_exporter(OTLPHttpExporter(TRACE_OTLP_ENDPOINT))
 
 intents = discord.Intents.default()
 intents.message_content = True
 
-client = Client(command_prefix="!", intents=intents)
+if MULTI_GUILD:
+    client = Client(command_prefix="!", intents=intents, shard_count=SHARD_COUNT)
+else:
+    client = Client(command_prefix="!", intents=intents)
 
 # Register slash commands
 register_game_commands(client)
 register_dev_commands(client)
+if REMINDERS_ENABLED:
+    client.subscriptions = SubscriptionStore(SUBSCRIPTIONS_DB_PATH)
+    register_subscription_commands(client, client.subscriptions)
 
 # ------------------------------------------------------------------ #
 #  Entry point                                                       #
 # ------------------------------------------------------------------ #
 
-client.run(TOKEN)  # type: ignore[arg-type]
+# log_handler=None: keep discord.py on the queued root handler from setup_logging().
+client.run(TOKEN, log_handler=None)  # type: ignore[arg-type]
@@ -0,0 +1,6 @@
+from .registry import Counter, Histogram, MetricsRegistry
+from .stages import REGISTRY, STAGES, STAGE_ITEMS, STAGE_SECONDS, StageTimer, stage_summary, time_stage
+from .loop_lag import LOOP_LAG_SECONDS, LOOP_MONITOR, LOOP_STALLS, LoopLagMonitor, Stall
+from .profiling import profile_async, pstats_bytes, top_functions
+
+__all__ = ["Counter", "Histogram", "MetricsRegistry", "REGISTRY", "STAGES", "STAGE_ITEMS", "STAGE_SECONDS", "StageTimer", "stage_summary", "time_stage", "LOOP_LAG_SECONDS", "LOOP_MONITOR", "LOOP_STALLS", "LoopLagMonitor", "Stall", "profile_async", "pstats_bytes", "top_functions"]
@@ -0,0 +1,163 @@
+# metrics/loop_lag.py - Event-loop lag watchdog
+"""
+Event-loop scheduling lag monitor.
+
+:class:`LoopLagMonitor` has two cooperating parts:
+
+* a coroutine on the loop that sleeps for ``interval`` seconds and
+  records how late it woke up in :data:`LOOP_LAG_SECONDS`;
+* a daemon watchdog thread that notices when that coroutine is overdue
+  by more than ``threshold`` seconds and captures the loop thread's
+  stack while the loop is still blocked.
+
+When the loop recovers, the stall is logged together with the captured
+stack, counted in :data:`LOOP_STALLS` under the project code location
+that was running, and kept in a short list of worst offenders for the
+``/loop_lag`` dev command. A healthy loop costs one timer wake-up per
+``interval`` plus a sleeping thread.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+from datetime import datetime, timezone
+from typing import List, Optional
+
+from .stages import REGISTRY
+
+logger = logging.getLogger(__name__)
+
+# Frames outside this directory (stdlib, site-packages) are skipped when
+# attributing a stall to a code location.
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+LOOP_LAG_SECONDS = REGISTRY.histogram(
+    "gacha_event_loop_lag_seconds",
+    "How late the loop lag probe woke up, i.e. event-loop scheduling delay.",
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+LOOP_STALLS = REGISTRY.counter(
+    "gacha_event_loop_stalls_total",
+    "Event-loop stalls longer than the watchdog threshold, by blocking code location.",
+    ("location",),
+)
+
+
+class Stall:
+    """One period in which the event loop was blocked past the threshold.
+
+    Attributes:
+        lag (float): How late the probe woke up, in seconds.
+        when (datetime): UTC time the loop recovered.
+        location (str): Innermost project frame running during the stall,
+            as ``"path.py:line in function"``, or ``"unknown"`` when the
+            watchdog could not sample the stack in time.
+        stack (str): Formatted stack of the loop thread, innermost last.
+    """
+
+    def __init__(self, lag: float, location: str, stack: str):
+        self.lag = lag
+        self.when = datetime.now(timezone.utc)
+        self.location = location
+        self.stack = stack
+
+
+def _blocking_location(frames: traceback.StackSummary) -> str:
+    for frame in reversed(frames):
+        path = os.path.abspath(frame.filename)
+        if path.startswith(PROJECT_ROOT) and "site-packages" not in path:
+            return f"{os.path.relpath(path, PROJECT_ROOT)}:{frame.lineno} in {frame.name}"
+    if frames:
+        return f"{os.path.basename(frames[-1].filename)}:{frames[-1].lineno} in {frames[-1].name}"
+    return "unknown"
+
+
+class LoopLagMonitor:
+    """Measure event-loop lag and capture the stack of long stalls.
+
+    Attributes:
+        interval (float): Seconds between lag probes.
+        threshold (float): Lag in seconds above which a stall is recorded
+            and its stack captured.
+        keep (int): Number of worst stalls retained by :meth:`worst`.
+        max_lag (float): Largest lag observed since start.
+    """
+
+    def __init__(self, interval: float = 0.1, threshold: float = 0.25, keep: int = 10):
+        self.interval = interval
+        self.threshold = threshold
+        self.keep = keep
+        self.max_lag = 0.0
+        self._worst: List[Stall] = []
+        self._lock = threading.Lock()
+        self._due: Optional[float] = None
+        self._captured: Optional[traceback.StackSummary] = None
+        self._loop_thread: Optional[int] = None
+        self._stopped = threading.Event()
+
+    @property
+    def running(self) -> bool:
+        """Whether :meth:`run` is currently active."""
+        return self._loop_thread is not None
+
+    def worst(self) -> List[Stall]:
+        """Return the retained stalls, longest first."""
+        with self._lock:
+            return list(self._worst)
+
+    def _watch(self) -> None:
+        # Poll often enough to catch a stall while it is still in progress.
+        poll = min(self.interval, self.threshold / 2)
+        while not self._stopped.wait(poll):
+            with self._lock:
+                if self._due is None or self._captured is not None:
+                    continue
+                if time.perf_counter() - self._due < self.threshold:
+                    continue
+                frame = sys._current_frames().get(self._loop_thread)
+                if frame is not None:
+                    self._captured = traceback.extract_stack(frame)
+
+    def _record(self, lag: float, frames: Optional[traceback.StackSummary]) -> None:
+        if frames is None:
+            location, stack = "unknown", ""
+        else:
+            location, stack = _blocking_location(frames), "".join(frames.format())
+        stall = Stall(lag, location, stack)
+        LOOP_STALLS.inc(location=location)
+        with self._lock:
+            self._worst.append(stall)
+            self._worst.sort(key=lambda s: s.lag, reverse=True)
+            del self._worst[self.keep:]
+        logger.warning("Event loop blocked for %.0f ms at %s\n%s", lag * 1000, location, stack.rstrip())
+
+    async def run(self) -> None:
+        """Probe the running loop until cancelled."""
+        self._loop_thread = threading.get_ident()
+        self._stopped.clear()
+        watchdog = threading.Thread(target=self._watch, name="loop-lag-watchdog", daemon=True)
+        watchdog.start()
+        try:
+            while True:
+                with self._lock:
+                    self._due = time.perf_counter() + self.interval
+                await asyncio.sleep(self.interval)
+                with self._lock:
+                    lag = max(0.0, time.perf_counter() - self._due)
+                    frames, self._captured = self._captured, None
+                    self._due = None
+                LOOP_LAG_SECONDS.observe(lag)
+                self.max_lag = max(self.max_lag, lag)
+                if lag >= self.threshold:
+                    self._record(lag, frames)
+        finally:
+            self._stopped.set()
+            self._loop_thread = None
+
+
+LOOP_MONITOR = LoopLagMonitor()
@@ -0,0 +1,115 @@
+# metrics/stages.py - Pipeline stage timing
+"""
+Latency histograms and item counters for the event pipeline stages.
+
+Stages, in pipeline order:
+
+* ``enumerate``     – listing the category members (all ``cmcontinue`` pages).
+* ``content_fetch`` – one batched ``prop=revisions`` request.
+* ``parse``         – turning page wikitext into event dicts.
+* ``filter``        – selecting events from a snapshot for a response.
+* ``render``        – building an embed.
+* ``send``          – delivering a response to Discord.
+
+Every observation is labelled with the ``game`` (``GAME_CONFIG`` key, or
+``"all"`` for cross-game commands) and its ``outcome`` (``"ok"`` or
+``"error"``).
+"""
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+
+from tracing import span
+from .registry import MetricsRegistry
+
+STAGES = ("enumerate", "content_fetch", "parse", "filter", "render", "send")
+
+REGISTRY = MetricsRegistry()
+
+STAGE_SECONDS = REGISTRY.histogram(
+    "gacha_stage_duration_seconds",
+    "Time spent in each event pipeline stage.",
+    ("stage", "game", "outcome"),
+)
+STAGE_ITEMS = REGISTRY.counter(
+    "gacha_stage_items_total",
+    "Items handled by each pipeline stage (members, pages, events or embeds).",
+    ("stage", "game", "outcome"),
+)
+
+
+class StageTimer:
+    """Handle yielded by :func:`time_stage`.
+
+    Attributes:
+        outcome (str): Recorded outcome; set to ``"error"`` for failures
+            that are handled without raising.
+        items (int): Number of items the stage handled.
+        elapsed (float): Duration in seconds, available once the block exits.
+    """
+
+    def __init__(self):
+        self.outcome = "ok"
+        self.items = 0
+        self.elapsed = 0.0
+
+
+@contextmanager
+def time_stage(stage: str, game: str) -> Iterator[StageTimer]:
+    """Time a block as one observation of ``stage`` for ``game``.
+
+    The block also runs inside a tracing span named after the stage, so
+    stage timings show up in request traces. An exception escaping the
+    block is recorded with outcome ``"error"`` and re-raised.
+
+    Args:
+        stage (str): One of :data:`STAGES`.
+        game (str): ``GAME_CONFIG`` key, or ``"all"``.
+
+    Yields:
+        StageTimer: Lets the block set ``outcome`` and ``items``.
+    """
+    timer = StageTimer()
+    with span(stage, game=game) as current:
+        start = time.perf_counter()
+        try:
+            yield timer
+        except BaseException:
+            timer.outcome = "error"
+            raise
+        finally:
+            timer.elapsed = time.perf_counter() - start
+            current.set(outcome=timer.outcome, items=timer.items)
+            STAGE_SECONDS.observe(timer.elapsed, stage=stage, game=game, outcome=timer.outcome)
+            if timer.items:
+                STAGE_ITEMS.inc(timer.items, stage=stage, game=game, outcome=timer.outcome)
+
+
+def stage_summary(game: Optional[str] = None) -> List[Dict]:
+    """Return count, error count and p50/p95/p99 latency for every stage seen so far.
+
+    Args:
+        game (Optional[str]): Restrict to one game; all games when ``None``.
+
+    Returns:
+        List[Dict]: One dict per stage and game with ``"stage"``, ``"game"``,
+        ``"count"``, ``"errors"``, ``"p50"``, ``"p95"`` and ``"p99"`` (seconds).
+    """
+    pairs = sorted({(stage, series_game) for stage, series_game, _ in STAGE_SECONDS.series()},
+                   key=lambda pair: (STAGES.index(pair[0]) if pair[0] in STAGES else len(STAGES), pair[1]))
+    rows = []
+    for stage, series_game in pairs:
+        if game is not None and series_game != game:
+            continue
+        rows.append({
+            "stage": stage,
+            "game": series_game,
+            "count": STAGE_SECONDS.count(stage=stage, game=series_game),
+            "errors": STAGE_SECONDS.count(stage=stage, game=series_game, outcome="error"),
+            "p50": STAGE_SECONDS.quantile(0.50, stage=stage, game=series_game),
+            "p95": STAGE_SECONDS.quantile(0.95, stage=stage, game=series_game),
+            "p99": STAGE_SECONDS.quantile(0.99, stage=stage, game=series_game),
+        })
+    return rows
@@ -0,0 +1,5 @@
+# The Discord-facing dispatcher (reminders/dispatcher.py) is imported directly
+# by main.py so that the scheduler itself stays usable without discord.
+from .scheduler import ReminderScheduler, event_key
+
+__all__ = ["ReminderScheduler", "event_key"]
@@ -0,0 +1,196 @@
+# reminders/dispatcher.py - Batched, rate-limited reminder fan-out
+"""
+Discord delivery for :class:`reminders.ReminderScheduler`.
+
+:class:`ReminderDispatcher` is the scheduler's callback. Reminders that
+fall due within a short coalescing window are collected, matched against
+the stored subscriptions in one query, and grouped by destination
+channel so each channel gets a *single* message listing every relevant
+event and mentioning every subscribed user.
+
+Messages go through a send queue drained by a few worker tasks. Each
+send first takes a token from a global bucket and from a per-channel
+bucket sized to Discord's message route limits, so large notification
+storms are paced instead of running into HTTP 429 responses.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import discord
+
+from embeds import build_reminder_embed
+from games import GAME_CONFIG
+from .subscriptions import SubscriptionStore, subscription_matches
+
+logger = logging.getLogger(__name__)
+
+# Discord allows 5 messages per 5 seconds per channel and ~50 requests per
+# second globally; stay slightly under both.
+CHANNEL_RATE = (5, 5.0)
+GLOBAL_RATE = (40, 1.0)
+
+# Discord rejects message content longer than this many characters.
+MESSAGE_CONTENT_LIMIT = 2000
+
+
+class TokenBucket:
+    """Async token bucket allowing ``capacity`` acquisitions per ``period`` seconds."""
+
+    def __init__(self, capacity: int, period: float):
+        self.capacity = capacity
+        self.rate = capacity / period
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+def _chunk_mentions(user_ids: Iterable[int]) -> List[str]:
+    chunks: List[str] = []
+    current = ""
+    for user_id in sorted(user_ids):
+        mention = f"<@{user_id}>"
+        if current and len(current) + 1 + len(mention) > MESSAGE_CONTENT_LIMIT:
+            chunks.append(current)
+            current = ""
+        current = f"{current} {mention}".strip()
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+class ReminderDispatcher:
+    """Reminder callback that fans batches out to subscribers per channel.
+
+    Attributes:
+        broadcast_channel_ids (List[int]): Channels that receive every reminder.
+        coalesce_window (float): Seconds to keep collecting due reminders
+            before fanning them out together.
+    """
+
+    def __init__(
+        self,
+        client: discord.Client,
+        subscriptions: SubscriptionStore,
+        broadcast_channel_ids: Iterable[int] = (),
+        coalesce_window: float = 2.0,
+        workers: int = 4,
+    ):
+        """Initialize the dispatcher.
+
+        Args:
+            client (discord.Client): The running bot client.
+            subscriptions (SubscriptionStore): Source of per-user and
+                per-channel subscriptions.
+            broadcast_channel_ids (Iterable[int]): Channels that get every
+                reminder regardless of subscriptions.
+            coalesce_window (float): Seconds to batch reminders for
+                (default ``2.0``).
+            workers (int): Number of concurrent send workers (default ``4``).
+        """
+        self.client = client
+        self.subscriptions = subscriptions
+        self.broadcast_channel_ids = list(broadcast_channel_ids)
+        self.coalesce_window = coalesce_window
+
+        self._pending: List[Dict] = []
+        self._flush_task: Optional[asyncio.Task] = None
+        self._queue: asyncio.Queue[Tuple[int, str, Optional[discord.Embed]]] = asyncio.Queue()
+        self._global_bucket = TokenBucket(*GLOBAL_RATE)
+        self._channel_buckets: Dict[int, TokenBucket] = {}
+        self._workers = [asyncio.create_task(self._worker()) for _ in range(workers)]
+
+    async def __call__(self, reminders: List[Dict]) -> None:
+        """Queue ``reminders`` for the next coalesced fan-out."""
+        self._pending.extend(reminders)
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self.coalesce_window)
+        batch, self._pending = self._pending, []
+        self._flush_task = None
+        try:
+            await self.fan_out(batch)
+        except Exception:
+            logger.exception("Fan-out of %d reminders failed", len(batch))
+
+    async def fan_out(self, reminders: List[Dict]) -> None:
+        """Group ``reminders`` by destination channel and enqueue one message each."""
+        await self.client.wait_until_ready()
+
+        # channel -> {id(reminder): reminder}, so a reminder is listed once per channel
+        per_channel: Dict[int, Dict[int, Dict]] = {
+            channel_id: {id(r): r for r in reminders} for channel_id in self.broadcast_channel_ids
+        }
+        mentions: Dict[int, Set[int]] = {}
+
+        by_game: Dict[str, List[Dict]] = {}
+        for reminder in reminders:
+            by_game.setdefault(reminder["game"], []).append(reminder)
+
+        for sub in await self.subscriptions.for_games(by_game):
+            matched = [r for r in by_game[sub["game"]] if subscription_matches(sub, r["game"], r["event"]["title"])]
+            if not matched:
+                continue
+            channel_reminders = per_channel.setdefault(sub["channel_id"], {})
+            for reminder in matched:
+                channel_reminders[id(reminder)] = reminder
+            if sub["kind"] == "user":
+                mentions.setdefault(sub["channel_id"], set()).add(sub["target_id"])
+
+        game_names = {key: cfg["display_name"] for key, cfg in GAME_CONFIG.items()}
+        for channel_id, channel_reminders in per_channel.items():
+            ordered = sorted(channel_reminders.values(), key=lambda r: r["due"])
+            embed = build_reminder_embed(ordered, game_names)
+            chunks = _chunk_mentions(mentions.get(channel_id, ())) or [""]
+            self._queue.put_nowait((channel_id, chunks[0], embed))
+            for chunk in chunks[1:]:
+                self._queue.put_nowait((channel_id, chunk, None))
+
+    async def _worker(self) -> None:
+        while True:
+            channel_id, content, embed = await self._queue.get()
+            try:
+                await self._send(channel_id, content, embed)
+            except Exception as exc:
+                logger.warning("Could not post to channel %s: %s", channel_id, exc)
+            finally:
+                self._queue.task_done()
+
+    async def _send(self, channel_id: int, content: str, embed: Optional[discord.Embed]) -> None:
+        bucket = self._channel_buckets.get(channel_id)
+        if bucket is None:
+            bucket = self._channel_buckets[channel_id] = TokenBucket(*CHANNEL_RATE)
+        await bucket.acquire()
+        await self._global_bucket.acquire()
+
+        channel = self.client.get_channel(channel_id) or await self.client.fetch_channel(channel_id)
+        kwargs: Dict = {"allowed_mentions": discord.AllowedMentions(users=True, roles=False, everyone=False)}
+        if content:
+            kwargs["content"] = content
+        if embed is not None:
+            kwargs["embed"] = embed
+        await channel.send(**kwargs)  # type: ignore[union-attr]
+
+    def close(self) -> None:
+        """Cancel the send workers and any pending flush."""
+        for task in self._workers:
+            task.cancel()
+        if self._flush_task is not None:
+            self._flush_task.cancel()
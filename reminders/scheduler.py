@@ -0,0 +1,207 @@
+# reminders/scheduler.py - Timer-heap reminder scheduler
+"""
+Reminder scheduler driven by a single min-heap of event boundaries.
+
+Every reminder is identified by a key ``(game, event_key, kind)`` where
+``kind`` is ``"start"`` for an event going live or ``"ending:<hours>"``
+for "``<hours>`` hours before the event ends". The scheduler keeps:
+
+* ``_due``  – ``key -> due timestamp`` for every live reminder.
+* ``_heap`` – ``(due, seq, key)`` tuples ordered by due time.
+* ``_by_game`` – ``game -> set of keys``, so a snapshot refresh only
+  touches the reminders of the game that changed.
+
+Removing or rescheduling a reminder only updates ``_due``; the matching
+heap entry becomes stale and is skipped when it reaches the top (lazy
+deletion). The heap is compacted once stale entries outnumber live ones.
+
+:meth:`ReminderScheduler.run` sleeps until the earliest due time (or
+until an update moves the head earlier), so an idle scheduler costs no
+CPU regardless of how many reminders are queued.
+"""
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from api.filters import is_permanent, to_timestamp
+from api.snapshot import event_key
+
+logger = logging.getLogger(__name__)
+
+ReminderKey = Tuple[str, str, str]
+
+# Called with every reminder that fell due in one wake-up.
+ReminderCallback = Callable[[List[Dict]], Awaitable[None]]
+
+
+class ReminderScheduler:
+    """Min-heap scheduler for event start and "ending soon" reminders.
+
+    Attributes:
+        lead_hours (Tuple[float, ...]): Lead times before an event's end
+            at which an ``"ending:<hours>"`` reminder fires.
+        notify_starts (bool): Whether to schedule ``"start"`` reminders.
+    """
+
+    def __init__(
+        self,
+        callback: ReminderCallback,
+        lead_hours: Iterable[float] = (24,),
+        notify_starts: bool = True,
+    ):
+        """Initialize an empty scheduler.
+
+        Args:
+            callback (ReminderCallback): Coroutine function called with the
+                list of reminder dicts that became due together. Each dict
+                has ``"game"``, ``"kind"``, ``"event"`` and ``"due"``
+                (aware UTC datetime) keys.
+            lead_hours (Iterable[float]): Hours before the end of an event
+                at which to remind (default ``(24,)``).
+            notify_starts (bool): Also remind when an event starts
+                (default ``True``).
+        """
+        self._callback = callback
+        self.lead_hours = tuple(sorted(set(lead_hours), reverse=True))
+        self.notify_starts = notify_starts
+
+        self._heap: List[Tuple[float, int, ReminderKey]] = []
+        self._due: Dict[ReminderKey, float] = {}
+        self._payload: Dict[ReminderKey, Dict] = {}
+        self._by_game: Dict[str, Set[ReminderKey]] = {}
+        self._seq = itertools.count()
+        self._wakeup = asyncio.Event()
+        # Due time run() is currently sleeping towards (inf when idle).
+        self._sleeping_until = float("inf")
+
+    def __len__(self) -> int:
+        return len(self._due)
+
+    # -------------------------------------------------------------- #
+    #  Heap maintenance                                                #
+    # -------------------------------------------------------------- #
+
+    def _boundaries(self, game: str, event: Dict) -> Dict[ReminderKey, float]:
+        key = event_key(event)
+        boundaries: Dict[ReminderKey, float] = {}
+        if self.notify_starts:
+            boundaries[(game, key, "start")] = to_timestamp(event["start_date"])
+        if not is_permanent(event):
+            end = event["end_date"]
+            for hours in self.lead_hours:
+                boundaries[(game, key, f"ending:{hours:g}")] = to_timestamp(end - timedelta(hours=hours))
+        return boundaries
+
+    def _push(self, key: ReminderKey, due: float, payload: Dict) -> None:
+        self._due[key] = due
+        self._payload[key] = payload
+        heapq.heappush(self._heap, (due, next(self._seq), key))
+        if due < self._sleeping_until:
+            self._wakeup.set()
+
+    def _discard(self, key: ReminderKey) -> None:
+        self._due.pop(key, None)
+        self._payload.pop(key, None)
+
+    def _compact(self) -> None:
+        if len(self._heap) > 2 * len(self._due) + 64:
+            self._heap = [item for item in self._heap if self._due.get(item[2]) == item[0]]
+            heapq.heapify(self._heap)
+
+    def apply_snapshot(self, game: str, events: List[Dict], now: Optional[float] = None) -> None:
+        """Diff ``events`` against the reminders already queued for ``game``.
+
+        New or moved boundaries are pushed, boundaries of events that
+        disappeared are dropped, and unchanged ones are left alone.
+        Boundaries already in the past are never scheduled, so a refresh
+        cannot re-fire a reminder that was already sent.
+
+        Args:
+            game (str): ``GAME_CONFIG`` key the events belong to.
+            events (List[Dict]): The game's full, current event list.
+            now (Optional[float]): Current UNIX time (default ``time.time()``).
+        """
+        now = time.time() if now is None else now
+        wanted: Dict[ReminderKey, Tuple[float, Dict]] = {}
+        for event in events:
+            for key, due in self._boundaries(game, event).items():
+                if due > now:
+                    wanted[key] = (due, event)
+
+        current = self._by_game.get(game, set())
+        for key in current - wanted.keys():
+            self._discard(key)
+        for key, (due, event) in wanted.items():
+            if self._due.get(key) != due:
+                self._push(key, due, {"game": game, "kind": key[2], "event": event})
+            else:
+                # Same boundary; keep the heap entry but show the latest event data.
+                self._payload[key]["event"] = event
+
+        self._by_game[game] = set(wanted)
+        self._compact()
+
+    def on_snapshot(self, game: str, previous: Optional[Dict], snapshot: Dict) -> None:
+        """:class:`api.snapshot.SnapshotStore` listener adapter for :meth:`apply_snapshot`."""
+        self.apply_snapshot(game, snapshot["events"])
+
+    def next_due(self) -> Optional[float]:
+        """Return the UNIX time of the earliest live reminder, or ``None``."""
+        while self._heap:
+            due, _, key = self._heap[0]
+            if self._due.get(key) == due:
+                return due
+            heapq.heappop(self._heap)
+        return None
+
+    def pop_due(self, now: Optional[float] = None) -> List[Dict]:
+        """Remove and return every reminder due at or before ``now``."""
+        now = time.time() if now is None else now
+        fired: List[Dict] = []
+        while True:
+            due = self.next_due()
+            if due is None or due > now:
+                break
+            _, _, key = heapq.heappop(self._heap)
+            payload = self._payload[key]
+            self._discard(key)
+            self._by_game.get(key[0], set()).discard(key)
+            fired.append({**payload, "due": datetime.fromtimestamp(due, timezone.utc)})
+        return fired
+
+    # -------------------------------------------------------------- #
+    #  Run loop                                                        #
+    # -------------------------------------------------------------- #
+
+    async def run(self) -> None:
+        """Sleep until reminders fall due and hand them to the callback, forever."""
+        while True:
+            self._wakeup.clear()
+            due = self.next_due()
+            self._sleeping_until = float("inf") if due is None else due
+            if due is None:
+                await self._wakeup.wait()
+                continue
+
+            delay = due - time.time()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                    continue  # Head moved earlier; recompute the sleep.
+                except asyncio.TimeoutError:
+                    pass
+            self._sleeping_until = float("-inf")
+
+            fired = self.pop_due()
+            if not fired:
+                continue
+            try:
+                await self._callback(fired)
+            except Exception:
+                logger.exception("Failed to deliver %d reminders", len(fired))
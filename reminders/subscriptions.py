@@ -0,0 +1,124 @@
+# reminders/subscriptions.py - Persistent reminder subscriptions
+"""
+Storage for per-user and per-channel reminder subscriptions.
+
+Subscriptions live in a small SQLite database (the stand-in for the
+project's Postgres/Supabase layer). Every public method is a coroutine
+that runs the query in a worker thread via :func:`asyncio.to_thread`,
+so database I/O never blocks the event loop.
+
+A subscription row has:
+
+* ``kind``       – ``"user"`` or ``"channel"``.
+* ``target_id``  – the user ID (``"user"``) or channel ID (``"channel"``).
+* ``channel_id`` – the channel reminders are delivered to. For user
+  subscriptions this is the channel the user subscribed from; the user
+  is mentioned there.
+* ``game``       – ``GAME_CONFIG`` key.
+* ``event_name`` – lower-cased substring an event title must contain,
+  or ``""`` to match every event of the game.
+"""
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+import threading
+from typing import Dict, Iterable, List, Tuple
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS subscriptions (
+    id          INTEGER PRIMARY KEY AUTOINCREMENT,
+    kind        TEXT    NOT NULL CHECK (kind IN ('user', 'channel')),
+    target_id   INTEGER NOT NULL,
+    channel_id  INTEGER NOT NULL,
+    game        TEXT    NOT NULL,
+    event_name  TEXT    NOT NULL DEFAULT '',
+    UNIQUE (kind, target_id, channel_id, game, event_name)
+);
+CREATE INDEX IF NOT EXISTS subscriptions_game ON subscriptions (game);
+CREATE INDEX IF NOT EXISTS subscriptions_target ON subscriptions (kind, target_id);
+"""
+
+
+def subscription_matches(subscription: Dict, game: str, title: str) -> bool:
+    """Return ``True`` if ``subscription`` covers the event ``title`` of ``game``."""
+    if subscription["game"] != game:
+        return False
+    return not subscription["event_name"] or subscription["event_name"] in title.lower()
+
+
+class SubscriptionStore:
+    """SQLite-backed subscription storage with async accessors.
+
+    Attributes:
+        path (str): Database file path, or ``":memory:"``.
+    """
+
+    def __init__(self, path: str = "subscriptions.db"):
+        """Open (and if needed create) the subscription database.
+
+        Args:
+            path (str): SQLite database path (default ``"subscriptions.db"``).
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._conn:
+            self._conn.executescript(_SCHEMA)
+
+    def _execute(self, sql: str, params: Iterable = ()) -> Tuple[List[Dict], int]:
+        with self._lock, self._conn:
+            cursor = self._conn.execute(sql, tuple(params))
+            return [dict(row) for row in cursor.fetchall()], cursor.rowcount
+
+    async def _run(self, sql: str, params: Iterable = ()) -> Tuple[List[Dict], int]:
+        return await asyncio.to_thread(self._execute, sql, params)
+
+    async def add(self, kind: str, target_id: int, channel_id: int, game: str, event_name: str = "") -> bool:
+        """Add a subscription.
+
+        Returns:
+            bool: ``True`` if it was added, ``False`` if it already existed.
+        """
+        _, rowcount = await self._run(
+            "INSERT OR IGNORE INTO subscriptions (kind, target_id, channel_id, game, event_name) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (kind, target_id, channel_id, game, event_name.strip().lower()),
+        )
+        return rowcount > 0
+
+    async def remove(self, kind: str, target_id: int, channel_id: int, game: str, event_name: str = "") -> bool:
+        """Remove a subscription.
+
+        Returns:
+            bool: ``True`` if a row was removed.
+        """
+        _, rowcount = await self._run(
+            "DELETE FROM subscriptions "
+            "WHERE kind = ? AND target_id = ? AND channel_id = ? AND game = ? AND event_name = ?",
+            (kind, target_id, channel_id, game, event_name.strip().lower()),
+        )
+        return rowcount > 0
+
+    async def list_for_target(self, kind: str, target_id: int) -> List[Dict]:
+        """Return every subscription owned by one user or channel."""
+        rows, _ = await self._run(
+            "SELECT * FROM subscriptions WHERE kind = ? AND target_id = ? ORDER BY game, event_name",
+            (kind, target_id),
+        )
+        return rows
+
+    async def for_games(self, games: Iterable[str]) -> List[Dict]:
+        """Return every subscription for any of ``games`` in a single query."""
+        games = sorted(set(games))
+        if not games:
+            return []
+        placeholders = ", ".join("?" for _ in games)
+        rows, _ = await self._run(f"SELECT * FROM subscriptions WHERE game IN ({placeholders})", games)
+        return rows
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,4 @@
+from .spans import RECENT_TRACES, Span, Trace, add_exporter, critical_path, current_span, span
+from .exporters import FileSpanExporter, OTLPHttpExporter, trace_to_otlp
+
+__all__ = ["RECENT_TRACES", "Span", "Trace", "add_exporter", "critical_path", "current_span", "span", "FileSpanExporter", "OTLPHttpExporter", "trace_to_otlp"]
@@ -0,0 +1,118 @@
+# tracing/exporters.py - Trace exporters
+"""
+Exporters for finished traces.
+
+Both exporters emit the OTLP/JSON trace encoding (``ExportTraceServiceRequest``),
+so a trace file can be replayed into any OpenTelemetry collector and the
+HTTP exporter can point at a real collector or a local stand-in.
+
+* :class:`FileSpanExporter`  – appends one OTLP/JSON document per trace
+  to a file (JSON lines).
+* :class:`OTLPHttpExporter` – POSTs each trace to ``<endpoint>/v1/traces``.
+
+Exporters are called from a worker thread (see :func:`tracing.span`),
+so they may block.
+"""
+from __future__ import annotations
+
+import json
+import threading
+import urllib.request
+from typing import Any, Dict, List
+
+from .spans import Trace
+
+SERVICE_NAME = "gacha-reminder"
+
+# OTLP status codes
+_STATUS_OK = 1
+_STATUS_ERROR = 2
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _otlp_attributes(attributes: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return [{"key": key, "value": _otlp_value(value)} for key, value in attributes.items()]
+
+
+def trace_to_otlp(trace: Trace, service_name: str = SERVICE_NAME) -> Dict[str, Any]:
+    """Encode ``trace`` as an OTLP/JSON ``ExportTraceServiceRequest``."""
+    spans = []
+    for finished in trace.spans:
+        encoded = {
+            "traceId": trace.trace_id,
+            "spanId": finished.span_id,
+            "name": finished.name,
+            "kind": 1,  # SPAN_KIND_INTERNAL
+            "startTimeUnixNano": str(finished.start_unix_ns),
+            "endTimeUnixNano": str(finished.end_unix_ns),
+            "attributes": _otlp_attributes(finished.attributes),
+            "status": (
+                {"code": _STATUS_ERROR, "message": finished.error}
+                if finished.error else {"code": _STATUS_OK}
+            ),
+        }
+        if finished.parent_id is not None:
+            encoded["parentSpanId"] = finished.parent_id
+        spans.append(encoded)
+
+    return {
+        "resourceSpans": [{
+            "resource": {"attributes": _otlp_attributes({"service.name": service_name})},
+            "scopeSpans": [{"scope": {"name": "gacha_reminder.tracing"}, "spans": spans}],
+        }]
+    }
+
+
+class FileSpanExporter:
+    """Append each trace as one line of OTLP/JSON to a file.
+
+    Attributes:
+        path (str): Output file path.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def export(self, trace: Trace) -> None:
+        line = json.dumps(trace_to_otlp(trace), separators=(",", ":"))
+        with self._lock, open(self.path, "a", encoding="utf-8") as fh:
+            fh.write(line + "\n")
+
+    def __repr__(self) -> str:
+        return f"FileSpanExporter({self.path!r})"
+
+
+class OTLPHttpExporter:
+    """POST each trace to an OTLP/HTTP collector using the JSON encoding.
+
+    Attributes:
+        endpoint (str): Collector base URL, e.g. ``"http://127.0.0.1:4318"``.
+        timeout (float): Request timeout in seconds.
+    """
+
+    def __init__(self, endpoint: str, timeout: float = 5.0):
+        self.endpoint = endpoint.rstrip("/")
+        self.timeout = timeout
+
+    def export(self, trace: Trace) -> None:
+        request = urllib.request.Request(
+            f"{self.endpoint}/v1/traces",
+            data=json.dumps(trace_to_otlp(trace)).encode("utf-8"),
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            response.read()
+
+    def __repr__(self) -> str:
+        return f"OTLPHttpExporter({self.endpoint!r})"
@@ -0,0 +1,217 @@
+# tracing/spans.py - Lightweight request tracing
+"""
+Nested timing spans propagated through ``asyncio`` via :mod:`contextvars`.
+
+:func:`span` opens a span as a child of the current one. Tasks created by
+``asyncio.gather`` / ``asyncio.create_task`` copy the current context, so
+spans opened inside concurrently fetched batches still attach to the
+span that started them. A span opened with no current span starts a new
+trace; when that root span ends, the whole trace is handed to every
+registered exporter (see :mod:`tracing.exporters`) and kept in
+:data:`RECENT_TRACES`.
+
+:func:`critical_path` walks a finished trace to find the chain of spans
+that determined its total duration.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Deque, Dict, Iterator, List, Optional, Protocol, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Number of finished traces kept in memory for inspection.
+RECENT_TRACE_LIMIT = 50
+
+# Wall-clock anchor for converting perf_counter_ns readings to Unix time.
+_WALL_ORIGIN_NS = time.time_ns()
+_PERF_ORIGIN_NS = time.perf_counter_ns()
+
+
+class Trace:
+    """Every span of one request, in the order they finished.
+
+    Attributes:
+        trace_id (str): 32 hex digit trace ID.
+        spans (List[Span]): Finished spans, root last.
+    """
+
+    def __init__(self):
+        self.trace_id = os.urandom(16).hex()
+        self.spans: List[Span] = []
+
+    @property
+    def root(self) -> Optional["Span"]:
+        """The root span, once the trace has finished."""
+        for finished in reversed(self.spans):
+            if finished.parent_id is None:
+                return finished
+        return None
+
+
+class Span:
+    """One timed operation within a :class:`Trace`.
+
+    Attributes:
+        name (str): Operation name, e.g. ``"wiki.content_batch"``.
+        trace (Trace): The trace this span belongs to.
+        span_id (str): 16 hex digit span ID.
+        parent_id (Optional[str]): Parent span ID, ``None`` for the root.
+        attributes (Dict[str, Any]): Free-form key/value annotations.
+        start_ns (int): :func:`time.perf_counter_ns` at start.
+        end_ns (Optional[int]): :func:`time.perf_counter_ns` at end.
+        error (Optional[str]): Exception that escaped the span, if any.
+    """
+
+    def __init__(self, name: str, trace: Trace, parent_id: Optional[str], attributes: Dict[str, Any]):
+        self.name = name
+        self.trace = trace
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = parent_id
+        self.attributes = attributes
+        self.start_ns = time.perf_counter_ns()
+        self.end_ns: Optional[int] = None
+        self.error: Optional[str] = None
+
+    def set(self, **attributes: Any) -> None:
+        """Add or overwrite attributes."""
+        self.attributes.update(attributes)
+
+    @property
+    def duration(self) -> float:
+        """Duration in seconds (up to now for an unfinished span)."""
+        end = self.end_ns if self.end_ns is not None else time.perf_counter_ns()
+        return (end - self.start_ns) / 1e9
+
+    @property
+    def start_unix_ns(self) -> int:
+        return _WALL_ORIGIN_NS + self.start_ns - _PERF_ORIGIN_NS
+
+    @property
+    def end_unix_ns(self) -> int:
+        return _WALL_ORIGIN_NS + (self.end_ns or self.start_ns) - _PERF_ORIGIN_NS
+
+    def label(self) -> str:
+        """Name plus the most identifying attributes, for display."""
+        details = ", ".join(f"{k}={v}" for k, v in self.attributes.items() if k in ("game", "page", "batch", "command"))
+        return f"{self.name} ({details})" if details else self.name
+
+
+class SpanExporter(Protocol):
+    def export(self, trace: Trace) -> None: ...
+
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+_exporters: List[SpanExporter] = []
+
+RECENT_TRACES: Deque[Trace] = deque(maxlen=RECENT_TRACE_LIMIT)
+
+
+def add_exporter(exporter: SpanExporter) -> None:
+    """Register an exporter called with every finished trace."""
+    _exporters.append(exporter)
+
+
+def current_span() -> Optional[Span]:
+    """Return the innermost open span in this context, if any."""
+    return _current_span.get()
+
+
+def _run_exporter(exporter: SpanExporter, trace: Trace) -> None:
+    try:
+        exporter.export(trace)
+    except Exception as exc:
+        logger.warning("Exporter %r failed: %s", exporter, exc)
+
+
+def _export(trace: Trace) -> None:
+    RECENT_TRACES.append(trace)
+    if not _exporters:
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+    for exporter in _exporters:
+        if loop is not None:
+            # Exporters do blocking file or network I/O; keep it off the event loop
+            loop.run_in_executor(None, _run_exporter, exporter, trace)
+        else:
+            _run_exporter(exporter, trace)
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Span]:
+    """Time a block as a span nested under the current one.
+
+    Args:
+        name (str): Operation name.
+        **attributes: Initial span attributes.
+
+    Yields:
+        Span: The open span; use :meth:`Span.set` to annotate it.
+    """
+    parent = _current_span.get()
+    trace = parent.trace if parent is not None else Trace()
+    current = Span(name, trace, parent.span_id if parent is not None else None, attributes)
+    token = _current_span.set(current)
+    try:
+        yield current
+    except BaseException as exc:
+        current.error = f"{type(exc).__name__}: {exc}"
+        raise
+    finally:
+        current.end_ns = time.perf_counter_ns()
+        _current_span.reset(token)
+        trace.spans.append(current)
+        if parent is None:
+            _export(trace)
+
+
+def critical_path(trace: Trace, root: Optional[Span] = None) -> List[Tuple[int, Span]]:
+    """Return the spans that determined ``root``'s duration, in start order.
+
+    Working backwards from the end of each span, the child that finished
+    last is on the critical path, then the child that finished last
+    before that one started, and so on; each chosen child is expanded
+    the same way. Concurrent siblings that finished earlier are off the
+    path.
+
+    Args:
+        trace (Trace): The trace to analyse. Only finished spans are used,
+            so this also works on a trace whose root is still open.
+        root (Optional[Span]): Span to start from (default: the trace root).
+
+    Returns:
+        List[Tuple[int, Span]]: ``(depth, span)`` pairs with the root at depth 0.
+    """
+    root = root or trace.root
+    if root is None:
+        return []
+
+    children: Dict[str, List[Span]] = {}
+    for finished in trace.spans:
+        if finished.parent_id is not None:
+            children.setdefault(finished.parent_id, []).append(finished)
+
+    path: List[Tuple[int, Span]] = []
+
+    def expand(parent: Span, depth: int) -> None:
+        path.append((depth, parent))
+        cursor = parent.end_ns if parent.end_ns is not None else time.perf_counter_ns()
+        chain: List[Span] = []
+        for child in sorted(children.get(parent.span_id, ()), key=lambda s: s.end_ns, reverse=True):
+            if child.end_ns <= cursor:
+                chain.append(child)
+                cursor = child.start_ns
+        for child in reversed(chain):
+            expand(child, depth + 1)
+
+    expand(root, 0)
+    return path
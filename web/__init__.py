@@ -0,0 +1,3 @@
+from .server import create_app, start_web_server
+
+__all__ = ["create_app", "start_web_server"]
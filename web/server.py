@@ -0,0 +1,240 @@
+# web/server.py - Local HTTP JSON API over the event snapshots
+"""
+Optional aiohttp web server exposing cached event data as JSON.
+
+Serves the in-memory :class:`api.snapshot.SnapshotStore` so other
+services can poll event lists without scraping Fandom or invoking slash
+commands. Responses carry an ``ETag`` and a ``Cache-Control`` header; a
+matching ``If-None-Match`` gets an empty ``304 Not Modified``. JSON
+ETags are weak: they hash the payload without ``fetched_at``, which moves
+on every wiki poll even when the events are unchanged.
+
+Routes:
+* ``GET /events``        — every configured game.
+* ``GET /events/{game}`` — one game by ``GAME_CONFIG`` key.
+* ``GET /calendar.ics``        — iCalendar feed of every game's events.
+* ``GET /calendar/{game}.ics`` — iCalendar feed of one game's events.
+* ``GET /metrics``       — pipeline stage metrics in Prometheus text format.
+
+Query parameters:
+* ``status`` — ``ongoing`` (default), ``upcoming``, ``ending_soon`` or ``all``.
+* ``hours``  — window for ``ending_soon`` in hours (default ``24``, at
+  most :data:`MAX_HOURS`).
+
+``time_remaining`` is left out of the JSON because it changes every
+minute; clients derive it from ``end_date``.
+
+The calendar feeds list every non-permanent event in the snapshot,
+regardless of ``status``. They are assembled from per-event blocks
+cached by :class:`api.ical.CalendarFeed`, so both the body and its ETag
+are only recomputed after a snapshot changes.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import math
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List
+
+from aiohttp import web
+
+from api.ical import CalendarFeed
+from api.filters import filter_ending_soon, filter_ongoing, filter_upcoming
+from api.serialization import event_to_dict
+from api.snapshot import SnapshotStore
+from metrics import REGISTRY
+
+logger = logging.getLogger(__name__)
+
+STORE_KEY = web.AppKey("store", SnapshotStore)
+MAX_AGE_KEY = web.AppKey("cache_max_age", int)
+CALENDAR_KEY = web.AppKey("calendar", CalendarFeed)
+
+STATUSES = ("ongoing", "upcoming", "ending_soon", "all")
+
+# Largest ``hours`` window accepted for ``ending_soon`` (one year).
+MAX_HOURS = 24 * 366
+
+
+def _select(events: List[Dict], status: str, hours: float, now: datetime) -> List[Dict]:
+    if status == "ongoing":
+        return filter_ongoing(events, now)
+    if status == "upcoming":
+        return filter_upcoming(events, now)
+    if status == "ending_soon":
+        return filter_ending_soon(events, timedelta(hours=hours), now)
+    return events
+
+
+def _parse_query(request: web.Request) -> tuple[str, float]:
+    status = request.query.get("status", "ongoing")
+    if status not in STATUSES:
+        raise web.HTTPBadRequest(
+            text=json.dumps({"error": f"status must be one of {', '.join(STATUSES)}"}),
+            content_type="application/json",
+        )
+    try:
+        hours = float(request.query.get("hours", "24"))
+    except ValueError:
+        hours = math.nan
+    if not (math.isfinite(hours) and 0 < hours <= MAX_HOURS):
+        raise web.HTTPBadRequest(
+            text=json.dumps({"error": f"hours must be a number greater than 0 and at most {MAX_HOURS}"}),
+            content_type="application/json",
+        )
+    return status, hours
+
+
+def _game_payload(store: SnapshotStore, snapshot: Dict, status: str, hours: float, now: datetime) -> Dict:
+    game = snapshot["game"]
+    events = _select(snapshot["events"], status, hours, now)
+    return {
+        "game": game,
+        "display_name": store.game_configs[game]["display_name"],
+        "version": snapshot["version"],
+        "events": [event_to_dict(e, countdown=False) for e in events],
+    }
+
+
+def _etag_matches(request: web.Request, etag: str) -> bool:
+    header = request.headers.get("If-None-Match")
+    if not header:
+        return False
+    # If-None-Match uses the weak comparison (RFC 9110 13.1.2).
+    candidates = [c.strip().removeprefix("W/") for c in header.split(",")]
+    return "*" in candidates or etag.removeprefix("W/") in candidates
+
+
+def _cached_response(request: web.Request, body: bytes, etag: str, content_type: str) -> web.Response:
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"public, max-age={request.app[MAX_AGE_KEY]}",
+    }
+    if _etag_matches(request, etag):
+        return web.Response(status=304, headers=headers)
+    return web.Response(body=body, content_type=content_type, charset="utf-8", headers=headers)
+
+
+def _with_fetched_at(payload: Dict, snapshot: Dict) -> Dict:
+    return {**payload, "fetched_at": snapshot["fetched_at"].isoformat()}
+
+
+def _json_response(request: web.Request, payload: Dict, validator: Dict) -> web.Response:
+    """Serve ``payload`` with a weak ETag hashed from ``validator``, the payload minus volatile fields."""
+    digest = hashlib.sha1(json.dumps(validator, ensure_ascii=False, sort_keys=True).encode("utf-8")).hexdigest()
+    body = json.dumps(payload, ensure_ascii=False, sort_keys=True).encode("utf-8")
+    return _cached_response(request, body, f'W/"{digest}"', "application/json")
+
+
+def _unknown_game(game: str) -> web.HTTPNotFound:
+    return web.HTTPNotFound(
+        text=json.dumps({"error": f"unknown game '{game}'"}),
+        content_type="application/json",
+    )
+
+
+async def handle_all_events(request: web.Request) -> web.Response:
+    """Serve events for every configured game."""
+    store = request.app[STORE_KEY]
+    status, hours = _parse_query(request)
+    now = datetime.now(timezone.utc)
+
+    snapshots = await store.get_all()
+    games = {
+        game: _game_payload(store, snapshot, status, hours, now)
+        for game, snapshot in snapshots.items()
+    }
+    payload = {
+        "status": status,
+        "games": {game: _with_fetched_at(games[game], snapshot) for game, snapshot in snapshots.items()},
+    }
+    return _json_response(request, payload, {"status": status, "games": games})
+
+
+async def handle_game_events(request: web.Request) -> web.Response:
+    """Serve events for the game named in the URL."""
+    store = request.app[STORE_KEY]
+    game = request.match_info["game"]
+    if game not in store.game_configs:
+        raise _unknown_game(game)
+    status, hours = _parse_query(request)
+    now = datetime.now(timezone.utc)
+
+    snapshot = await store.get(game)
+    validator = {"status": status, **_game_payload(store, snapshot, status, hours, now)}
+    return _json_response(request, _with_fetched_at(validator, snapshot), validator)
+
+
+async def handle_all_calendar(request: web.Request) -> web.Response:
+    """Serve the iCalendar feed of every configured game."""
+    calendar = request.app[CALENDAR_KEY]
+    for snapshot in (await request.app[STORE_KEY].get_all()).values():
+        calendar.sync(snapshot)
+    body, etag = calendar.combined()
+    return _cached_response(request, body, etag, "text/calendar")
+
+
+async def handle_game_calendar(request: web.Request) -> web.Response:
+    """Serve the iCalendar feed of the game named in the URL."""
+    store = request.app[STORE_KEY]
+    game = request.match_info["game"]
+    if game not in store.game_configs:
+        raise _unknown_game(game)
+    calendar = request.app[CALENDAR_KEY]
+    calendar.sync(await store.get(game))
+    body, etag = calendar.feed(game)
+    return _cached_response(request, body, etag, "text/calendar")
+
+
+async def handle_metrics(request: web.Request) -> web.Response:
+    """Serve process metrics in the Prometheus text exposition format."""
+    return web.Response(
+        text=REGISTRY.render_prometheus(),
+        content_type="text/plain",
+        charset="utf-8",
+        headers={"Cache-Control": "no-store"},
+    )
+
+
+def create_app(store: SnapshotStore, cache_max_age: int = 60) -> web.Application:
+    """Build the aiohttp application serving ``store``.
+
+    Args:
+        store (SnapshotStore): Snapshot store to read events from.
+        cache_max_age (int): ``max-age`` in seconds advertised in the
+            ``Cache-Control`` header (default ``60``).
+
+    Returns:
+        web.Application: The configured application.
+    """
+    app = web.Application()
+    app[STORE_KEY] = store
+    app[MAX_AGE_KEY] = cache_max_age
+    app[CALENDAR_KEY] = CalendarFeed(store.game_configs)
+    app.router.add_get("/events", handle_all_events)
+    app.router.add_get("/events/{game}", handle_game_events)
+    app.router.add_get("/calendar.ics", handle_all_calendar)
+    app.router.add_get("/calendar/{game}.ics", handle_game_calendar)
+    app.router.add_get("/metrics", handle_metrics)
+    return app
+
+
+async def start_web_server(
+    store: SnapshotStore,
+    host: str = "127.0.0.1",
+    port: int = 8080,
+    cache_max_age: int = 60,
+) -> web.AppRunner:
+    """Start serving ``store`` on ``host:port`` inside the running event loop.
+
+    Returns:
+        web.AppRunner: The runner; call :meth:`web.AppRunner.cleanup` to stop.
+    """
+    runner = web.AppRunner(create_app(store, cache_max_age))
+    await runner.setup()
+    site = web.TCPSite(runner, host, port)
+    await site.start()
+    logger.info("Serving event API on http://%s:%s", host, port)
+    return runner